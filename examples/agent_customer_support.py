@@ -4,7 +4,11 @@ Demonstrates the Agent Mode pattern — a single agent that dynamically
 decides whether to search a knowledge base, create a ticket, or escalate.
 """
 
+import logging
+import logging.handlers
 import os
+import queue
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -52,9 +56,21 @@ def create_ticket(subject: str, description: str, priority: str = "medium") -> s
 
 
 # --- Audit Hook ---
+# Hooks run inside the agent loop, so the audit log only enqueues records;
+# a listener thread formats and writes them.
+audit_queue = queue.SimpleQueue()
+audit_listener = logging.handlers.QueueListener(audit_queue, logging.StreamHandler())
+audit_listener.start()
+
+audit_logger = logging.getLogger("support.audit")
+audit_logger.setLevel(logging.INFO)
+audit_logger.addHandler(logging.handlers.QueueHandler(audit_queue))
+audit_logger.propagate = False
+
+
 def audit_tool_use(context: HookContext) -> HookResult:
     """Log every tool call for audit purposes."""
-    print(f"  [AUDIT] Tool: {context.tool_name}, Args: {context.tool_args}")
+    audit_logger.info("  [AUDIT] Tool: %s, Args: %s", context.tool_name, context.tool_args)
     return HookResult(allow=True)
 
 
@@ -93,3 +109,5 @@ result = agent.run("I was charged twice for my subscription last month")
 print(f"Agent: {result.content}\n")
 
 print(f"Total tool calls: {result.tool_calls_made}")
+
+audit_listener.stop()
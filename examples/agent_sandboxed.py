@@ -32,9 +32,16 @@ config = SandboxConfig(
 sandbox = DockerSandbox(config)
 
 
-# Create sandbox-aware tools
+# Create sandbox-aware tools; the container starts on first use
+def _ensure_sandbox() -> None:
+    if not sandbox.is_running():
+        print("Starting Docker sandbox...")
+        sandbox.start()
+
+
 def execute_python(code: str) -> str:
     """Execute Python code in the sandbox."""
+    _ensure_sandbox()
     sandbox.write_file("/workspace/script.py", code)
     result = sandbox.execute("python /workspace/script.py", timeout=30)
     if result.exit_code != 0:
@@ -44,6 +51,7 @@ def execute_python(code: str) -> str:
 
 def execute_shell(command: str) -> str:
     """Execute a shell command in the sandbox."""
+    _ensure_sandbox()
     result = sandbox.execute(command, timeout=30)
     output = result.stdout
     if result.stderr:
@@ -65,6 +73,8 @@ python_tool = ToolDefinition(
         },
         "required": ["code"],
     },
+    # Every call writes /workspace/script.py, so never run two at once
+    parallel_safe=False,
 )
 
 shell_tool = ToolDefinition(
@@ -81,6 +91,7 @@ shell_tool = ToolDefinition(
         },
         "required": ["command"],
     },
+    parallel_safe=False,
 )
 
 
@@ -101,18 +112,15 @@ agent = Agent(
 
 # --- Run with sandbox ---
 print("=== Sandboxed Agent Example ===\n")
-print("Starting Docker sandbox...")
 
 try:
-    sandbox.start()
-    print(f"Sandbox running: {sandbox.is_running()}\n")
-
     result = agent.run(
         "Calculate the first 20 Fibonacci numbers and find which ones are prime."
     )
     print(f"Agent: {result.content}")
     print(f"\nTurns: {result.turns}, Tool calls: {result.tool_calls_made}")
 finally:
-    print("\nStopping sandbox...")
-    sandbox.stop()
+    if sandbox.is_running():
+        print("\nStopping sandbox...")
+        sandbox.stop()
     print("Done.")
@@ -4,7 +4,11 @@ This demonstrates creating an agent with @tool decorated functions
 that the LLM can call dynamically during conversation.
 """
 
+import ast
+import operator
 import os
+from functools import lru_cache
+
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -25,16 +29,43 @@ def get_weather(city: str, units: str = "celsius") -> str:
     return f"Weather in {city}: 22{units[0].upper()}, partly cloudy"
 
 
+_BINARY_OPS = {
+    ast.Add: operator.add, ast.Sub: operator.sub, ast.Mult: operator.mul,
+    ast.Div: operator.truediv, ast.Pow: operator.pow,
+}
+_UNARY_OPS = {ast.USub: operator.neg, ast.UAdd: operator.pos}
+# Model-supplied input like 9**9**9**9 would otherwise never finish
+_MAX_EXPONENT = 100
+_MAX_BITS = 4096
+
+
+def _eval_node(node: ast.AST) -> float:
+    if isinstance(node, ast.Constant) and type(node.value) in (int, float):
+        return node.value
+    if isinstance(node, ast.UnaryOp) and type(node.op) in _UNARY_OPS:
+        return _UNARY_OPS[type(node.op)](_eval_node(node.operand))
+    if isinstance(node, ast.BinOp) and type(node.op) in _BINARY_OPS:
+        left, right = _eval_node(node.left), _eval_node(node.right)
+        if isinstance(node.op, ast.Pow) and abs(right) > _MAX_EXPONENT:
+            raise ValueError(f"Exponents above {_MAX_EXPONENT} are not allowed")
+        result = _BINARY_OPS[type(node.op)](left, right)
+        if isinstance(result, int) and result.bit_length() > _MAX_BITS:
+            raise ValueError("Result is too large")
+        return result
+    raise ValueError("Only basic math operations on numbers are allowed")
+
+
+@lru_cache(maxsize=512)
+def _safe_eval(expression: str) -> float:
+    """Evaluate basic arithmetic. Results are cached by expression string."""
+    return _eval_node(ast.parse(expression, mode="eval").body)
+
+
 @tool("calculate", "Perform a mathematical calculation")
 def calculate(expression: str) -> str:
     """Evaluate a math expression safely."""
     try:
-        # Only allow safe math operations
-        allowed = set("0123456789+-*/.() ")
-        if not all(c in allowed for c in expression):
-            return "Error: Only basic math operations are allowed"
-        result = eval(expression)
-        return str(result)
+        return str(_safe_eval(expression))
     except Exception as e:
         return f"Error: {e}"
 
@@ -7,6 +7,7 @@ load_dotenv()
 
 async def main():
     from meganova import AsyncMegaNova
+    from meganova.streaming import StreamPrinter
 
     api_key = os.getenv("MEGANOVA_API_KEY")
     if not api_key:
@@ -28,9 +29,9 @@ async def main():
             model="meganova-ai/manta-flash-1.0",
             stream=True,
         )
-        async for chunk in stream:
-            content = chunk.choices[0].delta.get("content", "")
-            print(content, end="", flush=True)
+        with StreamPrinter() as printer:
+            async for chunk in stream:
+                printer.write(chunk.choices[0].delta.get("content", ""))
         print()
 
 
@@ -1,5 +1,6 @@
 import os
-import base64
+import binascii
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 from meganova import MegaNova
 
@@ -12,6 +13,18 @@ if not api_key:
 
 client = MegaNova(api_key=api_key)
 
+B64_SLICE = 64 * 1024  # multiple of 4, so every slice decodes on its own
+
+
+def save_b64(b64: str, filename: str) -> int:
+    """Decode base64 in slices straight to disk; returns bytes written."""
+    written = 0
+    with open(filename, "wb") as f:
+        for start in range(0, len(b64), B64_SLICE):
+            written += f.write(binascii.a2b_base64(b64[start:start + B64_SLICE]))
+    return written
+
+
 print("--- Image Generation (OpenAI-compatible) ---")
 try:
     # Using OpenAI-style size parameter
@@ -25,15 +38,18 @@ try:
     print(f"Created: {response.created}")
     print(f"Images: {len(response.data)}")
 
-    for i, image in enumerate(response.data):
-        if image.b64_json:
-            image_bytes = base64.b64decode(image.b64_json)
-            filename = f"generated_{i}.png"
-            with open(filename, "wb") as f:
-                f.write(image_bytes)
-            print(f"  Saved: {filename} ({len(image_bytes):,} bytes)")
-        elif image.url:
-            print(f"  URL: {image.url}")
+    # Decode and write images concurrently
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        saves = []
+        for i, image in enumerate(response.data):
+            if image.b64_json:
+                filename = f"generated_{i}.png"
+                saves.append((filename, executor.submit(save_b64, image.b64_json, filename)))
+            elif image.url:
+                print(f"  URL: {image.url}")
+
+        for filename, future in saves:
+            print(f"  Saved: {filename} ({future.result():,} bytes)")
 
 except Exception as e:
     print(f"Error: {e}")
@@ -1,6 +1,7 @@
 import os
 from dotenv import load_dotenv
 from meganova import MegaNova
+from meganova.streaming import StreamPrinter
 
 load_dotenv()
 
@@ -25,11 +26,11 @@ try:
 
     print("\nResponse: ", end="", flush=True)
     
-    for chunk in response:
-        if chunk.choices and chunk.choices[0].delta:
-            content = chunk.choices[0].delta.get("content", "")
-            if content:
-                print(content, end="", flush=True)
+    # Print from a background thread so terminal writes never stall the stream
+    with StreamPrinter() as printer:
+        for chunk in response:
+            if chunk.choices and chunk.choices[0].delta:
+                printer.write(chunk.choices[0].delta.get("content", ""))
     
     print("\n\nStream finished.")
 
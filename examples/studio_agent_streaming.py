@@ -10,6 +10,7 @@ import os
 from dotenv import load_dotenv
 
 from meganova.cloud import CloudAgent
+from meganova.streaming import StreamPrinter
 
 load_dotenv()
 
@@ -35,13 +36,12 @@ print()
 # ── Streaming completions ──
 print("=== Streaming ===")
 print("Response: ", end="", flush=True)
-for chunk in agent.completions(
-    messages=[
-        {"role": "user", "content": "Write a haiku about AI assistants."}
-    ],
-    stream=True,
-):
-    content = chunk.choices[0].delta.content
-    if content:
-        print(content, end="", flush=True)
+with StreamPrinter() as printer:
+    for chunk in agent.completions(
+        messages=[
+            {"role": "user", "content": "Write a haiku about AI assistants."}
+        ],
+        stream=True,
+    ):
+        printer.write(chunk.choices[0].delta.content)
 print()
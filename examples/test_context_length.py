@@ -2,6 +2,7 @@ import os
 import sys
 from dotenv import load_dotenv
 from meganova import MegaNova, MeganovaError
+from meganova.batch import run_with_checkpoint
 import time
 
 load_dotenv()
@@ -14,20 +15,45 @@ if not api_key:
 
 client = MegaNova(api_key=api_key)
 
+MODELS_TTL = 300  # seconds
+_models_by_id = {}
+_models_fetched_at = None
+
 def get_model_context_length(model_id: str) -> int:
-    """Fetch the claimed context length from the API."""
+    """Fetch the claimed context length from the API (model list cached for MODELS_TTL)."""
+    global _models_by_id, _models_fetched_at
+    if _models_fetched_at is None or time.monotonic() - _models_fetched_at > MODELS_TTL:
+        try:
+            _models_by_id = {model.id: model for model in client.models.list()}
+            _models_fetched_at = time.monotonic()
+        except Exception as e:
+            print(f"Error fetching models: {e}")
+            return None
+    model = _models_by_id.get(model_id)
+    if model and model.context_length:
+        return model.context_length
+    return None
+
+def probe(model_id: str, prompt: str):
+    """Send one prompt. Returns ("ok", prompt_tokens), ("limit", error) or ("error", error)."""
     try:
-        models = client.models.list()
-        for model in models:
-            if model.id == model_id:
-                if model.context_length:
-                    return model.context_length
-                return None
+        response = client.chat.completions.create(
+            messages=[{"role": "user", "content": prompt}],
+            model=model_id,
+            max_tokens=1, # Only prompt_tokens matters; keep generation minimal
+            temperature=0.0,
+        )
+        return "ok", response.usage.prompt_tokens
+    except MeganovaError as e:
+        err_str = str(e).lower()
+        if "context" in err_str or "length" in err_str or "too long" in err_str or "400" in err_str or "500" in err_str or "internal server" in err_str:
+            return "limit", str(e)
+        return "error", str(e)
     except Exception as e:
-        print(f"Error fetching models: {e}")
-    return None
+        return "error", str(e)
 
-def test_context_length(model_id: str, start_tokens=1000, max_target=None):
+def test_context_length(model_id: str, start_tokens=1000, max_target=None, parallel=3,
+                        checkpoint="ctx_probe.jsonl"):
     print(f"\nTesting context length for model: {model_id}")
     
     if max_target is None:
@@ -39,7 +65,8 @@ def test_context_length(model_id: str, start_tokens=1000, max_target=None):
             print("Could not determine claimed context length. Defaulting to 128k check.")
             max_target = 132000 # Go slightly above 128k
             
-    # Binary search setup
+    # Search setup: after galloping, each round probes `parallel` evenly spaced
+    # sizes at once, narrowing the range to (parallel + 1)x smaller per round trip.
     low = start_tokens
     high = max_target + 1000 # overshoot slightly
     max_success = 0
@@ -47,44 +74,79 @@ def test_context_length(model_id: str, start_tokens=1000, max_target=None):
     # We use a simple word "the " which is 4 chars. 
     # This is reliably 1 token in many tokenizers.
     token_word = "the "
+    # Build the largest prompt once; each probe takes a slice of it.
+    full_prompt = token_word * high
     
-    print(f"Starting binary search between {low} and {high} estimated tokens...")
+    # Probe outcomes are checkpointed, so an interrupted run replays the
+    # finished rounds from the file and resumes where it stopped. Unexpected
+    # (possibly transient) errors are not recorded and get retried.
+    def checked_probe(size):
+        status, value = probe(model_id, full_prompt[:size * len(token_word)])
+        if status == "error":
+            raise RuntimeError(value)
+        return [status, value]
+
+    def report(size, results):
+        """Print a probe outcome; returns True on success, None on unexpected error."""
+        nonlocal max_success
+        key = f"{model_id}:{size}"
+        if key in results.errors:
+            print(f"  {size}: Failed with unexpected error: {results.errors[key]}")
+            return None
+        status, value = results[key]
+        if status == "ok":
+            print(f"  {size}: Success! (Used: {value})")
+            max_success = max(max_success, value)
+            return True
+        print(f"  {size}: Failed. (Context limit reached or capacity error)")
+        print(f"  Error details: {value}")
+        return False
+
+    # Gallop first (start, 2x, 4x, ...) so early probes stay small, then
+    # search only the bracket between the last success and first failure.
+    print(f"Galloping from {low} up to {high} estimated tokens...")
+    size = low
+    low = 0
+    while True:
+        size = min(size, high)
+        print(f"Testing approx {size} tokens...")
+        ok = report(size, run_with_checkpoint([(f"{model_id}:{size}", size)], checkpoint, checked_probe))
+        if ok is None:
+            high = low - 1 # Stop searching
+            break
+        if not ok:
+            high = size - 1
+            break
+        low = size + 1
+        if size >= high:
+            break
+        size *= 2
+        time.sleep(0.1) # Small delay to avoid rate limits
+
+    print(f"Starting {parallel}-way search between {low} and {high} estimated tokens...")
     
     while low <= high:
-        mid = (low + high) // 2
-        
-        # Construct prompt
-        prompt = token_word * mid
-        
-        try:
-            print(f"Testing approx {mid} tokens...", end="", flush=True)
-            response = client.chat.completions.create(
-                messages=[{"role": "user", "content": prompt}],
-                model=model_id,
-                max_tokens=10, # Small max_tokens for quick response, not relevant for context test
-                temperature=0.0,
-            )
-            # If successful, get the actual used tokens
-            actual_tokens = response.usage.prompt_tokens
-            print(f" Success! (Used: {actual_tokens})")
-            
-            max_success = max(max_success, actual_tokens)
-            low = mid + 1 # Move up
-            time.sleep(0.1) # Small delay to avoid rate limits
-            
-        except MeganovaError as e:
-            err_str = str(e).lower()
-            if "context" in err_str or "length" in err_str or "too long" in err_str or "400" in err_str or "500" in err_str or "internal server" in err_str:
-                print(f" Failed. (Context limit reached or capacity error)")
-                print(f"  Error details: {e}")
-                high = mid - 1 # Move down
+        step = (high - low + 1) / (parallel + 1)
+        sizes = sorted({low + int(step * (k + 1)) for k in range(parallel)})
+        print(f"Testing approx {', '.join(map(str, sizes))} tokens...")
+        results = run_with_checkpoint(
+            [(f"{model_id}:{size}", size) for size in sizes],
+            checkpoint, checked_probe, max_workers=parallel,
+        )
+
+        # Results are monotonic: successes below, failures above
+        for size in sizes:
+            ok = report(size, results)
+            if ok is None:
+                high = low - 1 # Stop searching
+                break
+            if ok:
+                low = size + 1 # Move up
             else:
-                print(f" Failed with unexpected error: {e}")
+                high = size - 1 # Move down
                 break
-        except Exception as e:
-            print(f" Failed with unexpected error: {e}")
-            break
-            
+        time.sleep(0.1) # Small delay to avoid rate limits
+        
     print(f"\n--- Result ---")
     print(f"Model: {model_id}")
     print(f"Max confirmed context: {max_success} tokens")
@@ -1,12 +1,23 @@
+import importlib
+from typing import Any
+
 from .client import MegaNova
-from .async_client import AsyncMegaNova
 from .errors import MeganovaError
-from .models.serverless import ServerlessModel, ServerlessModelsResponse
-from .models.images import GeneratedImage, ImageGenerationResponse
-from .models.audio import TranscriptionResponse
-from .models.embeddings import EmbeddingResponse, Embedding
-from .models.videos import VideoGeneration
-from .cloud import CloudAgent
+
+# Loaded on first attribute access (PEP 562) so `import meganova` only pays
+# for the sync client.
+_LAZY = {
+    "AsyncMegaNova": ".async_client",
+    "CloudAgent": ".cloud",
+    "ServerlessModel": ".models.serverless",
+    "ServerlessModelsResponse": ".models.serverless",
+    "GeneratedImage": ".models.images",
+    "ImageGenerationResponse": ".models.images",
+    "TranscriptionResponse": ".models.audio",
+    "EmbeddingResponse": ".models.embeddings",
+    "Embedding": ".models.embeddings",
+    "VideoGeneration": ".models.videos",
+}
 
 __all__ = [
     "MegaNova",
@@ -22,3 +33,15 @@ __all__ = [
     "Embedding",
     "VideoGeneration",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,30 @@
+"""JSON encoding and decoding with an optional orjson fast path.
+
+Tool-call arguments and streamed SSE chunks are decoded once per event, so
+the parser shows up on hot paths. ``pip install meganova[fast]`` installs
+orjson; without it the stdlib ``json`` module is used.
+"""
+
+import json
+from typing import Any, Union
+
+JSONDecodeError = json.JSONDecodeError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse JSON text; raises ``JSONDecodeError`` (orjson's is a subclass)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact UTF-8 JSON, byte-identical with or without orjson."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
@@ -0,0 +1,107 @@
+"""Streaming multipart/form-data bodies for file uploads.
+
+``requests`` builds ``files=`` uploads fully in memory before sending.
+MultipartStream instead yields the body in fixed-size chunks straight from the
+file objects, and reports its total length so a Content-Length header is sent
+rather than chunked encoding.
+"""
+
+import io
+import os
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+CHUNK_SIZE = 64 * 1024
+
+_Part = Tuple[bytes, Union[bytes, Any], int, int]
+
+
+def _file_size(fileobj: Any) -> Optional[int]:
+    """Bytes left from the current position, or None if not seekable."""
+    try:
+        start = fileobj.tell()
+        try:
+            return os.fstat(fileobj.fileno()).st_size - start
+        except (AttributeError, OSError, io.UnsupportedOperation):
+            end = fileobj.seek(0, os.SEEK_END)
+            fileobj.seek(start)
+            return end - start
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return None
+
+
+class MultipartStream:
+    """Re-iterable multipart body; each iteration rewinds the files.
+
+    Use ``MultipartStream.build(data, files)``, which returns None when a file
+    object can't be sized (the caller should fall back to ``files=``).
+    """
+
+    def __init__(self, parts: List[_Part], boundary: str):
+        self._parts = parts
+        self.boundary = boundary
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._closing = f"--{boundary}--\r\n".encode()
+
+    @classmethod
+    def build(
+        cls,
+        data: Optional[Dict[str, Any]],
+        files: Dict[str, Any],
+    ) -> Optional["MultipartStream"]:
+        boundary = uuid.uuid4().hex
+        parts: List[_Part] = []
+
+        for name, value in (data or {}).items():
+            header = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"\r\n\r\n'
+            ).encode()
+            body = str(value).encode()
+            parts.append((header, body, 0, len(body)))
+
+        for name, value in files.items():
+            if isinstance(value, tuple):
+                filename, content = value[0], value[1]
+                content_type = value[2] if len(value) > 2 else "application/octet-stream"
+            else:
+                filename = os.path.basename(getattr(value, "name", name))
+                content, content_type = value, "application/octet-stream"
+
+            header = (
+                f"--{boundary}\r\n"
+                f'Content-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+                f"Content-Type: {content_type}\r\n\r\n"
+            ).encode()
+            if isinstance(content, (bytes, bytearray)):
+                parts.append((header, bytes(content), 0, len(content)))
+                continue
+            size = _file_size(content)
+            if size is None:
+                return None
+            parts.append((header, content, content.tell(), size))
+
+        return cls(parts, boundary)
+
+    def __len__(self) -> int:
+        total = len(self._closing)
+        for header, _, _, size in self._parts:
+            total += len(header) + size + 2
+        return total
+
+    def __iter__(self) -> Iterator[bytes]:
+        for header, content, start, size in self._parts:
+            yield header
+            if isinstance(content, bytes):
+                yield content
+            else:
+                content.seek(start)
+                remaining = size
+                while remaining > 0:
+                    chunk = content.read(min(CHUNK_SIZE, remaining))
+                    if not chunk:
+                        break
+                    remaining -= len(chunk)
+                    yield chunk
+            yield b"\r\n"
+        yield self._closing
@@ -0,0 +1,37 @@
+"""Retry timing shared by the HTTP transports.
+
+Backoff is ``RETRY_BASE_DELAY * 2**attempt`` capped at ``RETRY_MAX_DELAY``,
+plus up to ``RETRY_BASE_DELAY`` of random jitter so clients that failed
+together do not retry in lockstep. 429 and 503 responses are retried after
+their ``Retry-After`` delay when the server sends one.
+"""
+
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Optional
+
+RETRY_BASE_DELAY = 1.0
+RETRY_MAX_DELAY = 30.0
+RETRY_STATUSES = (429, 503)
+
+
+def retry_after(response: Any) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff(attempt: int, retry_after: Optional[float] = None) -> float:
+    """Seconds to sleep before retry number ``attempt`` (0-based)."""
+    delay = retry_after if retry_after is not None else RETRY_BASE_DELAY * 2 ** attempt
+    return min(delay, RETRY_MAX_DELAY) + random.uniform(0, RETRY_BASE_DELAY)
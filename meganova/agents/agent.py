@@ -7,18 +7,37 @@ The agent loop:
 4. Repeat until final text response or max_turns
 """
 
+import asyncio
+import concurrent.futures
+import hashlib
 import json
+import os
 import time
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Iterator, List, Optional, Union
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
 
+from ..async_client import AsyncMegaNova
+from .. import _json
+from ..cache import SemanticChatCache
 from ..client import MegaNova
-from ..models.chat import ChatResponse
+from ..models.chat import ChatMessage, ChatResponse, ChatStreamChunk, FunctionCall, ToolCall
 from .hooks import Hook, HookContext, HookManager, HookResult, HookType
 from .memory import Memory, MessageMemory
 from .tools.base import ToolDefinition, ToolRegistry
 
 
+def _async_client_from(client: MegaNova) -> AsyncMegaNova:
+    """Create an async client with the same settings as a sync client."""
+    transport = client._transport
+    return AsyncMegaNova(
+        api_key=transport.api_key,
+        base_url=transport.base_url,
+        timeout=transport.timeout,
+        max_retries=transport.max_retries,
+        max_connections=transport.max_connections,
+    )
+
+
 @dataclass
 class AgentResult:
     """Result from running an agent."""
@@ -65,6 +84,12 @@ class Agent:
 
         result = agent.run("Find information about Python")
         print(result.content)
+
+    Pass ``cache=SemanticChatCache(client, embed)`` to serve repeated or
+    near-duplicate turns from a local cache instead of calling the model.
+    ``prompt_cache=True`` adds a ``prompt_cache_key`` field to each request so
+    providers that support it can reuse the cached system/tools prefix; it is
+    off by default since strict OpenAI-compatible backends may reject it.
     """
 
     def __init__(
@@ -80,8 +105,15 @@ class Agent:
         max_tokens: Optional[int] = None,
         name: str = "agent",
         metadata: Optional[Dict[str, Any]] = None,
+        tool_concurrency: Optional[int] = None,
+        cache: Optional[SemanticChatCache] = None,
+        prompt_cache: bool = False,
     ):
         self.client = client
+        self.cache = cache
+        # Send a prompt_cache_key so the provider can reuse the system prefix
+        self.prompt_cache = prompt_cache
+        self._prompt_cache_key: Optional[Tuple[str, Any, str]] = None
         self.model = model
         self.system_prompt = system_prompt
         self.max_turns = max_turns
@@ -89,6 +121,10 @@ class Agent:
         self.max_tokens = max_tokens
         self.name = name
         self.metadata = metadata or {}
+        # Max tool calls from a single turn executed concurrently
+        if tool_concurrency is None:
+            tool_concurrency = int(os.getenv("TOOL_CONCURRENCY_LIMIT", "8"))
+        self.tool_concurrency = tool_concurrency
 
         # Set up tool registry
         self._registry = ToolRegistry()
@@ -144,41 +180,18 @@ class Agent:
         tool_calls_made = 0
 
         for turn in range(self.max_turns):
-            # Pre-model-call hook
-            hook_ctx = HookContext(
-                agent_name=self.name,
-                turn=turn,
-                messages=messages,
-            )
-            hook_result = self._hooks.run(HookType.PRE_MODEL_CALL, hook_ctx)
-            if hook_result.modified_messages:
-                messages = hook_result.modified_messages
+            messages = self._pre_model_call(turn, messages)
 
             # Call the LLM
             try:
                 response = self._call_llm(messages)
             except Exception as e:
-                self._hooks.run(
-                    HookType.ON_ERROR,
-                    HookContext(agent_name=self.name, turn=turn, error=e),
-                )
-                return AgentResult(
-                    content=f"Error: {e}",
-                    turns=turn + 1,
-                    total_tokens=total_tokens,
-                    tool_calls_made=tool_calls_made,
-                    messages=messages,
-                    model=self.model,
-                    stop_reason="error",
+                return self._error_result(
+                    e, turn, messages, total_tokens, tool_calls_made
                 )
 
             # Post-model-call hook
-            self._hooks.run(
-                HookType.POST_MODEL_CALL,
-                HookContext(
-                    agent_name=self.name, turn=turn, response=response
-                ),
-            )
+            self._post_model_call(turn, response)
 
             # Track token usage
             if response.usage:
@@ -193,83 +206,272 @@ class Agent:
 
             # Check if LLM wants to call tools
             if choice.finish_reason == "tool_calls" or assistant_msg.tool_calls:
-                for tc in assistant_msg.tool_calls or []:
-                    tool_calls_made += 1
-
-                    # Parse tool arguments
-                    try:
-                        args = json.loads(tc.function.arguments)
-                    except json.JSONDecodeError:
-                        args = {}
-
-                    # Pre-tool-use hook
-                    pre_hook = self._hooks.run(
-                        HookType.PRE_TOOL_USE,
-                        HookContext(
-                            agent_name=self.name,
-                            turn=turn,
-                            tool_name=tc.function.name,
-                            tool_args=args,
-                        ),
-                    )
-                    if not pre_hook.allow:
-                        # Hook denied tool execution
-                        tool_result = f"Tool execution denied: {pre_hook.reason or 'blocked by hook'}"
-                    else:
-                        if pre_hook.modified_args:
-                            args = pre_hook.modified_args
-                        tool_result = self._execute_tool(tc.function.name, args)
-
-                    # Post-tool-use hook
-                    self._hooks.run(
-                        HookType.POST_TOOL_USE,
-                        HookContext(
-                            agent_name=self.name,
-                            turn=turn,
-                            tool_name=tc.function.name,
-                            tool_args=args,
-                            tool_result=tool_result,
-                        ),
-                    )
-
-                    # Add tool result to messages
-                    messages.append(
-                        {
-                            "role": "tool",
-                            "content": str(tool_result),
-                            "tool_call_id": tc.id,
-                        }
-                    )
-
+                tool_calls_made += self._handle_tool_calls(
+                    turn, assistant_msg.tool_calls or [], messages
+                )
                 continue  # LLM gets another turn
 
             # LLM is done — return final response
-            content = assistant_msg.content or ""
+            return self._complete(
+                assistant_msg.content or "",
+                turn, messages, total_tokens, tool_calls_made,
+            )
+
+        return self._max_turns_result(messages, total_tokens, tool_calls_made)
+
+    async def arun(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        *,
+        client: Optional[AsyncMegaNova] = None,
+    ) -> AgentResult:
+        """Run the agent loop asynchronously.
+
+        LLM calls go through an ``AsyncMegaNova`` client so many agents can
+        share one connection pool on a single event loop. ``async def`` tools
+        are awaited on the loop; other tools run on worker threads.
+
+        Args:
+            prompt: The user's message/task.
+            context: Optional additional context to prepend.
+            client: Async client to use. If omitted, a temporary one is
+                created from this agent's client settings and closed after
+                the run.
+
+        Returns:
+            AgentResult with the final response.
+        """
+        if client is not None:
+            return await self._run_async(prompt, context, client)
+
+        async with _async_client_from(self.client) as owned:
+            return await self._run_async(prompt, context, owned)
+
+    async def _run_async(
+        self, prompt: str, context: Optional[str], client: AsyncMegaNova
+    ) -> AgentResult:
+        """Execute the agent loop on an async client."""
+        messages = self._build_initial_messages(prompt, context)
+
+        total_tokens = 0
+        tool_calls_made = 0
 
-            # Store in memory
-            for msg in messages:
-                self.memory.add(msg)
+        for turn in range(self.max_turns):
+            messages = self._pre_model_call(turn, messages)
+
+            try:
+                response = await self._acall_llm(client, messages)
+            except Exception as e:
+                return self._error_result(
+                    e, turn, messages, total_tokens, tool_calls_made
+                )
+
+            self._post_model_call(turn, response)
+
+            if response.usage:
+                total_tokens += response.usage.total_tokens
+
+            choice = response.choices[0]
+            assistant_msg = choice.message
+            messages.append(self._message_to_dict(assistant_msg))
+
+            if choice.finish_reason == "tool_calls" or assistant_msg.tool_calls:
+                tool_calls_made += await self._ahandle_tool_calls(
+                    turn, assistant_msg.tool_calls or [], messages
+                )
+                continue
+
+            return self._complete(
+                assistant_msg.content or "",
+                turn, messages, total_tokens, tool_calls_made,
+            )
+
+        return self._max_turns_result(messages, total_tokens, tool_calls_made)
+
+    def _pre_model_call(
+        self, turn: int, messages: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """Run pre-model-call hooks, returning the (possibly replaced) messages."""
+        if not self._hooks.has_hooks(HookType.PRE_MODEL_CALL):
+            return messages
+        hook_ctx = HookContext(
+            agent_name=self.name,
+            turn=turn,
+            messages=messages,
+        )
+        hook_result = self._hooks.run(HookType.PRE_MODEL_CALL, hook_ctx)
+        if hook_result.modified_messages:
+            return hook_result.modified_messages
+        return messages
+
+    def _post_model_call(self, turn: int, response: ChatResponse) -> None:
+        if not self._hooks.has_hooks(HookType.POST_MODEL_CALL):
+            return
+        self._hooks.run(
+            HookType.POST_MODEL_CALL,
+            HookContext(
+                agent_name=self.name, turn=turn, response=response
+            ),
+        )
+
+    def _handle_tool_calls(
+        self, turn: int, tool_calls: List[Any], messages: List[Dict[str, Any]]
+    ) -> int:
+        """Run hooks and tools for one turn's tool calls.
+
+        Appends a tool message per call to ``messages`` (in call order) and
+        returns the number of calls handled.
+        """
+        calls = self._pre_tool_use(turn, tool_calls)
+        # Execute the allowed calls (concurrently when safe)
+        outputs = self._execute_tools(
+            [(tc.function.name, args) for tc, args, denied in calls if denied is None]
+        )
+        self._post_tool_use(turn, calls, outputs, messages)
+        return len(calls)
+
+    async def _ahandle_tool_calls(
+        self, turn: int, tool_calls: List[Any], messages: List[Dict[str, Any]]
+    ) -> int:
+        """Async counterpart of ``_handle_tool_calls``."""
+        calls = self._pre_tool_use(turn, tool_calls)
+        outputs = await self._aexecute_tools(
+            [(tc.function.name, args) for tc, args, denied in calls if denied is None]
+        )
+        self._post_tool_use(turn, calls, outputs, messages)
+        return len(calls)
 
-            self._hooks.run(
-                HookType.ON_COMPLETE,
+    def _pre_tool_use(
+        self, turn: int, tool_calls: List[Any]
+    ) -> List[Tuple[Any, Dict[str, Any], Optional[str]]]:
+        """Run pre-tool-use hooks in order, before any tool executes.
+
+        Returns ``(tool_call, args, denied_message)`` per call; the message is
+        None for calls that may run.
+        """
+        calls: List[Tuple[Any, Dict[str, Any], Optional[str]]] = []
+        if not self._hooks.has_hooks(HookType.PRE_TOOL_USE):
+            return [
+                (tc, self._parse_tool_args(tc.function.arguments), None)
+                for tc in tool_calls
+            ]
+        for tc in tool_calls:
+            args = self._parse_tool_args(tc.function.arguments)
+
+            pre_hook = self._hooks.run(
+                HookType.PRE_TOOL_USE,
                 HookContext(
                     agent_name=self.name,
                     turn=turn,
-                    response=content,
+                    tool_name=tc.function.name,
+                    tool_args=args,
                 ),
             )
+            if not pre_hook.allow:
+                # Hook denied tool execution
+                denied = f"Tool execution denied: {pre_hook.reason or 'blocked by hook'}"
+                calls.append((tc, args, denied))
+            else:
+                if pre_hook.modified_args:
+                    args = pre_hook.modified_args
+                calls.append((tc, args, None))
+        return calls
+
+    def _post_tool_use(
+        self,
+        turn: int,
+        calls: List[Tuple[Any, Dict[str, Any], Optional[str]]],
+        outputs: List[str],
+        messages: List[Dict[str, Any]],
+    ) -> None:
+        """Run post-tool-use hooks and append tool messages, in call order."""
+        results = iter(outputs)
+        post_hooks = self._hooks.has_hooks(HookType.POST_TOOL_USE)
+        for tc, args, denied in calls:
+            tool_result = denied if denied is not None else next(results)
+
+            # Post-tool-use hook
+            if post_hooks:
+                self._hooks.run(
+                    HookType.POST_TOOL_USE,
+                    HookContext(
+                        agent_name=self.name,
+                        turn=turn,
+                        tool_name=tc.function.name,
+                        tool_args=args,
+                        tool_result=tool_result,
+                    ),
+                )
 
-            return AgentResult(
-                content=content,
-                turns=turn + 1,
-                total_tokens=total_tokens,
-                tool_calls_made=tool_calls_made,
-                messages=messages,
-                model=self.model,
-                stop_reason="complete",
+            # Add tool result to messages
+            messages.append(
+                {
+                    "role": "tool",
+                    "content": str(tool_result),
+                    "tool_call_id": tc.id,
+                }
             )
 
-        # Max turns reached
+    def _complete(
+        self,
+        content: str,
+        turn: int,
+        messages: List[Dict[str, Any]],
+        total_tokens: int,
+        tool_calls_made: int,
+    ) -> AgentResult:
+        """Store the conversation and build the final result."""
+        # Store in memory
+        self.memory.extend(messages)
+
+        self._hooks.run(
+            HookType.ON_COMPLETE,
+            HookContext(
+                agent_name=self.name,
+                turn=turn,
+                response=content,
+            ),
+        )
+
+        return AgentResult(
+            content=content,
+            turns=turn + 1,
+            total_tokens=total_tokens,
+            tool_calls_made=tool_calls_made,
+            messages=messages,
+            model=self.model,
+            stop_reason="complete",
+        )
+
+    def _error_result(
+        self,
+        error: Exception,
+        turn: int,
+        messages: List[Dict[str, Any]],
+        total_tokens: int,
+        tool_calls_made: int,
+    ) -> AgentResult:
+        self._hooks.run(
+            HookType.ON_ERROR,
+            HookContext(agent_name=self.name, turn=turn, error=error),
+        )
+        return AgentResult(
+            content=f"Error: {error}",
+            turns=turn + 1,
+            total_tokens=total_tokens,
+            tool_calls_made=tool_calls_made,
+            messages=messages,
+            model=self.model,
+            stop_reason="error",
+        )
+
+    def _max_turns_result(
+        self,
+        messages: List[Dict[str, Any]],
+        total_tokens: int,
+        tool_calls_made: int,
+    ) -> AgentResult:
         last_content = ""
         for msg in reversed(messages):
             if msg.get("role") == "assistant" and msg.get("content"):
@@ -289,43 +491,105 @@ class Agent:
     def _run_streaming(
         self, prompt: str, context: Optional[str] = None
     ) -> Iterator[AgentTurnEvent]:
-        """Execute the agent loop with streaming events."""
+        """Execute the agent loop with streaming events.
+
+        Model output is streamed: text arrives as ``text`` events per delta,
+        and each tool call starts executing as soon as its arguments are
+        complete, while the model is still generating the rest of the turn.
+        """
         messages = self._build_initial_messages(prompt, context)
         total_tokens = 0
 
         for turn in range(self.max_turns):
-            try:
-                response = self._call_llm(messages)
-            except Exception as e:
-                yield AgentTurnEvent(
-                    type="error", content=str(e), turn=turn
-                )
-                return
-
-            if response.usage:
-                total_tokens += response.usage.total_tokens
-
-            choice = response.choices[0]
-            assistant_msg = choice.message
-            msg_dict = self._message_to_dict(assistant_msg)
-            messages.append(msg_dict)
-
-            if choice.finish_reason == "tool_calls" or assistant_msg.tool_calls:
-                for tc in assistant_msg.tool_calls or []:
-                    try:
-                        args = json.loads(tc.function.arguments)
-                    except json.JSONDecodeError:
-                        args = {}
-
+            content_parts: List[str] = []
+            calls: List[ToolCall] = []
+            futures: List[Optional[concurrent.futures.Future]] = []
+            executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+
+            def dispatch_complete() -> Iterator[AgentTurnEvent]:
+                """Start every accumulated call that hasn't been started yet."""
+                nonlocal executor
+                for tc in calls[len(futures):]:
+                    args = self._parse_tool_args(tc.function.arguments)
                     yield AgentTurnEvent(
                         type="tool_call",
                         tool_name=tc.function.name,
                         tool_args=args,
                         turn=turn,
                     )
+                    if (
+                        self.tool_concurrency < 2
+                        or None in futures
+                        or not self._is_parallel_safe(tc.function.name)
+                    ):
+                        # Run after the stream, in order; once an unsafe call
+                        # shows up, every later call waits behind it too
+                        futures.append(None)
+                        continue
+                    if executor is None:
+                        executor = concurrent.futures.ThreadPoolExecutor(
+                            max_workers=self.tool_concurrency
+                        )
+                    futures.append(
+                        executor.submit(self._execute_tool, tc.function.name, args)
+                    )
 
-                    result = self._execute_tool(tc.function.name, args)
-
+            try:
+                for chunk in self._call_llm_stream(messages):
+                    if chunk.usage:
+                        total_tokens += chunk.usage.total_tokens
+                    if not chunk.choices:
+                        continue
+                    delta = chunk.choices[0].delta
+
+                    text = delta.get("content")
+                    if text:
+                        content_parts.append(text)
+                        yield AgentTurnEvent(type="text", content=text, turn=turn)
+
+                    for tc_delta in delta.get("tool_calls") or []:
+                        index = tc_delta.get("index")
+                        if index is None:
+                            # No index: an id starts a new call, anything else
+                            # continues the open one (or starts the first)
+                            new = tc_delta.get("id") or not calls
+                            index = len(calls) if new else len(calls) - 1
+                        if index >= len(calls):
+                            # A new call started, so every earlier one is complete
+                            yield from dispatch_complete()
+                            while len(calls) <= index:
+                                calls.append(ToolCall(
+                                    id="", function=FunctionCall(name="", arguments="")
+                                ))
+                        call = calls[index]
+                        if tc_delta.get("id"):
+                            call.id = tc_delta["id"]
+                        function = tc_delta.get("function") or {}
+                        call.function.name += function.get("name") or ""
+                        call.function.arguments += function.get("arguments") or ""
+
+                yield from dispatch_complete()
+                results = [f.result() if f is not None else None for f in futures]
+            except Exception as e:
+                yield AgentTurnEvent(
+                    type="error", content=str(e), turn=turn
+                )
+                return
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=True)
+
+            content = "".join(content_parts)
+            messages.append(self._message_to_dict(ChatMessage(
+                role="assistant", content=content or None, tool_calls=calls or None,
+            )))
+
+            if calls:
+                for tc, result in zip(calls, results):
+                    if result is None:
+                        result = self._execute_tool(
+                            tc.function.name, self._parse_tool_args(tc.function.arguments)
+                        )
                     yield AgentTurnEvent(
                         type="tool_result",
                         content=str(result),
@@ -342,8 +606,6 @@ class Agent:
                     )
                 continue
 
-            content = assistant_msg.content or ""
-            yield AgentTurnEvent(type="text", content=content, turn=turn)
             yield AgentTurnEvent(type="done", content=content, turn=turn)
             return
 
@@ -357,19 +619,20 @@ class Agent:
         self, prompt: str, context: Optional[str] = None
     ) -> List[Dict[str, Any]]:
         """Build the initial message array for the agent loop."""
-        messages: List[Dict[str, Any]] = []
-
-        # System prompt
-        system = self.system_prompt
+        # System prompt first and byte-identical on every run, so providers
+        # can cache the prefix; per-run context goes in its own message
+        messages: List[Dict[str, Any]] = [
+            {"role": "system", "content": self.system_prompt}
+        ]
         if context:
-            system += f"\n\nAdditional context:\n{context}"
-        messages.append({"role": "system", "content": system})
+            messages.append(
+                {"role": "system", "content": f"Additional context:\n{context}"}
+            )
 
         # Add memory messages (previous conversation)
-        memory_msgs = self.memory.get_messages()
-        for msg in memory_msgs:
-            if msg.get("role") != "system":
-                messages.append(msg)
+        messages.extend(
+            msg for msg in self.memory.get_messages() if msg.get("role") != "system"
+        )
 
         # User prompt
         messages.append({"role": "user", "content": prompt})
@@ -378,6 +641,28 @@ class Agent:
 
     def _call_llm(self, messages: List[Dict[str, Any]]) -> ChatResponse:
         """Call the LLM with current messages and tool definitions."""
+        request = self._llm_request(messages)
+        if self.cache is not None:
+            return self.cache.create(**request)
+        return self.client.chat.completions.create(**request)
+
+    async def _acall_llm(
+        self, client: AsyncMegaNova, messages: List[Dict[str, Any]]
+    ) -> ChatResponse:
+        """Async counterpart of ``_call_llm``."""
+        request = self._llm_request(messages)
+        if self.cache is not None:
+            return await self.cache.acreate(client, **request)
+        return await client.chat.completions.create(**request)
+
+    def _call_llm_stream(self, messages: List[Dict[str, Any]]) -> Iterator[ChatStreamChunk]:
+        """Call the LLM with streaming enabled."""
+        return self.client.chat.completions.create(
+            **self._llm_request(messages), stream=True
+        )
+
+    def _llm_request(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Build the chat completion arguments for the current turn."""
         kwargs: Dict[str, Any] = {}
         if self.temperature is not None:
             kwargs["temperature"] = self.temperature
@@ -385,13 +670,85 @@ class Agent:
             kwargs["max_tokens"] = self.max_tokens
 
         tools = self._registry.to_openai_tools() if len(self._registry) > 0 else None
+        if self.prompt_cache:
+            kwargs["prompt_cache_key"] = self._cache_key_for(tools)
 
-        return self.client.chat.completions.create(
-            messages=messages,
-            model=self.model,
-            tools=tools,
+        return {
+            "messages": messages,
+            "model": self.model,
+            "tools": tools,
             **kwargs,
-        )
+        }
+
+    def _cache_key_for(self, tools: Optional[List[Dict[str, Any]]]) -> str:
+        """Key for the stable request prefix: tool schemas plus system prompt.
+
+        Messages within a run are only ever appended, so every turn shares
+        this prefix. The key deliberately stays the same across turns; it
+        tells the provider which requests to route to the same cache.
+        """
+        memo = self._prompt_cache_key
+        if memo is None or memo[0] != self.system_prompt or memo[1] is not tools:
+            prefix = json.dumps([tools, self.system_prompt], sort_keys=True)
+            key = hashlib.sha256(prefix.encode()).hexdigest()[:16]
+            memo = self._prompt_cache_key = (self.system_prompt, tools, key)
+        return memo[2]
+
+    @staticmethod
+    def _parse_tool_args(arguments: str) -> Dict[str, Any]:
+        """Parse a tool call's JSON arguments, falling back to no arguments."""
+        try:
+            return _json.loads(arguments)
+        except _json.JSONDecodeError:
+            return {}
+
+    def _execute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Execute a turn's tool calls, returning results in call order.
+
+        Independent calls run concurrently on a thread pool. If any tool in the
+        batch is not ``parallel_safe``, the whole batch runs sequentially.
+        """
+        if len(calls) < 2 or self.tool_concurrency < 2 or not all(
+            self._is_parallel_safe(name) for name, _ in calls
+        ):
+            return [self._execute_tool(name, args) for name, args in calls]
+
+        workers = min(self.tool_concurrency, len(calls))
+        with concurrent.futures.ThreadPoolExecutor(max_workers=workers) as executor:
+            return list(
+                executor.map(lambda call: self._execute_tool(*call), calls)
+            )
+
+    async def _aexecute_tools(self, calls: List[Tuple[str, Dict[str, Any]]]) -> List[str]:
+        """Async counterpart of ``_execute_tools``, gathering calls on the loop."""
+        if len(calls) < 2 or self.tool_concurrency < 2 or not all(
+            self._is_parallel_safe(name) for name, _ in calls
+        ):
+            return [await self._aexecute_tool(name, args) for name, args in calls]
+
+        semaphore = asyncio.Semaphore(self.tool_concurrency)
+
+        async def run(call: Tuple[str, Dict[str, Any]]) -> str:
+            async with semaphore:
+                return await self._aexecute_tool(*call)
+
+        return list(await asyncio.gather(*(run(call) for call in calls)))
+
+    async def _aexecute_tool(self, name: str, args: Dict[str, Any]) -> str:
+        """Await an async tool, or run a sync tool on a worker thread."""
+        tool_def = self._registry.get(name)
+        if tool_def is None or not tool_def.is_async:
+            return await asyncio.to_thread(self._execute_tool, name, args)
+
+        try:
+            result = await tool_def.execute(**args)
+            return str(result)
+        except Exception as e:
+            return f"Error executing {name}: {e}"
+
+    def _is_parallel_safe(self, name: str) -> bool:
+        tool_def = self._registry.get(name)
+        return tool_def is None or tool_def.parallel_safe
 
     def _execute_tool(self, name: str, args: Dict[str, Any]) -> str:
         """Execute a tool by name with the given arguments."""
@@ -400,7 +757,11 @@ class Agent:
             return f"Error: Unknown tool '{name}'"
 
         try:
-            result = tool_def.execute(**args)
+            if tool_def.is_async:
+                # Called from a worker thread (or sync run), with no running loop
+                result = asyncio.run(tool_def.execute(**args))
+            else:
+                result = tool_def.execute(**args)
             return str(result)
         except Exception as e:
             return f"Error executing {name}: {e}"
@@ -45,6 +45,11 @@ class HookResult:
     reason: Optional[str] = None
 
 
+# Returned by HookManager.run when no hooks of a type are registered.
+# Callers only read the result, so one shared instance is safe.
+_EMPTY_RESULT = HookResult(allow=True)
+
+
 class Hook:
     """A registered hook function."""
 
@@ -80,9 +85,12 @@ class HookManager:
 
     def run(self, hook_type: HookType, context: HookContext) -> HookResult:
         """Run all hooks of the given type. Returns combined result."""
+        hooks = self._hooks[hook_type]
+        if not hooks:
+            return _EMPTY_RESULT
         result = HookResult(allow=True)
 
-        for hook in self._hooks[hook_type]:
+        for hook in hooks:
             try:
                 hook_result = hook(context)
                 if hook_result is not None:
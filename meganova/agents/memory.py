@@ -4,10 +4,13 @@ Provides different strategies for managing conversation history:
 - MessageMemory: Keep all messages (unlimited)
 - SlidingWindowMemory: Keep last N messages
 - TokenBudgetMemory: Keep messages within a token budget
+
+Messages are copied once when added. ``get_messages`` returns a new list
+holding the stored dicts, so treat the returned messages as read-only.
 """
 
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 from abc import ABC, abstractmethod
 import json
 
@@ -52,6 +55,11 @@ class Memory(ABC):
     def add(self, message: Dict[str, Any]) -> None:
         """Add a message to memory."""
 
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        """Add several messages at once."""
+        for message in messages:
+            self.add(message)
+
     @abstractmethod
     def get_messages(self) -> List[Dict[str, Any]]:
         """Get all messages in memory."""
@@ -72,20 +80,39 @@ class Memory(ABC):
         return len(self.get_messages())
 
 
+_MESSAGE_KEYS = ("role", "content", "tool_calls", "tool_call_id", "name")
+
+
+def _normalize(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy a message keeping only the known, non-None fields.
+
+    Produces the same dict as ``MemoryEntry.from_message(m).to_message()``.
+    """
+    stored = {"role": message["role"]}
+    for key in _MESSAGE_KEYS[1:]:
+        value = message.get(key)
+        if value is not None:
+            stored[key] = value
+    return stored
+
+
 class MessageMemory(Memory):
     """Keep all messages (unlimited)."""
 
     def __init__(self) -> None:
-        self._entries: List[MemoryEntry] = []
+        self._messages: List[Dict[str, Any]] = []
 
     def add(self, message: Dict[str, Any]) -> None:
-        self._entries.append(MemoryEntry.from_message(message))
+        self._messages.append(_normalize(message))
+
+    def extend(self, messages: Iterable[Dict[str, Any]]) -> None:
+        self._messages.extend(map(_normalize, messages))
 
     def get_messages(self) -> List[Dict[str, Any]]:
-        return [e.to_message() for e in self._entries]
+        return list(self._messages)
 
     def clear(self) -> None:
-        self._entries.clear()
+        self._messages.clear()
 
 
 class SlidingWindowMemory(Memory):
@@ -93,23 +120,33 @@ class SlidingWindowMemory(Memory):
 
     def __init__(self, max_messages: int = 20) -> None:
         self.max_messages = max_messages
-        self._entries: List[MemoryEntry] = []
+        self._messages: List[Dict[str, Any]] = []
+        # The same dicts split by role, so trimming is a single slice
+        self._system: List[Dict[str, Any]] = []
+        self._history: List[Dict[str, Any]] = []
 
     def add(self, message: Dict[str, Any]) -> None:
-        self._entries.append(MemoryEntry.from_message(message))
+        stored = _normalize(message)
+        self._messages.append(stored)
+        if stored["role"] == "system":
+            self._system.append(stored)
+        else:
+            self._history.append(stored)
 
     def get_messages(self) -> List[Dict[str, Any]]:
-        if len(self._entries) <= self.max_messages:
-            return [e.to_message() for e in self._entries]
+        if len(self._messages) <= self.max_messages:
+            return list(self._messages)
 
         # Always keep system messages, then take the most recent
-        system = [e for e in self._entries if e.role == "system"]
-        non_system = [e for e in self._entries if e.role != "system"]
-        kept = non_system[-(self.max_messages - len(system)) :]
-        return [e.to_message() for e in system + kept]
+        keep = self.max_messages - len(self._system)
+        if keep <= 0:
+            return list(self._system)
+        return self._system + self._history[-keep:]
 
     def clear(self) -> None:
-        self._entries.clear()
+        self._messages.clear()
+        self._system.clear()
+        self._history.clear()
 
 
 class TokenBudgetMemory(Memory):
@@ -119,10 +156,22 @@ class TokenBudgetMemory(Memory):
 
     def __init__(self, max_tokens: int = 4096) -> None:
         self.max_tokens = max_tokens
-        self._entries: List[MemoryEntry] = []
+        # System messages are always kept; the rest is trimmed from the front.
+        # Token costs are estimated once, when a message is added.
+        self._system: List[Dict[str, Any]] = []
+        self._system_tokens = 0
+        self._history: List[Dict[str, Any]] = []
+        self._costs: List[int] = []
 
     def add(self, message: Dict[str, Any]) -> None:
-        self._entries.append(MemoryEntry.from_message(message))
+        stored = _normalize(message)
+        cost = self._estimate_tokens(MemoryEntry.from_message(stored))
+        if stored["role"] == "system":
+            self._system.append(stored)
+            self._system_tokens += cost
+        else:
+            self._history.append(stored)
+            self._costs.append(cost)
 
     def _estimate_tokens(self, entry: MemoryEntry) -> int:
         text = entry.content or ""
@@ -131,23 +180,21 @@ class TokenBudgetMemory(Memory):
         return max(1, len(text) // self.CHARS_PER_TOKEN)
 
     def get_messages(self) -> List[Dict[str, Any]]:
-        # Always keep system messages
-        system = [e for e in self._entries if e.role == "system"]
-        non_system = [e for e in self._entries if e.role != "system"]
-
-        system_tokens = sum(self._estimate_tokens(e) for e in system)
-        budget = self.max_tokens - system_tokens
-
-        # Take messages from the end until budget exhausted
-        kept: List[MemoryEntry] = []
-        for entry in reversed(non_system):
-            cost = self._estimate_tokens(entry)
-            if budget - cost < 0 and kept:
+        budget = self.max_tokens - self._system_tokens
+
+        # Take messages from the end until budget exhausted (always keep one)
+        start = len(self._history)
+        while start > 0:
+            cost = self._costs[start - 1]
+            if budget - cost < 0 and start < len(self._history):
                 break
-            kept.insert(0, entry)
+            start -= 1
             budget -= cost
 
-        return [e.to_message() for e in system + kept]
+        return self._system + self._history[start:]
 
     def clear(self) -> None:
-        self._entries.clear()
+        self._system.clear()
+        self._system_tokens = 0
+        self._history.clear()
+        self._costs.clear()
@@ -3,7 +3,9 @@
 All sandbox providers (Docker, E2B, etc.) implement this interface.
 """
 
+import re
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
@@ -28,6 +30,9 @@ class SandboxConfig:
     read_only_root: bool = True
     working_dir: str = "/workspace"
     environment: Dict[str, str] = field(default_factory=dict)
+    # Reuse results of repeated read-only commands (cat, ls, pwd, ...)
+    # until a write_file or any other command runs
+    cache_read_only_commands: bool = False
 
 
 @dataclass
@@ -40,6 +45,13 @@ class SandboxResult:
     timed_out: bool = False
 
 
+# Simple inspection commands with no shell operators, redirects or expansions
+_READ_ONLY_COMMAND = re.compile(
+    r"^(?:cat|ls|pwd|which|python3? --version)(?:\s+[^;&|<>`$\n]*)?$"
+)
+_COMMAND_CACHE_SIZE = 128
+
+
 class SandboxProvider(ABC):
     """Abstract base class for sandbox providers."""
 
@@ -48,6 +60,7 @@ class SandboxProvider(ABC):
     def __init__(self, config: Optional[SandboxConfig] = None):
         self.config = config or SandboxConfig()
         self._status = SandboxStatus.CREATED
+        self._command_cache: "OrderedDict[str, SandboxResult]" = OrderedDict()
 
     @abstractmethod
     def start(self) -> None:
@@ -73,6 +86,26 @@ class SandboxProvider(ABC):
     def is_running(self) -> bool:
         """Check if the sandbox is currently running."""
 
+    def _cached_result(self, command: str) -> Optional[SandboxResult]:
+        """A cached result for ``command``, if read-only caching is enabled."""
+        if not self.config.cache_read_only_commands:
+            return None
+        result = self._command_cache.get(command)
+        if result is not None:
+            self._command_cache.move_to_end(command)
+        return result
+
+    def _remember(self, command: str, result: SandboxResult) -> None:
+        """Cache a successful read-only command; any other command invalidates."""
+        if not self.config.cache_read_only_commands:
+            return
+        if not _READ_ONLY_COMMAND.match(command.strip()):
+            self._command_cache.clear()
+        elif result.exit_code == 0 and not result.timed_out:
+            self._command_cache[command] = result
+            if len(self._command_cache) > _COMMAND_CACHE_SIZE:
+                self._command_cache.popitem(last=False)
+
     @property
     def status(self) -> SandboxStatus:
         return self._status
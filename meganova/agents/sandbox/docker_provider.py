@@ -4,12 +4,189 @@ Runs agent commands inside isolated Docker containers with configurable
 security settings (network isolation, resource limits, read-only root).
 """
 
+import codecs
+import queue
+import tarfile
+import threading
 import uuid
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Generator, Iterator, List, Optional, Tuple
 
 from .base import SandboxConfig, SandboxProvider, SandboxResult, SandboxStatus
 
 
+_client: Any = None
+_client_lock = threading.Lock()
+
+
+def _docker_client() -> Any:
+    """The shared Docker client, created on first use.
+
+    docker.from_env() builds a new HTTP session each time, so every sandbox
+    and pool thread reuses one client instead.
+    """
+    global _client
+    with _client_lock:
+        if _client is None:
+            try:
+                import docker
+            except ImportError:
+                raise ImportError(
+                    "Docker package not installed. Install with: pip install meganova[agents]"
+                )
+            _client = docker.from_env()
+        return _client
+
+
+def _run_container(config: SandboxConfig, name: str) -> Any:
+    """Start a detached, locked-down container that idles until used."""
+    client = _docker_client()
+
+    # Build container options with security defaults
+    run_kwargs: Dict[str, Any] = {
+        "image": config.image,
+        "name": name,
+        "detach": True,
+        "tty": True,
+        "working_dir": config.working_dir,
+        "mem_limit": f"{config.memory_mb}m",
+        "nano_cpus": int(config.cpu_count * 1e9),
+        "pids_limit": 100,
+        "user": "1000:1000",
+        "environment": config.environment,
+    }
+
+    if not config.network_enabled:
+        run_kwargs["network_mode"] = "none"
+
+    if config.read_only_root:
+        run_kwargs["read_only"] = True
+        # Need tmpfs for /tmp and /workspace
+        run_kwargs["tmpfs"] = {
+            "/tmp": "size=100m",
+            config.working_dir: "size=200m",
+        }
+
+    # Security options
+    run_kwargs["cap_drop"] = ["ALL"]
+    run_kwargs["security_opt"] = ["no-new-privileges"]
+
+    return client.containers.run(
+        command="sleep infinity",
+        **run_kwargs,
+    )
+
+
+def _tar_single_file(name: str, data: bytes) -> bytes:
+    """A one-file tar archive, built without a TarFile or BytesIO.
+
+    TarInfo.tobuf still writes the header, so long names get PAX records.
+    """
+    info = tarfile.TarInfo(name=name)
+    info.size = len(data)
+    header = info.tobuf(tarfile.PAX_FORMAT, "utf-8", "surrogateescape")
+    padding = -len(data) % tarfile.BLOCKSIZE
+    return b"".join((header, data, b"\0" * (padding + 2 * tarfile.BLOCKSIZE)))
+
+
+def _remove_container(container: Any) -> None:
+    try:
+        container.stop(timeout=5)
+    except Exception:
+        try:
+            container.kill()
+        except Exception:
+            pass
+    try:
+        container.remove(force=True)
+    except Exception:
+        pass
+
+
+class DockerSandboxPool:
+    """Keeps pre-started containers warm so sandboxes start instantly.
+
+    Each sandbox gets a fresh container that is removed when the sandbox
+    stops (containers are never reused between sandboxes). The pool refills
+    itself in the background up to ``min_warm`` containers.
+
+    Usage:
+        pool = DockerSandboxPool(SandboxConfig(image="python:3.11-slim"), min_warm=2)
+        pool.start()
+
+        with DockerSandbox(pool=pool) as sandbox:
+            sandbox.execute("echo hi")
+
+        pool.close()
+    """
+
+    def __init__(self, config: Optional[SandboxConfig] = None, min_warm: int = 2):
+        self.config = config or SandboxConfig()
+        self.min_warm = min_warm
+        self._warm: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._closed = False
+
+    def start(self) -> None:
+        """Begin warming containers in the background."""
+        self._replenish()
+
+    def acquire(self) -> Any:
+        """Take a warm container, or start one now if none is ready."""
+        if self._closed:
+            raise RuntimeError("Sandbox pool is closed")
+        try:
+            container = self._warm.get_nowait()
+        except queue.Empty:
+            container = self._create()
+        self._replenish()
+        return container
+
+    def close(self) -> None:
+        """Remove all warm containers and stop refilling."""
+        with self._lock:
+            self._closed = True
+        while True:
+            try:
+                _remove_container(self._warm.get_nowait())
+            except queue.Empty:
+                break
+
+    def __enter__(self) -> "DockerSandboxPool":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _create(self) -> Any:
+        return _run_container(self.config, f"nova-sandbox-{uuid.uuid4().hex[:12]}")
+
+    def _replenish(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            needed = self.min_warm - self._warm.qsize() - self._pending
+            self._pending += max(needed, 0)
+        for _ in range(needed):
+            threading.Thread(target=self._fill, daemon=True).start()
+
+    def _fill(self) -> None:
+        try:
+            container = self._create()
+        except Exception:
+            container = None
+        # Checked and queued under the lock, so close() can't drain in between
+        with self._lock:
+            self._pending -= 1
+            if container is None:
+                return
+            if not self._closed:
+                self._warm.put(container)
+                return
+        _remove_container(container)
+
+
 class DockerSandbox(SandboxProvider):
     """Sandbox using Docker containers.
 
@@ -22,75 +199,36 @@ class DockerSandbox(SandboxProvider):
         with DockerSandbox(config) as sandbox:
             result = sandbox.execute("python -c 'print(1+1)'")
             print(result.stdout)  # "2"
+
+    Pass ``pool`` (a DockerSandboxPool) to take a pre-started container
+    instead of starting one; the pool's config is used.
     """
 
     provider_id = "docker"
 
-    def __init__(self, config: Optional[SandboxConfig] = None):
-        super().__init__(config)
+    def __init__(
+        self,
+        config: Optional[SandboxConfig] = None,
+        pool: Optional[DockerSandboxPool] = None,
+    ):
+        super().__init__(config or (pool.config if pool else None))
+        self._pool = pool
         self._container = None
         self._container_name = f"nova-sandbox-{uuid.uuid4().hex[:12]}"
 
     def start(self) -> None:
-        """Start a Docker container."""
-        try:
-            import docker
-        except ImportError:
-            raise ImportError(
-                "Docker package not installed. Install with: pip install meganova[agents]"
-            )
-
-        client = docker.from_env()
-
-        # Build container options with security defaults
-        run_kwargs: Dict[str, Any] = {
-            "image": self.config.image,
-            "name": self._container_name,
-            "detach": True,
-            "tty": True,
-            "working_dir": self.config.working_dir,
-            "mem_limit": f"{self.config.memory_mb}m",
-            "nano_cpus": int(self.config.cpu_count * 1e9),
-            "pids_limit": 100,
-            "user": "1000:1000",
-            "environment": self.config.environment,
-        }
-
-        if not self.config.network_enabled:
-            run_kwargs["network_mode"] = "none"
-
-        if self.config.read_only_root:
-            run_kwargs["read_only"] = True
-            # Need tmpfs for /tmp and /workspace
-            run_kwargs["tmpfs"] = {
-                "/tmp": "size=100m",
-                self.config.working_dir: "size=200m",
-            }
-
-        # Security options
-        run_kwargs["cap_drop"] = ["ALL"]
-        run_kwargs["security_opt"] = ["no-new-privileges"]
-
-        self._container = client.containers.run(
-            command="sleep infinity",
-            **run_kwargs,
-        )
+        """Start a Docker container (or take a warm one from the pool)."""
+        if self._pool is not None:
+            self._container = self._pool.acquire()
+        else:
+            self._container = _run_container(self.config, self._container_name)
+        self._command_cache.clear()
         self._status = SandboxStatus.RUNNING
 
     def stop(self) -> None:
         """Stop and remove the container."""
         if self._container:
-            try:
-                self._container.stop(timeout=5)
-            except Exception:
-                try:
-                    self._container.kill()
-                except Exception:
-                    pass
-            try:
-                self._container.remove(force=True)
-            except Exception:
-                pass
+            _remove_container(self._container)
             self._container = None
         self._status = SandboxStatus.STOPPED
 
@@ -99,29 +237,34 @@ class DockerSandbox(SandboxProvider):
         if not self._container:
             return SandboxResult(stderr="Sandbox not started", exit_code=1)
 
+        cached = self._cached_result(command)
+        if cached is not None:
+            return cached
+
+        result = self._run_exec(command, timeout)
+        self._remember(command, result)
+        return result
+
+    def _run_exec(self, command: str, timeout: Optional[int]) -> SandboxResult:
         exec_timeout = timeout or self.config.timeout_seconds
 
         try:
-            exit_code, output = self._container.exec_run(
-                cmd=["sh", "-c", command],
-                workdir=self.config.working_dir,
-                user="1000:1000",
-                demux=True,
-            )
+            # Stream the exec output and join it once at the end;
+            # exec_run(demux=True) grows each buffer with repeated +=
+            api, exec_id, stream = self._start_exec(command)
 
-            stdout = ""
-            stderr = ""
-            if output:
-                if isinstance(output, tuple):
-                    stdout = (output[0] or b"").decode("utf-8", errors="replace")
-                    stderr = (output[1] or b"").decode("utf-8", errors="replace")
-                else:
-                    stdout = output.decode("utf-8", errors="replace")
+            stdout_chunks: List[bytes] = []
+            stderr_chunks: List[bytes] = []
+            for out, err in stream:
+                if out:
+                    stdout_chunks.append(out)
+                if err:
+                    stderr_chunks.append(err)
 
             return SandboxResult(
-                stdout=stdout,
-                stderr=stderr,
-                exit_code=exit_code,
+                stdout=b"".join(stdout_chunks).decode("utf-8", errors="replace"),
+                stderr=b"".join(stderr_chunks).decode("utf-8", errors="replace"),
+                exit_code=api.exec_inspect(exec_id)["ExitCode"],
             )
 
         except Exception as e:
@@ -130,24 +273,62 @@ class DockerSandbox(SandboxProvider):
                 exit_code=1,
             )
 
-    def write_file(self, path: str, content: str) -> None:
-        """Write a file inside the container."""
+    def execute_stream(self, command: str) -> Generator[Tuple[str, str], None, int]:
+        """Execute a command, yielding output as it arrives.
+
+        Yields ``("stdout", text)`` and ``("stderr", text)`` pairs; multi-byte
+        characters split across chunks are held back until complete. The
+        generator returns the exit code (``result = yield from ...``).
+        Unlike ``execute``, errors are raised rather than returned.
+
+        Usage:
+            for name, text in sandbox.execute_stream("pytest -x"):
+                print(text, end="", file=sys.stderr if name == "stderr" else sys.stdout)
+        """
         if not self._container:
             raise RuntimeError("Sandbox not started")
 
-        import io
-        import tarfile
+        self._command_cache.clear()
+        api, exec_id, stream = self._start_exec(command)
+        decoders = {
+            "stdout": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+            "stderr": codecs.getincrementaldecoder("utf-8")(errors="replace"),
+        }
+
+        for out, err in stream:
+            for name, chunk in (("stdout", out), ("stderr", err)):
+                if chunk:
+                    text = decoders[name].decode(chunk)
+                    if text:
+                        yield name, text
+
+        for name, decoder in decoders.items():
+            text = decoder.decode(b"", final=True)
+            if text:
+                yield name, text
+
+        return api.exec_inspect(exec_id)["ExitCode"]
 
-        # Create a tar archive with the file
-        data = content.encode("utf-8")
-        stream = io.BytesIO()
-        with tarfile.open(fileobj=stream, mode="w") as tar:
-            info = tarfile.TarInfo(name=path.lstrip("/"))
-            info.size = len(data)
-            tar.addfile(info, io.BytesIO(data))
-        stream.seek(0)
+    def _start_exec(self, command: str) -> Tuple[Any, str, Iterator[Tuple[Any, Any]]]:
+        """Create an exec for ``command`` and start streaming demuxed output."""
+        api = self._container.client.api
+        exec_id = api.exec_create(
+            self._container.id,
+            cmd=["sh", "-c", command],
+            workdir=self.config.working_dir,
+            user="1000:1000",
+        )["Id"]
+        return api, exec_id, api.exec_start(exec_id, stream=True, demux=True)
 
-        self._container.put_archive("/", stream)
+    def write_file(self, path: str, content: str) -> None:
+        """Write a file inside the container."""
+        if not self._container:
+            raise RuntimeError("Sandbox not started")
+
+        self._command_cache.clear()
+        self._container.put_archive(
+            "/", _tar_single_file(path.lstrip("/"), content.encode("utf-8"))
+        )
 
     def read_file(self, path: str) -> str:
         """Read a file from the container."""
@@ -55,6 +55,7 @@ class E2BSandbox(SandboxProvider):
             kwargs["api_key"] = self._api_key
 
         self._sandbox = Sandbox(**kwargs)
+        self._command_cache.clear()
         self._status = SandboxStatus.RUNNING
 
     def stop(self) -> None:
@@ -72,23 +73,31 @@ class E2BSandbox(SandboxProvider):
         if not self._sandbox:
             return SandboxResult(stderr="Sandbox not started", exit_code=1)
 
+        cached = self._cached_result(command)
+        if cached is not None:
+            return cached
+
         try:
-            result = self._sandbox.commands.run(
+            run = self._sandbox.commands.run(
                 command,
                 timeout=timeout or self.config.timeout_seconds,
             )
-            return SandboxResult(
-                stdout=result.stdout,
-                stderr=result.stderr,
-                exit_code=result.exit_code,
+            result = SandboxResult(
+                stdout=run.stdout,
+                stderr=run.stderr,
+                exit_code=run.exit_code,
             )
         except Exception as e:
-            return SandboxResult(stderr=f"E2B error: {e}", exit_code=1)
+            result = SandboxResult(stderr=f"E2B error: {e}", exit_code=1)
+
+        self._remember(command, result)
+        return result
 
     def write_file(self, path: str, content: str) -> None:
         """Write a file in the E2B sandbox."""
         if not self._sandbox:
             raise RuntimeError("Sandbox not started")
+        self._command_cache.clear()
         self._sandbox.files.write(path, content)
 
     def read_file(self, path: str) -> str:
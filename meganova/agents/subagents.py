@@ -2,15 +2,24 @@
 
 Supports:
 - Sequential execution: agents run one after another
-- Parallel execution: agents run concurrently (via threads)
+- Parallel execution: agents run concurrently (via threads or asyncio)
 - Handoff: one agent delegates to another based on the task
 """
 
+import asyncio
 import concurrent.futures
+import contextlib
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-from .agent import Agent, AgentResult
+from ..async_client import AsyncMegaNova
+from .agent import Agent, AgentResult, _async_client_from
+
+
+def _client_settings(client: Any) -> Tuple[Any, ...]:
+    """The settings ``_async_client_from`` copies from a sync client."""
+    t = client._transport
+    return (t.api_key, t.base_url, t.timeout, t.max_retries, t.max_connections)
 
 
 @dataclass
@@ -47,6 +56,9 @@ class AgentTeam:
 
         # Parallel: both run simultaneously
         result = team.run_parallel("Analyze this from multiple angles")
+
+        # Parallel on one event loop and a shared connection pool
+        result = await team.run_parallel_async("Analyze this from multiple angles")
     """
 
     def __init__(self) -> None:
@@ -101,10 +113,7 @@ class AgentTeam:
         max_workers: int = 4,
     ) -> TeamResult:
         """Run agents in parallel using threads."""
-        eligible = [
-            c for c in self._agents
-            if c.condition is None or c.condition(prompt)
-        ]
+        eligible = self._eligible(prompt)
 
         results: List[AgentResult] = []
         agents_used: List[str] = []
@@ -125,7 +134,73 @@ class AgentTeam:
                 except Exception:
                     pass
 
-        # Combine all results
+        return self._combine(results, agents_used)
+
+    async def run_parallel_async(
+        self,
+        prompt: str,
+        context: Optional[str] = None,
+        client: Optional[AsyncMegaNova] = None,
+    ) -> TeamResult:
+        """Run agents concurrently on one event loop.
+
+        Agents whose clients have the same settings share one
+        ``AsyncMegaNova`` client, so their LLM calls reuse one keep-alive
+        connection pool instead of each paying its own connection setup.
+        Results keep the order agents were added.
+
+        Args:
+            prompt: The task given to every eligible agent.
+            context: Optional context passed to every agent.
+            client: Async client used by every agent. If omitted, one is
+                created per distinct API key/endpoint/transport settings among
+                the agents' clients and closed afterwards.
+        """
+        eligible = self._eligible(prompt)
+        if not eligible:
+            return TeamResult()
+
+        async with contextlib.AsyncExitStack() as stack:
+            clients: List[AsyncMegaNova] = []
+            if client is not None:
+                clients = [client] * len(eligible)
+            else:
+                owned: Dict[Tuple[Any, ...], AsyncMegaNova] = {}
+                for c in eligible:
+                    key = _client_settings(c.agent.client)
+                    if key not in owned:
+                        owned[key] = await stack.enter_async_context(
+                            _async_client_from(c.agent.client)
+                        )
+                    clients.append(owned[key])
+
+            outcomes = await asyncio.gather(
+                *(
+                    c.agent.arun(prompt, context=context, client=agent_client)
+                    for c, agent_client in zip(eligible, clients)
+                ),
+                return_exceptions=True,
+            )
+
+        results: List[AgentResult] = []
+        agents_used: List[str] = []
+        for config, outcome in zip(eligible, outcomes):
+            if isinstance(outcome, BaseException):
+                continue
+            results.append(outcome)
+            agents_used.append(config.role or config.agent.name)
+
+        return self._combine(results, agents_used)
+
+    def _eligible(self, prompt: str) -> List[SubagentConfig]:
+        return [
+            c for c in self._agents
+            if c.condition is None or c.condition(prompt)
+        ]
+
+    @staticmethod
+    def _combine(results: List[AgentResult], agents_used: List[str]) -> TeamResult:
+        """Combine parallel results into a single TeamResult."""
         combined = "\n\n---\n\n".join(
             f"**{name}**: {r.content}" for name, r in zip(agents_used, results)
         )
@@ -1,9 +1,21 @@
 """Tool definition system with @tool decorator for the Nova Agent SDK."""
 
+import functools
 import inspect
 import json
+import types
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, List, Optional, get_type_hints
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
 
 
 # Python type -> JSON Schema type mapping
@@ -16,28 +28,34 @@ _TYPE_MAP = {
     dict: "object",
 }
 
+# Union[X, None] and, on Python 3.10+, X | None
+_UNION_TYPES = (Union, getattr(types, "UnionType", Union))
+
 
 def _python_type_to_json_schema(py_type: Any) -> Dict[str, Any]:
-    """Convert a Python type annotation to a JSON Schema type."""
-    origin = getattr(py_type, "__origin__", None)
+    """Convert a Python type annotation to a JSON Schema type.
+
+    Results are cached per annotation; treat the returned dict as read-only.
+    """
+    try:
+        return _cached_type_schema(py_type)
+    except TypeError:  # unhashable annotation
+        return _type_schema(py_type)
 
-    if origin is list or origin is List:
-        args = getattr(py_type, "__args__", (Any,))
+
+def _type_schema(py_type: Any) -> Dict[str, Any]:
+    origin = get_origin(py_type)
+
+    if origin is list:
+        args = get_args(py_type)
         item_type = args[0] if args else Any
         return {"type": "array", "items": _python_type_to_json_schema(item_type)}
 
-    if origin is dict or origin is Dict:
+    if origin is dict:
         return {"type": "object"}
 
-    if origin is Optional:
-        args = getattr(py_type, "__args__", ())
-        inner = args[0] if args else Any
-        return _python_type_to_json_schema(inner)
-
-    # Handle Optional[X] which is Union[X, None]
-    if origin is getattr(type(Optional[str]), "__origin__", None):
-        args = getattr(py_type, "__args__", ())
-        non_none = [a for a in args if a is not type(None)]
+    if origin in _UNION_TYPES:
+        non_none = [a for a in get_args(py_type) if a is not type(None)]
         if len(non_none) == 1:
             return _python_type_to_json_schema(non_none[0])
 
@@ -45,6 +63,9 @@ def _python_type_to_json_schema(py_type: Any) -> Dict[str, Any]:
     return {"type": schema_type}
 
 
+_cached_type_schema = functools.lru_cache(maxsize=256)(_type_schema)
+
+
 def _build_parameters_schema(func: Callable) -> Dict[str, Any]:
     """Build OpenAI function calling parameters schema from function signature."""
     sig = inspect.signature(func)
@@ -86,12 +107,17 @@ def _build_parameters_schema(func: Callable) -> Dict[str, Any]:
 
 @dataclass
 class ToolDefinition:
-    """A tool that an agent can call."""
+    """A tool that an agent can call.
+
+    Set ``parallel_safe=False`` for tools that share mutable state (e.g. a
+    single sandbox workspace) so the agent never runs them concurrently.
+    """
 
     name: str
     description: str
     func: Callable
     parameters: Dict[str, Any] = field(default_factory=dict)
+    parallel_safe: bool = True
 
     def to_openai_tool(self) -> Dict[str, Any]:
         """Convert to OpenAI function calling tool format."""
@@ -104,6 +130,11 @@ class ToolDefinition:
             },
         }
 
+    @property
+    def is_async(self) -> bool:
+        """True if ``func`` is an ``async def`` function (execute returns a coroutine)."""
+        return inspect.iscoroutinefunction(self.func)
+
     def execute(self, **kwargs: Any) -> Any:
         """Execute the tool function with the given arguments."""
         return self.func(**kwargs)
@@ -114,9 +145,11 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: Dict[str, ToolDefinition] = {}
+        self._openai_tools: Optional[List[Dict[str, Any]]] = None
 
     def register(self, tool_def: ToolDefinition) -> None:
         self._tools[tool_def.name] = tool_def
+        self._openai_tools = None
 
     def get(self, name: str) -> Optional[ToolDefinition]:
         return self._tools.get(name)
@@ -125,8 +158,14 @@ class ToolRegistry:
         return list(self._tools.values())
 
     def to_openai_tools(self) -> List[Dict[str, Any]]:
-        """Convert all tools to OpenAI function calling format."""
-        return [t.to_openai_tool() for t in self._tools.values()]
+        """Convert all tools to OpenAI function calling format.
+
+        The list is built once and reused until another tool is registered;
+        treat it as read-only.
+        """
+        if self._openai_tools is None:
+            self._openai_tools = [t.to_openai_tool() for t in self._tools.values()]
+        return self._openai_tools
 
     def __len__(self) -> int:
         return len(self._tools)
@@ -138,6 +177,7 @@ class ToolRegistry:
 def tool(
     name: Optional[str] = None,
     description: Optional[str] = None,
+    parallel_safe: bool = True,
 ) -> Callable:
     """Decorator to register a function as an agent tool.
 
@@ -162,6 +202,7 @@ def tool(
             description=tool_desc.strip(),
             func=func,
             parameters=params,
+            parallel_safe=parallel_safe,
         )
         return tool_def
 
@@ -3,6 +3,7 @@
 Provides read, write, edit, and list operations on the local filesystem.
 """
 
+import itertools
 import os
 from typing import Optional
 
@@ -14,10 +15,12 @@ def _read_file(path: str, max_lines: int = 500) -> str:
     try:
         path = os.path.expanduser(path)
         with open(path, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-        if len(lines) > max_lines:
-            return "".join(lines[:max_lines]) + f"\n... ({len(lines) - max_lines} more lines)"
-        return "".join(lines)
+            # Keep only the head in memory; the rest is just counted
+            head = "".join(itertools.islice(f, max_lines))
+            remaining = sum(1 for _ in f)
+        if remaining:
+            return head + f"\n... ({remaining} more lines)"
+        return head
     except Exception as e:
         return f"Error reading {path}: {e}"
 
@@ -27,9 +30,11 @@ def _write_file(path: str, content: str) -> str:
     try:
         path = os.path.expanduser(path)
         os.makedirs(os.path.dirname(path), exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            f.write(content)
-        return f"Written {len(content)} bytes to {path}"
+        # Encode once and write the bytes straight through
+        data = content.encode("utf-8")
+        with open(path, "wb") as f:
+            f.write(data)
+        return f"Written {len(data)} bytes to {path}"
     except Exception as e:
         return f"Error writing {path}: {e}"
 
@@ -40,9 +45,10 @@ def _edit_file(path: str, old_text: str, new_text: str) -> str:
         path = os.path.expanduser(path)
         with open(path, "r", encoding="utf-8") as f:
             content = f.read()
-        if old_text not in content:
+        idx = content.find(old_text)
+        if idx < 0:
             return f"Error: old_text not found in {path}"
-        content = content.replace(old_text, new_text, 1)
+        content = content[:idx] + new_text + content[idx + len(old_text):]
         with open(path, "w", encoding="utf-8") as f:
             f.write(content)
         return f"Edited {path}: replaced text successfully"
@@ -54,15 +60,16 @@ def _list_directory(path: str = ".", max_entries: int = 200) -> str:
     """List files and directories at the given path."""
     try:
         path = os.path.expanduser(path)
-        entries = sorted(os.listdir(path))
+        # scandir gets each entry's type from the directory listing itself,
+        # so only symlinks need an extra stat
+        with os.scandir(path) as it:
+            entries = sorted(it, key=lambda e: e.name)
+        result = [
+            f"{'d' if entry.is_dir() else 'f'} {entry.name}"
+            for entry in entries[:max_entries]
+        ]
         if len(entries) > max_entries:
-            entries = entries[:max_entries]
-            entries.append(f"... ({len(os.listdir(path)) - max_entries} more)")
-        result = []
-        for entry in entries:
-            full = os.path.join(path, entry)
-            prefix = "d " if os.path.isdir(full) else "f "
-            result.append(f"{prefix}{entry}")
+            result.append(f"... ({len(entries) - max_entries} more)")
         return "\n".join(result)
     except Exception as e:
         return f"Error listing {path}: {e}"
@@ -92,6 +99,7 @@ write_file_tool = ToolDefinition(
     name="write_file",
     description="Write content to a file. Creates the file and any parent directories if they don't exist.",
     func=_write_file,
+    parallel_safe=False,
     parameters={
         "type": "object",
         "properties": {
@@ -112,6 +120,7 @@ edit_file_tool = ToolDefinition(
     name="edit_file",
     description="Edit a file by replacing old_text with new_text. Only replaces the first occurrence.",
     func=_edit_file,
+    parallel_safe=False,
     parameters={
         "type": "object",
         "properties": {
@@ -1,13 +1,22 @@
 """Knowledge base search tool for agents.
 
-Provides keyword-based search over lorebook-style knowledge entries.
+Provides keyword-based search over lorebook-style knowledge entries, with
+optional embedding-based (semantic) ranking.
 """
 
+import heapq
+import math
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 from .base import ToolDefinition
 
+EmbedFn = Callable[[str], Sequence[float]]
+
+# Use an HNSW index (if hnswlib is installed) once the KB has this many entries
+HNSW_MIN_ENTRIES = 1000
+
 
 @dataclass
 class KnowledgeEntry:
@@ -20,42 +29,202 @@ class KnowledgeEntry:
     tags: List[str] = field(default_factory=list)
 
 
-class KnowledgeBase:
-    """In-memory keyword-triggered knowledge base (lorebook pattern)."""
+def _cosine(a: Sequence[float], b: Sequence[float]) -> float:
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    if norm == 0:
+        return 0.0
+    return sum(x * y for x, y in zip(a, b)) / norm
+
+
+class _KeywordMatcher:
+    """Aho-Corasick automaton over lowercased entry keys and titles.
+
+    Scans a query once, in time linear in its length, and returns the keyword
+    score of every entry with a hit (each matching key +1, title +2).
+    """
+
+    def __init__(self, entries: List[KnowledgeEntry]) -> None:
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._patterns: List[Tuple[int, int]] = []  # (entry index, weight)
+        self._always: Dict[int, int] = {}  # empty patterns match any query
+
+        for i, entry in enumerate(entries):
+            for key in entry.keys:
+                self._add(key.lower(), i, 1)
+            self._add(entry.title.lower(), i, 2)
+        self._build()
+
+    def scores(self, query: str) -> Dict[int, int]:
+        node = 0
+        hits = set()
+        for ch in query.lower():
+            while node and ch not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(ch, 0)
+            hits.update(self._out[node])
+
+        scores = dict(self._always)
+        for pattern in hits:
+            entry, weight = self._patterns[pattern]
+            scores[entry] = scores.get(entry, 0) + weight
+        return scores
+
+    def _add(self, pattern: str, entry: int, weight: int) -> None:
+        if not pattern:
+            self._always[entry] = self._always.get(entry, 0) + weight
+            return
+        node = 0
+        for ch in pattern:
+            nxt = self._goto[node].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[node][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            node = nxt
+        self._out[node].append(len(self._patterns))
+        self._patterns.append((entry, weight))
+
+    def _build(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                f = self._fail[node]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                self._fail[child] = self._goto[f].get(ch, 0) if node else 0
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
 
-    def __init__(self, entries: Optional[List[KnowledgeEntry]] = None) -> None:
+class KnowledgeBase:
+    """In-memory keyword-triggered knowledge base (lorebook pattern).
+
+    Pass ``embed_fn`` to also rank entries by meaning: each entry is embedded
+    once when added, and a search blends cosine similarity (weight 0.6) with
+    the normalized keyword score (weight 0.4). Large knowledge bases use an
+    HNSW index when ``hnswlib`` is installed.
+    """
+
+    SEMANTIC_WEIGHT = 0.6
+    KEYWORD_WEIGHT = 0.4
+
+    def __init__(
+        self,
+        entries: Optional[List[KnowledgeEntry]] = None,
+        embed_fn: Optional[EmbedFn] = None,
+        min_similarity: float = 0.3,
+    ) -> None:
         self._entries = entries or []
+        self._embed_fn = embed_fn
+        self.min_similarity = min_similarity
+        self._vectors: List[Sequence[float]] = []
+        self._index: Any = None
+        self._matcher: Optional[_KeywordMatcher] = None
+        self._matcher_size = 0
+        if embed_fn is not None:
+            self._vectors = [self._embed_entry(e) for e in self._entries]
 
     def add(self, entry: KnowledgeEntry) -> None:
         self._entries.append(entry)
+        self._matcher = None
+        if self._embed_fn is not None:
+            self._vectors.append(self._embed_entry(entry))
+            self._index = None
 
     def search(self, query: str, max_results: int = 5) -> str:
-        """Search entries by keyword matching. Returns formatted results."""
-        query_lower = query.lower()
-        matches: List[tuple] = []
-
-        for entry in self._entries:
-            score = 0
-            for key in entry.keys:
-                if key.lower() in query_lower:
-                    score += 1
-            if entry.title.lower() in query_lower:
-                score += 2
-            if score > 0:
-                matches.append((score + entry.priority, entry))
-
-        matches.sort(key=lambda x: x[0], reverse=True)
-        top = matches[:max_results]
+        """Search entries by keyword (and semantic) matching. Returns formatted results."""
+        if self._embed_fn is not None:
+            top = self._semantic_matches(query, max_results)
+        else:
+            top = self._keyword_matches(query, max_results)
 
         if not top:
             return "No relevant knowledge found."
 
         results = []
-        for _, entry in top:
+        for entry in top:
             results.append(f"## {entry.title}\n{entry.content}")
 
         return "\n\n---\n\n".join(results)
 
+    def _keyword_scores(self, query: str) -> Dict[int, int]:
+        """Map entry index to keyword score for every entry that matches."""
+        if self._matcher is None or self._matcher_size != len(self._entries):
+            self._matcher = _KeywordMatcher(self._entries)
+            self._matcher_size = len(self._entries)
+        return self._matcher.scores(query)
+
+    def _keyword_matches(self, query: str, max_results: int) -> List[KnowledgeEntry]:
+        # Equal scores rank in entry order; the scores dict's order is arbitrary
+        matches = heapq.nlargest(
+            max_results,
+            (
+                (score + self._entries[i].priority, -i)
+                for i, score in self._keyword_scores(query).items()
+            ),
+        )
+        return [self._entries[-neg_i] for _, neg_i in matches]
+
+    def _semantic_matches(self, query: str, max_results: int) -> List[KnowledgeEntry]:
+        keyword = self._keyword_scores(query)
+        top_keyword = max(keyword.values(), default=0)
+
+        similar = dict(
+            self._nearest(self._embed_fn(query), max(max_results * 2, 10))
+        )
+        candidates = set(keyword) | {
+            i for i, sim in similar.items() if sim >= self.min_similarity
+        }
+
+        ranked = []
+        for i in candidates:
+            score = self.SEMANTIC_WEIGHT * similar.get(i, 0.0)
+            if top_keyword:
+                score += self.KEYWORD_WEIGHT * keyword.get(i, 0) / top_keyword
+            ranked.append((score, self._entries[i].priority, i))
+
+        ranked.sort(reverse=True)
+        return [self._entries[i] for _, _, i in ranked[:max_results]]
+
+    def _nearest(self, vector: Sequence[float], k: int) -> List[Tuple[int, float]]:
+        """Return up to k (entry index, cosine similarity) pairs."""
+        if not self._vectors:
+            return []
+
+        index = self._hnsw_index() if len(self._vectors) >= HNSW_MIN_ENTRIES else None
+        if index is not None:
+            k = min(k, len(self._vectors))
+            labels, distances = index.knn_query([list(vector)], k=k)
+            return [(int(i), 1.0 - float(d)) for i, d in zip(labels[0], distances[0])]
+
+        sims = [(i, _cosine(vector, v)) for i, v in enumerate(self._vectors)]
+        sims.sort(key=lambda x: x[1], reverse=True)
+        return sims[:k]
+
+    def _hnsw_index(self) -> Any:
+        """Build (once per change) an HNSW index over the entry vectors."""
+        if self._index is None:
+            try:
+                import hnswlib
+            except ImportError:
+                return None
+            index = hnswlib.Index(space="cosine", dim=len(self._vectors[0]))
+            index.init_index(
+                max_elements=len(self._vectors), M=16, ef_construction=200
+            )
+            index.add_items([list(v) for v in self._vectors], list(range(len(self._vectors))))
+            index.set_ef(50)
+            self._index = index
+        return self._index
+
+    def _embed_entry(self, entry: KnowledgeEntry) -> Sequence[float]:
+        return self._embed_fn(f"{entry.title}\n{entry.content}")
+
     def to_tool(self, name: str = "search_knowledge_base") -> ToolDefinition:
         """Convert this knowledge base into an agent tool."""
         kb = self
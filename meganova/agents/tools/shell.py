@@ -3,11 +3,42 @@
 Executes shell commands either locally or inside a sandbox container.
 """
 
+import re
+import shlex
 import subprocess
-from typing import Optional
+from typing import List, Optional
 
 from .base import ToolDefinition
 
+# Anything that needs a shell to interpret: operators, redirects, expansions,
+# globs, escapes, comments and multi-line scripts
+_SHELL_META = re.compile(r"[|&;<>()$`\\*?\[\]{}~#!\n]")
+
+
+def _simple_argv(command: str) -> Optional[List[str]]:
+    """Split a command that can run without /bin/sh, else return None."""
+    if _SHELL_META.search(command):
+        return None
+    try:
+        argv = shlex.split(command)
+    except ValueError:
+        return None
+    if not argv or "=" in argv[0]:  # empty, or a VAR=value prefix
+        return None
+    return argv
+
+
+def _run(command: str, timeout: int, working_dir: Optional[str]) -> subprocess.CompletedProcess:
+    kwargs = {"capture_output": True, "text": True, "timeout": timeout, "cwd": working_dir}
+    argv = _simple_argv(command)
+    if argv is not None:
+        # Skip the intermediate shell process for plain "prog arg ..." commands
+        try:
+            return subprocess.run(argv, **kwargs)
+        except (FileNotFoundError, PermissionError):
+            pass  # shell builtin or missing program; let sh report it
+    return subprocess.run(command, shell=True, **kwargs)
+
 
 def _execute_shell(
     command: str,
@@ -16,14 +47,7 @@ def _execute_shell(
 ) -> str:
     """Execute a shell command and return output."""
     try:
-        result = subprocess.run(
-            command,
-            shell=True,
-            capture_output=True,
-            text=True,
-            timeout=timeout,
-            cwd=working_dir,
-        )
+        result = _run(command, timeout, working_dir)
         output = result.stdout
         if result.returncode != 0:
             output += f"\nSTDERR: {result.stderr}" if result.stderr else ""
@@ -39,6 +63,7 @@ shell_tool = ToolDefinition(
     name="execute_shell",
     description="Execute a shell command and return its output. Use for running scripts, installing packages, system commands, etc.",
     func=_execute_shell,
+    parallel_safe=False,
     parameters={
         "type": "object",
         "properties": {
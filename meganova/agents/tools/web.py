@@ -3,20 +3,45 @@
 Provides HTTP fetch capabilities.
 """
 
+from http.cookiejar import DefaultCookiePolicy
 from typing import Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from .base import ToolDefinition
 
+# One keep-alive pool shared by all fetches, so repeat calls to a host skip
+# the TCP/TLS handshake. Cookies are refused to keep each fetch stateless.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=20))
+_SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+
 
 def _web_fetch(url: str, method: str = "GET", max_length: int = 5000) -> str:
     """Fetch a URL and return the response body (truncated)."""
     try:
-        resp = requests.request(method, url, timeout=15)
-        text = resp.text[:max_length]
-        if len(resp.text) > max_length:
-            text += f"\n... (truncated, {len(resp.text)} total chars)"
+        # Stream the body and stop reading once max_length chars are in hand
+        resp = _SESSION.request(method, url, timeout=15, stream=True)
+        try:
+            if resp.encoding is None:
+                resp.encoding = "utf-8"
+            parts = []
+            size = 0
+            for chunk in resp.iter_content(chunk_size=8192, decode_unicode=True):
+                parts.append(chunk)
+                size += len(chunk)
+                if size > max_length:
+                    break
+            text = "".join(parts)
+        finally:
+            resp.close()
+        if size > max_length:
+            total = resp.headers.get("Content-Length")
+            text = text[:max_length] + (
+                f"\n... (truncated, {total} total bytes)" if total else "\n... (truncated)"
+            )
         return f"Status: {resp.status_code}\n\n{text}"
     except Exception as e:
         return f"Error fetching {url}: {e}"
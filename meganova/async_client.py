@@ -1,6 +1,6 @@
 from typing import Optional
 
-from .config import PRODUCTION_API_URL, DEFAULT_TIMEOUT, MAX_RETRIES
+from .config import PRODUCTION_API_URL, DEFAULT_TIMEOUT, MAX_RETRIES, MAX_CONNECTIONS
 from .async_transport import AsyncTransport
 from .version import __version__
 from .resources.async_resources import (
@@ -28,7 +28,14 @@ class AsyncMegaNova:
         timeout: float = DEFAULT_TIMEOUT,
         max_retries: int = MAX_RETRIES,
         user_agent_extra: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        http2: bool = False,
     ):
+        """Create a client.
+
+        ``http2=True`` (needs ``pip install meganova[http2]``) lets concurrent
+        calls share a single multiplexed connection.
+        """
         if not api_key:
             raise ValueError("api_key is required")
 
@@ -42,6 +49,8 @@ class AsyncMegaNova:
             timeout=timeout,
             max_retries=max_retries,
             user_agent=user_agent,
+            max_connections=max_connections,
+            http2=http2,
         )
 
         self.chat = AsyncChat(self._transport)
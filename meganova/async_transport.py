@@ -1,6 +1,9 @@
 from typing import Any, AsyncIterator
 import json
 
+from . import _json
+from ._retry import RETRY_STATUSES, backoff, retry_after
+from .config import MAX_CONNECTIONS
 from .errors import MeganovaError, APIError, RateLimitError, AuthenticationError
 from .version import __version__
 
@@ -13,6 +16,8 @@ class AsyncTransport:
         timeout: float,
         max_retries: int,
         user_agent: str,
+        max_connections: int = MAX_CONNECTIONS,
+        http2: bool = False,
     ):
         import httpx
 
@@ -21,7 +26,17 @@ class AsyncTransport:
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent
-        self._client = httpx.AsyncClient(timeout=timeout)
+        self.max_connections = max_connections
+        # With http2, concurrent requests (asyncio.gather over completions)
+        # multiplex over one connection instead of opening one each.
+        self._client = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+        )
 
     async def request(
         self,
@@ -56,6 +71,10 @@ class AsyncTransport:
                         return response
                     return response.json()
 
+                if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                    await asyncio.sleep(backoff(attempt, retry_after(response)))
+                    continue
+
                 self._handle_error(response)
 
             except (MeganovaError, APIError, AuthenticationError, RateLimitError):
@@ -63,7 +82,7 @@ class AsyncTransport:
             except Exception as exc:
                 if attempt >= self.max_retries:
                     raise MeganovaError(f"Network error: {exc}") from exc
-                await asyncio.sleep(2 ** attempt)
+                await asyncio.sleep(backoff(attempt))
                 continue
 
         raise MeganovaError("Unexpected transport failure")
@@ -97,8 +116,7 @@ class AsyncTransport:
                 if data_str == "[DONE]":
                     break
                 try:
-                    import json as json_mod
-                    yield json_mod.loads(data_str)
+                    yield _json.loads(data_str)
                 except Exception:
                     continue
 
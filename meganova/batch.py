@@ -0,0 +1,292 @@
+"""Client-side batching of chat requests.
+
+AutoBatcher collects ``chat.completions.create`` calls made from many threads
+(for example the agents of an ``AgentTeam``) over a short window and sends
+them to a batch endpoint together, grouped into prompt-length bins so each
+batch holds prompts of similar size.
+
+run_with_checkpoint runs a bulk workload (evals, sweeps) and records each
+result in a JSONL file, so an interrupted run resumes where it stopped.
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .errors import MeganovaError
+from .models.chat import ChatResponse
+
+# Upper bounds (in estimated tokens) of the prompt-length bins
+DEFAULT_BINS: Tuple[int, ...] = (512, 2048, 8192)
+
+
+def _estimate_tokens(messages: List[Dict[str, Any]]) -> int:
+    """Rough prompt size: ~4 characters per token."""
+    return sum(len(str(m.get("content") or "")) for m in messages) // 4
+
+
+class AutoBatcher:
+    """Coalesce concurrent chat requests into batches.
+
+    Requests are only coalesced when ``batch_path`` names a batch endpoint,
+    which must accept ``{"requests": [...]}`` and answer with
+    ``{"responses": [...]}`` in the same order. Each flush happens after
+    ``max_batch`` requests or ``max_wait_ms``, whichever comes first, and is
+    split into groups by prompt length (see ``bins``), one payload per group.
+
+    Without ``batch_path`` there is nothing to coalesce into, so requests are
+    sent right away as individual calls, at most ``max_batch`` at a time.
+
+    Usage:
+        from meganova import MegaNova
+        from meganova.batch import AutoBatcher
+
+        client = MegaNova(api_key="...")
+        batcher = AutoBatcher(
+            client, max_batch=32, max_wait_ms=10, batch_path="/chat/completions/batch",
+        )
+
+        # From any number of threads:
+        response = batcher.create(
+            messages=[{"role": "user", "content": "Hello"}],
+            model="meganova-ai/manta-flash-1.0",
+        )
+
+        batcher.close()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        max_batch: int = 32,
+        max_wait_ms: float = 10,
+        bins: Sequence[int] = DEFAULT_BINS,
+        batch_path: Optional[str] = None,
+    ):
+        self.client = client
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self.bins = tuple(sorted(bins))
+        self.batch_path = batch_path
+
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.Queue()
+        self._executor = ThreadPoolExecutor(max_workers=max_batch)
+        # Guards _closed so nothing is queued behind close()'s final flush
+        self._lock = threading.Lock()
+        self._closed = False
+        self._worker: Optional[threading.Thread] = None
+        if batch_path is not None:
+            self._worker = threading.Thread(target=self._run, daemon=True)
+            self._worker.start()
+
+    def create(self, **kwargs: Any) -> Any:
+        """Same signature as ``chat.completions.create``; blocks until the batch is flushed.
+
+        Streaming requests are not batched and go straight to the API.
+        """
+        if kwargs.get("stream"):
+            return self.client.chat.completions.create(**kwargs)
+        return self.submit(**kwargs).result()
+
+    def submit(self, **kwargs: Any) -> Future:
+        """Queue a request and return a Future for its ChatResponse."""
+        future: Future = Future()
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("AutoBatcher is closed")
+            if self._worker is None:
+                self._executor.submit(self._send_one, kwargs, future)
+            else:
+                self._queue.put((kwargs, future))
+        return future
+
+    def close(self) -> None:
+        """Flush pending requests and stop the background worker."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        if self._worker is not None:
+            self._worker.join()
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "AutoBatcher":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _run(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is None:
+                return
+            pending = [first]
+            stop = False
+            deadline = time.monotonic() + self.max_wait_ms / 1000
+            while len(pending) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                pending.append(item)
+
+            for group in self._bin(pending):
+                self._flush(group)
+            if stop:
+                return
+
+    def _bin(
+        self, pending: List[Tuple[Dict[str, Any], Future]]
+    ) -> List[List[Tuple[Dict[str, Any], Future]]]:
+        """Split a flush into groups of similar prompt length."""
+        groups: Dict[int, List[Tuple[Dict[str, Any], Future]]] = {}
+        for item in pending:
+            size = _estimate_tokens(item[0].get("messages", []))
+            slot = next(
+                (i for i, bound in enumerate(self.bins) if size <= bound),
+                len(self.bins),
+            )
+            groups.setdefault(slot, []).append(item)
+        return [groups[slot] for slot in sorted(groups)]
+
+    def _flush(self, group: List[Tuple[Dict[str, Any], Future]]) -> None:
+        if len(group) > 1:
+            try:
+                data = self.client._transport.request(
+                    "POST",
+                    self.batch_path,
+                    json={"requests": [kwargs for kwargs, _ in group]},
+                )
+                responses = data["responses"]
+                if len(responses) != len(group):
+                    raise MeganovaError(
+                        f"Batch endpoint returned {len(responses)} responses "
+                        f"for {len(group)} requests"
+                    )
+                for (_, future), item in zip(group, responses):
+                    future.set_result(ChatResponse(**item))
+            except Exception as e:
+                for _, future in group:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for kwargs, future in group:
+            self._executor.submit(self._send_one, kwargs, future)
+
+    def _send_one(self, kwargs: Dict[str, Any], future: Future) -> None:
+        try:
+            future.set_result(self.client.chat.completions.create(**kwargs))
+        except Exception as e:
+            future.set_exception(e)
+
+
+class CheckpointResults(Dict[str, Any]):
+    """Results of ``run_with_checkpoint`` keyed by task id.
+
+    ``errors`` maps each task whose ``fn`` raised during this run to the
+    exception, so a failed task can be told apart from one that never ran.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.errors: Dict[str, Exception] = {}
+
+
+def run_with_checkpoint(
+    tasks: Iterable[Tuple[str, Any]],
+    path: str,
+    fn: Callable[[Any], Any],
+    max_workers: int = 4,
+) -> CheckpointResults:
+    """Run ``fn(payload)`` for each ``(task_id, payload)``, checkpointing to JSONL.
+
+    Each success is appended to ``path`` as ``{"id": task_id, "result": ...}``
+    and flushed immediately. Task ids already in the file are not run again;
+    their saved results are returned instead. Tasks whose ``fn`` raises are not
+    recorded, so the next run retries them.
+
+    Args:
+        tasks: ``(task_id, payload)`` pairs. Ids must be strings (they are
+            stored as JSON object values and must compare equal after a
+            reload); results must be JSON-serializable.
+        path: JSONL checkpoint file (created if missing).
+        fn: Function run on each payload.
+        max_workers: Number of tasks run concurrently.
+
+    Returns:
+        CheckpointResults mapping task_id -> result for every task that has
+        completed, now or in an earlier run. Tasks that failed in this run
+        are listed in its ``errors`` instead.
+
+    Raises:
+        TypeError: If a task id is not a string.
+
+    Usage:
+        results = run_with_checkpoint(
+            [(name, prompt) for name, prompt in eval_set.items()],
+            "eval_results.jsonl",
+            lambda prompt: client.chat.completions.create(
+                messages=[{"role": "user", "content": prompt}], model=model,
+            ).choices[0].message.content,
+        )
+        for name, error in results.errors.items():
+            print(f"{name} failed: {error}")
+    """
+    tasks = list(tasks)
+    for task_id, _ in tasks:
+        if not isinstance(task_id, str):
+            raise TypeError(f"task ids must be strings, got {type(task_id).__name__}")
+
+    done: Dict[str, Any] = {}
+    terminated = True
+    if os.path.exists(path):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                terminated = line.endswith("\n")
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # partial line from an interrupted write
+                done[record["id"]] = record["result"]
+
+    results = CheckpointResults()
+    results.update((task_id, done[task_id]) for task_id, _ in tasks if task_id in done)
+    pending = [(task_id, payload) for task_id, payload in tasks if task_id not in done]
+    if not pending:
+        return results
+
+    lock = threading.Lock()
+    with open(path, "a", encoding="utf-8") as out:
+        if not terminated:
+            out.write("\n")
+
+        def run(task: Tuple[str, Any]) -> None:
+            task_id, payload = task
+            try:
+                result = fn(payload)
+            except Exception as e:
+                with lock:
+                    results.errors[task_id] = e
+                return
+            with lock:
+                out.write(json.dumps({"id": task_id, "result": result}) + "\n")
+                out.flush()
+                results[task_id] = result
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(run, pending))
+
+    return results
@@ -0,0 +1,393 @@
+"""Client-side response caching.
+
+SemanticChatCache serves repeated or near-duplicate chat requests from a local
+SQLite store instead of calling the model again. Requests are compared by the
+cosine similarity of an embedding of their conversation text.
+
+EmbeddingCache memoizes an embedding function, so the same text is only
+embedded once.
+"""
+
+import asyncio
+import hashlib
+import heapq
+import json
+import math
+import operator
+import sqlite3
+import threading
+import time
+from array import array
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .models.chat import ChatResponse
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - depends on the environment
+    numpy = None
+
+EmbedFn = Callable[[str], Sequence[float]]
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> array:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector
+
+
+def _norm(vector: Sequence[float]) -> float:
+    return math.sqrt(sum(x * x for x in vector))
+
+
+if hasattr(math, "sumprod"):  # Python 3.12+
+    _dot = math.sumprod
+else:  # pragma: no cover - depends on the Python version
+    def _dot(a: Sequence[float], b: Sequence[float]) -> float:
+        return sum(map(operator.mul, a, b))
+
+
+def _similarities(
+    query: Sequence[float], query_norm: float, rows: List[Tuple[bytes, float]]
+) -> Sequence[float]:
+    """Cosine similarity of ``query`` to each (packed embedding, norm) row."""
+    if numpy is not None:
+        matrix = numpy.frombuffer(b"".join(blob for blob, _ in rows), dtype=numpy.float32)
+        matrix = matrix.reshape(len(rows), len(query))
+        norms = numpy.array([norm for _, norm in rows]) * query_norm
+        return (matrix @ numpy.asarray(query, dtype=numpy.float32)) / norms
+    return [_dot(query, _unpack(blob)) / (query_norm * norm) for blob, norm in rows]
+
+
+class EmbeddingCache:
+    """Memoize an embedding function, keyed by exact text.
+
+    Eviction keeps both recently used and frequently used texts: when full,
+    the lowest-scoring tenth of entries is dropped, where
+    ``score = recency_weight * recency + count_weight * log(1 + hits)``
+    and recency runs from 0 (oldest) to 1 (just used).
+
+    Usage:
+        embed = EmbeddingCache(
+            lambda text: client.embeddings.create(input=text, model="BAAI/bge-m3").data[0].embedding
+        )
+
+        kb = KnowledgeBase(entries, embed_fn=embed)
+        cache = SemanticChatCache(client, embed)
+        team.add(agent, condition=lambda prompt: similarity(embed(prompt), topic) > 0.5)
+    """
+
+    def __init__(
+        self,
+        embed: EmbedFn,
+        max_items: int = 10_000,
+        recency_weight: float = 1.0,
+        count_weight: float = 0.5,
+    ):
+        self.embed = embed
+        self.max_items = max_items
+        self.recency_weight = recency_weight
+        self.count_weight = count_weight
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._tick = 0
+        # text -> [vector, hit count, last used tick]
+        self._entries: Dict[str, List[Any]] = {}
+
+    def __call__(self, text: str) -> Sequence[float]:
+        with self._lock:
+            self._tick += 1
+            entry = self._entries.get(text)
+            if entry is not None:
+                entry[1] += 1
+                entry[2] = self._tick
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+
+        vector = self.embed(text)
+
+        with self._lock:
+            if text not in self._entries and len(self._entries) >= self.max_items:
+                self._evict()
+            self._entries[text] = [vector, 0, self._tick]
+        return vector
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _evict(self) -> None:
+        oldest = min(e[2] for e in self._entries.values())
+        span = max(self._tick - oldest, 1)
+
+        def score(item: Tuple[str, List[Any]]) -> float:
+            _, (_, count, used) = item
+            recency = (used - oldest) / span
+            return self.recency_weight * recency + self.count_weight * math.log1p(count)
+
+        drop = max(len(self._entries) // 10, 1)
+        for text, _ in heapq.nsmallest(drop, self._entries.items(), key=score):
+            del self._entries[text]
+
+
+class SemanticChatCache:
+    """Semantic cache in front of ``client.chat.completions.create``.
+
+    Entries are namespaced by model, system prompt and every other request
+    parameter (tools, ``tool_choice``, ``temperature``, ``max_tokens``, ...),
+    so requests that could produce different answers never share one. Expired
+    entries are deleted as they are found, and at most ``max_entries`` are
+    kept (oldest dropped first), so lookups scan a bounded table.
+
+    Each lookup compares the query against every live entry in its namespace,
+    about ``max_entries * dimensions`` multiply-adds (1M for the default cap
+    and 1024-dimension embeddings). The scan uses numpy when it is installed;
+    raise ``max_entries`` much further only with numpy available.
+
+    Usage:
+        from meganova import MegaNova
+        from meganova.cache import SemanticChatCache
+
+        client = MegaNova(api_key="...")
+
+        def embed(text: str) -> list:
+            resp = client.embeddings.create(input=text, model="BAAI/bge-m3")
+            return resp.data[0].embedding
+
+        cache = SemanticChatCache(client, embed, path="chat_cache.db")
+        response = cache.create(
+            messages=[{"role": "user", "content": "What is the capital of France?"}],
+            model="meganova-ai/manta-flash-1.0",
+        )
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        embed: EmbedFn,
+        path: str = ":memory:",
+        threshold: float = 0.9,
+        ttl: Optional[float] = 3600.0,
+        max_temperature: float = 0.7,
+        max_entries: Optional[int] = 1_000,
+    ):
+        self.client = client
+        self.embed = embed
+        self.threshold = threshold
+        self.ttl = ttl
+        self.max_temperature = max_temperature
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS chat_cache ("
+            " namespace TEXT NOT NULL,"
+            " embedding BLOB NOT NULL,"
+            " norm REAL NOT NULL,"
+            " response TEXT NOT NULL,"
+            " expires_at REAL)"
+        )
+        self._db.execute(
+            "CREATE INDEX IF NOT EXISTS chat_cache_ns ON chat_cache (namespace)"
+        )
+        self._db.commit()
+
+    def create(
+        self,
+        *,
+        messages: List[Dict[str, Any]],
+        model: str,
+        no_cache: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Same signature as ``chat.completions.create``, served from cache when possible.
+
+        Streaming requests, requests with ``temperature`` above
+        ``max_temperature`` and ``no_cache=True`` calls always go to the API.
+        """
+        key = self._cache_key(messages, model, no_cache, kwargs)
+        if key is None:
+            return self.client.chat.completions.create(
+                messages=messages, model=model, **kwargs
+            )
+
+        cached = self.lookup(*key)
+        with self._lock:
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        response = self.client.chat.completions.create(
+            messages=messages, model=model, **kwargs
+        )
+        self.store(*key, response)
+        return response
+
+    async def acreate(
+        self,
+        client: Any,
+        *,
+        messages: List[Dict[str, Any]],
+        model: str,
+        no_cache: bool = False,
+        **kwargs: Any,
+    ) -> Any:
+        """Async ``create`` that calls ``client`` (an AsyncMegaNova) on a miss.
+
+        Embedding and SQLite access run on a worker thread.
+        """
+        key = await asyncio.to_thread(self._cache_key, messages, model, no_cache, kwargs)
+        if key is None:
+            return await client.chat.completions.create(
+                messages=messages, model=model, **kwargs
+            )
+
+        cached = await asyncio.to_thread(self.lookup, *key)
+        with self._lock:
+            if cached is not None:
+                self.hits += 1
+                return cached
+            self.misses += 1
+
+        response = await client.chat.completions.create(
+            messages=messages, model=model, **kwargs
+        )
+        await asyncio.to_thread(self.store, *key, response)
+        return response
+
+    def _cache_key(
+        self,
+        messages: List[Dict[str, Any]],
+        model: str,
+        no_cache: bool,
+        kwargs: Dict[str, Any],
+    ) -> Optional[Tuple[str, Sequence[float]]]:
+        """Return (namespace, embedding) for a cacheable request, else None."""
+        temperature = kwargs.get("temperature")
+        if (
+            no_cache
+            or kwargs.get("stream")
+            or (temperature is not None and temperature > self.max_temperature)
+        ):
+            return None
+        namespace = self._namespace(model, messages, kwargs)
+        return namespace, self.embed(self._conversation_text(messages))
+
+    def lookup(self, namespace: str, query: Sequence[float]) -> Optional[ChatResponse]:
+        """Return the most similar live entry above the threshold, if any."""
+        query_norm = _norm(query)
+        if query_norm == 0:
+            return None
+
+        with self._lock:
+            if self._purge_expired():
+                self._db.commit()
+            rows = self._db.execute(
+                "SELECT embedding, norm, response FROM chat_cache WHERE namespace = ?",
+                (namespace,),
+            ).fetchall()
+
+        # Only vectors of the query's size are comparable (the embedding
+        # function may have changed since older rows were written)
+        size = len(query) * array("f").itemsize
+        rows = [row for row in rows if row[1] != 0 and len(row[0]) == size]
+        if not rows:
+            return None
+        scores = _similarities(query, query_norm, [(blob, norm) for blob, norm, _ in rows])
+
+        best_score = self.threshold
+        best: Optional[str] = None
+        for (_, _, response), score in zip(rows, scores):
+            if score >= best_score:
+                best_score = score
+                best = response
+
+        if best is None:
+            return None
+        return ChatResponse.model_validate_json(best)
+
+    def store(
+        self, namespace: str, embedding: Sequence[float], response: ChatResponse
+    ) -> None:
+        """Add a response to the cache."""
+        expires_at = time.time() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            self._db.execute(
+                "INSERT INTO chat_cache (namespace, embedding, norm, response, expires_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (
+                    namespace,
+                    _pack(embedding),
+                    _norm(embedding),
+                    response.model_dump_json(),
+                    expires_at,
+                ),
+            )
+            self._purge_expired()
+            if self.max_entries is not None:
+                self._db.execute(
+                    "DELETE FROM chat_cache WHERE rowid <= ("
+                    " SELECT rowid FROM chat_cache ORDER BY rowid DESC LIMIT 1 OFFSET ?)",
+                    (self.max_entries,),
+                )
+            self._db.commit()
+
+    def _purge_expired(self) -> int:
+        """Delete expired rows (caller holds the lock); returns how many."""
+        return self._db.execute(
+            "DELETE FROM chat_cache WHERE expires_at IS NOT NULL AND expires_at <= ?",
+            (time.time(),),
+        ).rowcount
+
+    def clear(self) -> None:
+        """Remove all cached entries."""
+        with self._lock:
+            self._db.execute("DELETE FROM chat_cache")
+            self._db.commit()
+
+    def close(self) -> None:
+        self._db.close()
+
+    @staticmethod
+    def _namespace(
+        model: str,
+        messages: List[Dict[str, Any]],
+        params: Dict[str, Any],
+    ) -> str:
+        """Hash the parts of a request that must match exactly.
+
+        That is the model, the system prompt and all other request
+        parameters; unset (None) parameters are left out.
+        """
+        system = [m.get("content") for m in messages if m.get("role") == "system"]
+        params = {k: v for k, v in params.items() if v is not None and k != "stream"}
+        key = json.dumps([model, system, params], sort_keys=True, default=str)
+        return hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _conversation_text(messages: List[Dict[str, Any]]) -> str:
+        """Flatten the non-system messages into the text that gets embedded."""
+        lines = []
+        for m in messages:
+            if m.get("role") == "system":
+                continue
+            line = f"{m.get('role')}: {m.get('content') or ''}"
+            for tc in m.get("tool_calls") or []:
+                function = tc.get("function", {})
+                line += f" [{function.get('name')}({function.get('arguments')})]"
+            lines.append(line)
+        return "\n".join(lines)
@@ -1,19 +1,52 @@
-from typing import Optional
+import importlib
+import threading
+from typing import TYPE_CHECKING, Any, Optional
 
-from .config import PRODUCTION_API_URL, DEFAULT_TIMEOUT, MAX_RETRIES
+from .config import PRODUCTION_API_URL, DEFAULT_TIMEOUT, MAX_RETRIES, MAX_CONNECTIONS
 from .transport import SyncTransport
 from .version import __version__
-from .resources.chat import Chat
-from .resources.models_ import ModelsResource
-from .resources.usage import UsageResource
-from .resources.billing import BillingResource
-from .resources.serverless import ServerlessResource
-from .resources.images import ImagesResource
-from .resources.audio import AudioResource
-from .resources.embeddings import EmbeddingsResource
-from .resources.videos import VideosResource
+
+if TYPE_CHECKING:
+    import requests
+
+    from .resources.audio import AudioResource
+    from .resources.billing import BillingResource
+    from .resources.chat import Chat
+    from .resources.embeddings import EmbeddingsResource
+    from .resources.images import ImagesResource
+    from .resources.models_ import ModelsResource
+    from .resources.serverless import ServerlessResource
+    from .resources.usage import UsageResource
+    from .resources.videos import VideosResource
+
+# Resources are imported and built on first access, so a client that only
+# lists models never loads the chat or media response models.
+_RESOURCES = {
+    "chat": (".resources.chat", "Chat"),
+    "models": (".resources.models_", "ModelsResource"),
+    "usage": (".resources.usage", "UsageResource"),
+    "billing": (".resources.billing", "BillingResource"),
+    "serverless": (".resources.serverless", "ServerlessResource"),
+    "images": (".resources.images", "ImagesResource"),
+    "audio": (".resources.audio", "AudioResource"),
+    "embeddings": (".resources.embeddings", "EmbeddingsResource"),
+    "videos": (".resources.videos", "VideosResource"),
+}
+# Serializes first access, so threads sharing a client get one instance
+# of each resource (and of its response cache)
+_RESOURCES_LOCK = threading.Lock()
 
 class MegaNova:
+    chat: "Chat"
+    models: "ModelsResource"
+    usage: "UsageResource"
+    billing: "BillingResource"
+    serverless: "ServerlessResource"
+    images: "ImagesResource"
+    audio: "AudioResource"
+    embeddings: "EmbeddingsResource"
+    videos: "VideosResource"
+
     def __init__(
         self,
         api_key: str,
@@ -22,7 +55,19 @@ class MegaNova:
         max_retries: int = MAX_RETRIES,
         region: str = "auto",
         user_agent_extra: Optional[str] = None,
+        max_connections: int = MAX_CONNECTIONS,
+        session: Optional["requests.Session"] = None,
+        warmup: bool = False,
     ):
+        """Create a client.
+
+        Pass ``session`` to share one ``requests.Session`` (and its warm
+        connections) between several clients, e.g. short-lived clients in a
+        worker process. A shared session is not closed by ``close()``.
+
+        With ``warmup=True`` a background thread connects to ``base_url``
+        right away, so the first call doesn't pay for DNS and TLS setup.
+        """
         if not api_key:
             raise ValueError("api_key is required")
 
@@ -36,14 +81,30 @@ class MegaNova:
             timeout=timeout,
             max_retries=max_retries,
             user_agent=user_agent,
+            max_connections=max_connections,
+            session=session,
         )
+        if warmup:
+            self._transport.warmup()
+
+    def __getattr__(self, name: str) -> Any:
+        # Only called when normal lookup fails, i.e. on a resource's first use
+        if name in _RESOURCES:
+            with _RESOURCES_LOCK:
+                resource = self.__dict__.get(name)
+                if resource is None:
+                    module, cls = _RESOURCES[name]
+                    resource_cls = getattr(importlib.import_module(module, __package__), cls)
+                    resource = resource_cls(self._transport)
+                    setattr(self, name, resource)
+            return resource
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    def close(self):
+        self._transport.close()
+
+    def __enter__(self):
+        return self
 
-        self.chat = Chat(self._transport)
-        self.models = ModelsResource(self._transport)
-        self.usage = UsageResource(self._transport)
-        self.billing = BillingResource(self._transport)
-        self.serverless = ServerlessResource(self._transport)
-        self.images = ImagesResource(self._transport)
-        self.audio = AudioResource(self._transport)
-        self.embeddings = EmbeddingsResource(self._transport)
-        self.videos = VideosResource(self._transport)
+    def __exit__(self, *args):
+        self.close()
@@ -1,11 +1,17 @@
-from .agent import CloudAgent, Conversation
-from .models import (
-    AgentChatResponse,
-    AgentInfo,
-    ChatCompletionChunk,
-    ChatCompletionResponse,
-    PendingToolCall,
-)
+import importlib
+from typing import Any
+
+# Loaded on first attribute access (PEP 562) so importing the package, or just
+# its transport, doesn't build the pydantic response schemas.
+_LAZY = {
+    "CloudAgent": ".agent",
+    "Conversation": ".agent",
+    "AgentChatResponse": ".models",
+    "AgentInfo": ".models",
+    "ChatCompletionChunk": ".models",
+    "ChatCompletionResponse": ".models",
+    "PendingToolCall": ".models",
+}
 
 __all__ = [
     "CloudAgent",
@@ -16,3 +22,15 @@ __all__ = [
     "ChatCompletionResponse",
     "PendingToolCall",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        value = getattr(importlib.import_module(_LAZY[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 from typing import Any, Dict, Iterator, List, Optional, Union
 
+from pydantic import TypeAdapter, ValidationError
+
 from ..config import CLOUD_API_URL, DEFAULT_TIMEOUT, MAX_RETRIES
 from ..errors import MeganovaError
 from .models import (
@@ -15,6 +17,11 @@ from .models import (
 )
 from .transport import CloudTransport
 
+# Prebuilt validators for the per-message and per-chunk hot paths; calling
+# them directly skips model_validate's classmethod dispatch
+_CHAT_ADAPTER = TypeAdapter(AgentChatResponse)
+_CHUNK_ADAPTER = TypeAdapter(ChatCompletionChunk)
+
 
 class CloudAgent:
     """Client for a deployed MegaNova Cloud agent.
@@ -92,7 +99,7 @@ class CloudAgent:
             body["extra_data"] = extra_data
 
         data = self._transport.request("POST", f"{self._base_path}/chat", json_body=body)
-        return AgentChatResponse.model_validate(data)
+        return _CHAT_ADAPTER.validate_python(data)
 
     def confirm_tool(
         self,
@@ -112,7 +119,7 @@ class CloudAgent:
             raise MeganovaError(f"action must be 'approve' or 'reject', got '{action}'")
         body = {"approval_id": approval_id, "action": action}
         data = self._transport.request("POST", f"{self._base_path}/confirm-tool", json_body=body)
-        return AgentChatResponse.model_validate(data)
+        return _CHAT_ADAPTER.validate_python(data)
 
     def completions(
         self,
@@ -154,8 +161,14 @@ class CloudAgent:
     def _stream_completions(
         self, path: str, body: Dict[str, Any]
     ) -> Iterator[ChatCompletionChunk]:
-        for chunk_data in self._transport.stream_sse(path, json_body=body):
-            yield ChatCompletionChunk.model_validate(chunk_data)
+        # Parse and validate each payload in one step in pydantic-core
+        for data in self._transport.stream_sse_data(path, json_body=body):
+            try:
+                yield _CHUNK_ADAPTER.validate_json(data)
+            except ValidationError as e:
+                if any(err["type"] == "json_invalid" for err in e.errors()):
+                    continue  # malformed event; stream_sse skips these too
+                raise
 
     def conversation(self, conversation_id: Optional[str] = None) -> "Conversation":
         """Create a stateful conversation helper.
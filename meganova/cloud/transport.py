@@ -1,12 +1,45 @@
-import json
+import atexit
+import threading
 import time
-from typing import Any, Iterator
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Iterator
 
 import requests
 
+from .. import _json
+from .._retry import RETRY_STATUSES, backoff, retry_after
 from ..errors import MeganovaError, APIError, RateLimitError, AuthenticationError
 from ..version import __version__
 
+_HEADERS = {
+    "User-Agent": f"meganova-python/{__version__}",
+    "X-MN-SDK": "python",
+}
+_JSON_HEADERS = {**_HEADERS, "Content-Type": "application/json"}
+
+# One keep-alive session per base URL, shared by every CloudAgent. Agents
+# authenticate by URL path, so cookies are refused to keep one agent's server
+# state from leaking into another's requests.
+_SESSIONS: Dict[str, requests.Session] = {}
+_sessions_lock = threading.Lock()
+
+
+def _shared_session(base_url: str) -> requests.Session:
+    with _sessions_lock:
+        session = _SESSIONS.get(base_url)
+        if session is None:
+            session = _SESSIONS[base_url] = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        return session
+
+
+@atexit.register
+def _close_sessions() -> None:
+    with _sessions_lock:
+        for session in _SESSIONS.values():
+            session.close()
+        _SESSIONS.clear()
+
 
 class CloudTransport:
     """HTTP transport for MegaNova Cloud Agent API.
@@ -19,7 +52,7 @@ class CloudTransport:
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
-        self._session = requests.Session()
+        self._session = _shared_session(self.base_url)
 
     def request(
         self,
@@ -31,12 +64,7 @@ class CloudTransport:
         stream: bool = False,
     ) -> Any:
         url = f"{self.base_url}{path}"
-        headers = {
-            "User-Agent": f"meganova-python/{__version__}",
-            "X-MN-SDK": "python",
-        }
-        if json_body is not None:
-            headers["Content-Type"] = "application/json"
+        headers = _HEADERS if json_body is None else _JSON_HEADERS
 
         for attempt in range(self.max_retries + 1):
             try:
@@ -55,31 +83,46 @@ class CloudTransport:
                         return response
                     return response.json()
 
+                if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                    response.close()
+                    time.sleep(backoff(attempt, retry_after(response)))
+                    continue
+
                 self._handle_error(response)
 
             except requests.RequestException as exc:
                 if attempt >= self.max_retries:
                     raise MeganovaError(f"Network error: {exc}") from exc
-                time.sleep(2 ** attempt)
+                time.sleep(backoff(attempt))
                 continue
 
         raise MeganovaError("Unexpected transport failure")
 
     def stream_sse(self, path: str, *, json_body: Any | None = None) -> Iterator[dict]:
         """Stream SSE events from a POST endpoint, yielding parsed data dicts."""
+        for data in self.stream_sse_data(path, json_body=json_body):
+            try:
+                yield _json.loads(data)
+            except _json.JSONDecodeError:
+                continue
+
+    def stream_sse_data(self, path: str, *, json_body: Any | None = None) -> Iterator[bytes]:
+        """Stream SSE events from a POST endpoint, yielding each raw data payload.
+
+        Lets callers that validate JSON themselves (e.g. pydantic's
+        ``model_validate_json``) skip building an intermediate dict.
+        """
         response = self.request("POST", path, json_body=json_body, stream=True)
         try:
-            for line in response.iter_lines(decode_unicode=True):
-                if not line:
+            # Lines stay bytes: the JSON parser takes UTF-8 directly, so no
+            # line is ever decoded to str
+            for line in response.iter_lines():
+                if not line.startswith(b"data: "):
                     continue
-                if line.startswith("data: "):
-                    data_str = line[6:]
-                    if data_str.strip() == "[DONE]":
-                        break
-                    try:
-                        yield json.loads(data_str)
-                    except json.JSONDecodeError:
-                        continue
+                data = line[6:]
+                if data.strip() == b"[DONE]":
+                    break
+                yield data
         finally:
             response.close()
 
@@ -2,3 +2,4 @@ PRODUCTION_API_URL = "https://api.meganova.ai/v1"
 CLOUD_API_URL = "https://studio-api.meganova.ai"
 DEFAULT_TIMEOUT = 60.0
 MAX_RETRIES = 2
+MAX_CONNECTIONS = 16
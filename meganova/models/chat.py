@@ -55,3 +55,4 @@ class ChatStreamChunk(BaseModel):
     created: int
     model: str
     choices: List[ChatStreamChunkChoice]
+    usage: Optional[TokenUsage] = None
@@ -0,0 +1,69 @@
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from ..errors import MeganovaError
+
+
+class ResponseCache:
+    """Keeps the last response per key for rarely-changing listings.
+
+    Responses are always recorded; ``get`` only serves one when the caller
+    passes ``max_age``. A cached copy of any age is served when the refresh
+    fails with a network or 5xx error. Concurrent ``get`` calls for the same
+    key share one fetch (single-flight).
+    """
+
+    def __init__(self) -> None:
+        self._entries: Dict[Hashable, Tuple[float, Any]] = {}
+        self._inflight: Dict[Hashable, Future] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, max_age: Optional[float], fetch: Callable[[], Any]) -> Any:
+        entry = self._entries.get(key)
+        if (
+            max_age is not None
+            and entry is not None
+            and time.monotonic() - entry[0] <= max_age
+        ):
+            return entry[1]
+
+        with self._lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            # Another thread is already fetching this key; reuse its outcome
+            return future.result()
+
+        try:
+            data = self._refresh(key, entry, max_age, fetch)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(data)
+            return data
+        finally:
+            with self._lock:
+                del self._inflight[key]
+
+    def _refresh(
+        self,
+        key: Hashable,
+        entry: Optional[Tuple[float, Any]],
+        max_age: Optional[float],
+        fetch: Callable[[], Any],
+    ) -> Any:
+        try:
+            data = fetch()
+        except MeganovaError as e:
+            transient = e.status is None or e.status >= 500
+            if max_age is None or entry is None or not transient:
+                raise
+            return entry[1]
+
+        self._entries[key] = (time.monotonic(), data)
+        return data
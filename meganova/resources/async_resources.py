@@ -1,6 +1,8 @@
 import json
 from typing import AsyncIterator, Optional, Union, List, Dict, Any
 
+from pydantic import TypeAdapter
+
 from ..async_transport import AsyncTransport
 from ..models.chat import ChatResponse, ChatStreamChunk
 from ..models.embeddings import EmbeddingResponse
@@ -11,6 +13,10 @@ from ..models.audio import TranscriptionResponse
 from ..errors import MeganovaError
 
 
+# Validates the whole catalog in one pydantic-core call
+_MODELS_ADAPTER = TypeAdapter(List[ModelInfo])
+
+
 class AsyncCompletions:
     def __init__(self, transport: AsyncTransport):
         self._transport = transport
@@ -198,7 +204,7 @@ class AsyncModelsResource:
     ) -> List[ModelInfo]:
         data = await self._transport.request("GET", "/models")
         raw_models = data.get("data", [])
-        models = [ModelInfo(**m) for m in raw_models]
+        models = _MODELS_ADAPTER.validate_python(raw_models)
 
         if capability:
             models = [
@@ -1,5 +1,7 @@
+import contextlib
+import os
 from pathlib import Path
-from typing import BinaryIO, Tuple, Union
+from typing import BinaryIO, Union
 from ..transport import SyncTransport
 from ..models.audio import TranscriptionResponse
 
@@ -25,22 +27,18 @@ class AudioResource:
         Returns:
             TranscriptionResponse containing the transcribed text.
         """
-        if isinstance(file, (str, Path)):
-            path = Path(file)
-            with open(path, "rb") as f:
-                files = {
-                    "file": (path.name, f, "audio/mpeg"),
-                }
-                data = {"model": model}
-                result = self._transport.request(
-                    "POST", "/audio/transcriptions", files=files, data=data,
-                )
+        if isinstance(file, (str, os.PathLike)):
+            path = os.fspath(file)
+            filename = os.path.basename(path)
+            # A 1 MiB read buffer keeps syscalls down while the upload streams
+            ctx = open(path, "rb", buffering=1 << 20)
         else:
-            files = {
-                "file": (filename, file, "audio/mpeg"),
-            }
-            data = {"model": model}
+            ctx = contextlib.nullcontext(file)
+        with ctx as f:
             result = self._transport.request(
-                "POST", "/audio/transcriptions", files=files, data=data,
+                "POST",
+                "/audio/transcriptions",
+                files={"file": (filename, f, "audio/mpeg")},
+                data={"model": model},
             )
         return TranscriptionResponse(**result)
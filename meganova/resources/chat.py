@@ -1,5 +1,5 @@
 from typing import Iterator, Optional, List, Union, Dict, Any
-import json
+from .. import _json
 from ..transport import SyncTransport
 from ..models.chat import ChatResponse, ChatStreamChunk
 
@@ -46,19 +46,18 @@ class Completions:
             "POST", "/chat/completions", json=payload, stream=True
         )
 
+        # Work on the raw bytes: _json.loads (orjson when installed) parses
+        # UTF-8 directly, so lines are never decoded to str
         for line in response.iter_lines():
-            if not line:
-                continue
-
-            line_text = line.decode("utf-8").strip()
-            if line_text.startswith("data: "):
-                data_str = line_text[6:]
-                if data_str == "[DONE]":
+            line = line.strip()
+            if line.startswith(b"data: "):
+                data = line[6:]
+                if data == b"[DONE]":
                     break
                 try:
-                    data_json = json.loads(data_str)
+                    data_json = _json.loads(data)
                     yield ChatStreamChunk(**data_json)
-                except json.JSONDecodeError:
+                except _json.JSONDecodeError:
                     continue
 
 
@@ -1,21 +1,43 @@
 from typing import List, Optional
+
+from pydantic import TypeAdapter
+
 from ..transport import SyncTransport
 from ..models.models_ import ModelInfo
+from ._cache import ResponseCache
+
+
+# Validates the whole catalog in one pydantic-core call
+_MODELS_ADAPTER = TypeAdapter(List[ModelInfo])
 
 
 class ModelsResource:
     def __init__(self, transport: SyncTransport):
         self._transport = transport
+        self._cache = ResponseCache()
 
     def list(
         self,
         *,
         capability: Optional[str] = None,
         type: Optional[str] = None,
+        max_age: Optional[float] = None,
     ) -> List[ModelInfo]:
-        data = self._transport.request("GET", "/models")
+        """List available models.
+
+        Args:
+            capability: Only models with this capability enabled.
+            type: Only models tagged with this type.
+            max_age: Reuse the catalog this resource fetched within the last
+                ``max_age`` seconds instead of calling the API. If a refresh
+                fails with a network or 5xx error, the last catalog is
+                returned instead.
+        """
+        data = self._cache.get(
+            "/models", max_age, lambda: self._transport.request("GET", "/models")
+        )
         raw_models = data.get("data", [])
-        models = [ModelInfo(**m) for m in raw_models]
+        models = _MODELS_ADAPTER.validate_python(raw_models)
 
         if capability:
             models = [
@@ -1,27 +1,41 @@
-from typing import List
+from typing import List, Optional
 from ..transport import SyncTransport
 from ..models.serverless import ServerlessModel, ServerlessModelsResponse
+from ._cache import ResponseCache
 
 
 class ServerlessResource:
     def __init__(self, transport: SyncTransport):
         self._transport = transport
+        self._cache = ResponseCache()
 
-    def list_models(self, modality: str = "text_generation") -> ServerlessModelsResponse:
+    def list_models(
+        self,
+        modality: str = "text_generation",
+        max_age: Optional[float] = None,
+    ) -> ServerlessModelsResponse:
         """List available serverless models filtered by modality.
 
         Args:
             modality: Filter by modality, e.g. "text_generation" or "text_to_image".
+            max_age: Reuse the list this resource fetched for ``modality``
+                within the last ``max_age`` seconds instead of calling the
+                API. If a refresh fails with a network or 5xx error, the
+                last list is returned instead.
 
         Returns:
             ServerlessModelsResponse with models list and count.
         """
         # The serverless endpoint uses /api/v1/ instead of the standard /v1/ base.
-        data = self._transport.request(
-            "GET",
-            "/api/v1/serverless/models/filter",
-            params={"modality": modality},
-            base_url_override=self._transport.base_url.replace("/v1", ""),
+        data = self._cache.get(
+            modality,
+            max_age,
+            lambda: self._transport.request(
+                "GET",
+                "/api/v1/serverless/models/filter",
+                params={"modality": modality},
+                base_url_override=self._transport.base_url.replace("/v1", ""),
+            ),
         )
         # Response: {"data": {"models": [...], "count": N}}
         inner = data.get("data", data)
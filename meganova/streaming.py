@@ -0,0 +1,88 @@
+"""Helpers for rendering streamed output.
+
+StreamPrinter writes streamed text from a background thread, so the loop that
+reads chunks off the network never waits on terminal I/O.
+"""
+
+import io
+import os
+import queue
+import sys
+import threading
+from typing import Any, List, Optional, TextIO
+
+
+class StreamPrinter:
+    """Write text pieces to a stream from a background thread.
+
+    Pieces arriving within ``window_ms`` of each other are joined and written
+    with a single ``write`` + ``flush``. When writing to stdout (the default),
+    text goes straight to the file descriptor with ``os.write``, skipping the
+    TextIOWrapper's locking and buffering.
+
+    Usage:
+        with StreamPrinter() as printer:
+            for chunk in client.chat.completions.create(..., stream=True):
+                printer.write(chunk.choices[0].delta.get("content", ""))
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None, window_ms: float = 5):
+        self.stream = stream if stream is not None else sys.stdout
+        self.window_ms = window_ms
+        self._fd: Optional[int] = None
+        if stream is None:
+            try:
+                self._fd = sys.stdout.fileno()
+            except (AttributeError, OSError, io.UnsupportedOperation):
+                pass
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._thread = threading.Thread(target=self._drain, daemon=True)
+        self._thread.start()
+
+    def write(self, text: Optional[str]) -> None:
+        """Queue text for output; never blocks on the stream."""
+        if text:
+            self._queue.put(text)
+
+    def close(self) -> None:
+        """Write everything queued so far and stop the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+    def __enter__(self) -> "StreamPrinter":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def _drain(self) -> None:
+        timeout = self.window_ms / 1000
+        while True:
+            piece = self._queue.get()
+            if piece is None:
+                return
+            pieces: List[str] = [piece]
+            done = False
+            while True:
+                try:
+                    piece = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if piece is None:
+                    done = True
+                    break
+                pieces.append(piece)
+            self._output("".join(pieces))
+            if done:
+                return
+
+    def _output(self, text: str) -> None:
+        if self._fd is None:
+            self.stream.write(text)
+            self.stream.flush()
+            return
+        # Anything printed normally must reach the terminal first
+        self.stream.flush()
+        data = text.encode(getattr(self.stream, "encoding", None) or "utf-8", errors="replace")
+        while data:
+            data = data[os.write(self._fd, data):]
@@ -1,7 +1,13 @@
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any, Dict, Optional
+import threading
 import time
 
+from . import _json
+from ._multipart import MultipartStream
+from ._retry import RETRY_STATUSES, backoff, retry_after
+from .config import MAX_CONNECTIONS
 from .errors import MeganovaError, APIError, RateLimitError, AuthenticationError
 from .version import __version__
 
@@ -12,14 +18,34 @@ class SyncTransport:
         api_key: str,
         timeout: float,
         max_retries: int,
-        user_agent: str
+        user_agent: str,
+        max_connections: int = MAX_CONNECTIONS,
+        session: Optional[requests.Session] = None,
     ):
         self.base_url = base_url.rstrip("/")
         self.api_key = api_key
         self.timeout = timeout
         self.max_retries = max_retries
         self.user_agent = user_agent
+        self.max_connections = max_connections
+        # Built once; request() only copies it when adding a Content-Type.
+        self._headers = {
+            "Authorization": f"Bearer {api_key}",
+            "User-Agent": user_agent,
+            "X-MN-SDK": "python",
+        }
+        # A caller-supplied session (shared across clients) is used as is and
+        # left open on close().
+        self._owns_session = session is None
+        if session is not None:
+            self._session = session
+            return
+        # One keep-alive pool for the client's lifetime, sized for concurrent
+        # callers (agent teams, parallel tool calls) so TLS setup is amortized.
         self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max_connections)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
 
     def request(
         self,
@@ -34,18 +60,22 @@ class SyncTransport:
         base_url_override: str | None = None,
     ) -> Any:
         url = f"{base_url_override or self.base_url}{path}"
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "User-Agent": self.user_agent,
-            "X-MN-SDK": "python",
-        }
+        headers = self._headers
+
+        if files is not None:
+            json = None
+            # Stream uploads from disk instead of building the body in memory
+            body = MultipartStream.build(data, files)
+            if body is not None:
+                headers = {**headers, "Content-Type": body.content_type}
+                data, files = body, None
 
         for attempt in range(self.max_retries + 1):
             try:
                 response = self._session.request(
                     method=method,
                     url=url,
-                    json=json if files is None else None,
+                    json=json,
                     data=data,
                     files=files,
                     params=params,
@@ -57,7 +87,14 @@ class SyncTransport:
                 if 200 <= response.status_code < 300:
                     if stream:
                         return response
-                    return response.json()
+                    # Parse the raw bytes: skips requests' charset sniffing
+                    # and str decode, and uses orjson when it's installed.
+                    return _json.loads(response.content)
+
+                if response.status_code in RETRY_STATUSES and attempt < self.max_retries:
+                    response.close()
+                    time.sleep(backoff(attempt, retry_after(response)))
+                    continue
 
                 # Handle errors
                 self._handle_error(response)
@@ -65,16 +102,41 @@ class SyncTransport:
             except requests.RequestException as exc:
                 if attempt >= self.max_retries:
                     raise MeganovaError(f"Network error: {exc}") from exc
-                # Exponential backoff
-                time.sleep(2 ** attempt)
+                time.sleep(backoff(attempt))
                 continue
 
         raise MeganovaError("Unexpected transport failure")
 
+    def warmup(self) -> threading.Thread:
+        """Open a pooled connection in the background.
+
+        Moves DNS and the TLS handshake off the first real request. Errors are
+        ignored; the request that needs the connection will report them.
+        """
+        def _connect() -> None:
+            try:
+                self._session.head(self.base_url, headers=self._headers, timeout=2.0).close()
+            except requests.RequestException:
+                pass
+
+        thread = threading.Thread(target=_connect, name="meganova-warmup", daemon=True)
+        thread.start()
+        return thread
+
+    def close(self) -> None:
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
     def _handle_error(self, response: requests.Response) -> None:
         status = response.status_code
         try:
-            payload = response.json()
+            payload = _json.loads(response.content)
         except Exception:
             payload = {}
 
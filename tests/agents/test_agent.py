@@ -1,7 +1,9 @@
 """Tests for the core Agent class."""
 
 import json
-from unittest.mock import MagicMock, patch
+import threading
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -9,15 +11,18 @@ from meganova.agents.agent import Agent, AgentResult, AgentTurnEvent
 from meganova.agents.hooks import Hook, HookContext, HookResult, HookType
 from meganova.agents.memory import MessageMemory, SlidingWindowMemory
 from meganova.agents.tools.base import ToolDefinition, tool
+from meganova.cache import SemanticChatCache
+from meganova.errors import APIError, AuthenticationError, MeganovaError, RateLimitError
 from meganova.models.chat import (
     ChatChoice,
     ChatMessage,
     ChatResponse,
+    ChatStreamChunk,
     FunctionCall,
     TokenUsage,
     ToolCall,
 )
-from tests.conftest import make_chat_response, make_tool_call
+from tests.conftest import make_chat_response, make_stream_chunk, make_tool_call
 
 
 def _chat_response(content="Hello", tool_calls=None, usage=True, finish_reason="stop"):
@@ -50,6 +55,36 @@ def _chat_response(content="Hello", tool_calls=None, usage=True, finish_reason="
     return resp
 
 
+def _stream_chunks(content=None, tool_calls=None):
+    """Build the ChatStreamChunk sequence for one streamed response.
+
+    Text is split into one chunk per word; each tool call's arguments are
+    split across two deltas.
+    """
+    chunks = []
+    for word in (content or "").split(" "):
+        if word:
+            chunks.append(ChatStreamChunk(**make_stream_chunk(content=word + " ")))
+    for i, tc in enumerate(tool_calls or []):
+        args = tc["function"]["arguments"]
+        half = len(args) // 2
+        deltas = [
+            {"index": i, "id": tc["id"], "type": "function",
+             "function": {"name": tc["function"]["name"], "arguments": args[:half]}},
+            {"index": i, "function": {"arguments": args[half:]}},
+        ]
+        for delta in deltas:
+            chunk = make_stream_chunk(content=None)
+            chunk["choices"][0]["delta"] = {"tool_calls": [delta]}
+            chunks.append(ChatStreamChunk(**chunk))
+    final = make_stream_chunk(
+        content=None, finish_reason="tool_calls" if tool_calls else "stop"
+    )
+    final["usage"] = {"prompt_tokens": 10, "completion_tokens": 20, "total_tokens": 30}
+    chunks.append(ChatStreamChunk(**final))
+    return chunks
+
+
 class TestAgentInit:
     def test_basic_init(self, mock_client):
         agent = Agent(mock_client, model="gpt-4")
@@ -167,14 +202,63 @@ class TestAgentRun:
         assert result.stop_reason == "error"
         assert "Error:" in result.content
 
-    def test_context_appended_to_system_prompt(self, mock_client):
+    @pytest.mark.parametrize("error", [
+        MeganovaError("Network error: reset"),
+        RateLimitError("slow down", status=429),
+        APIError("bad gateway", status=502),
+        AuthenticationError("no", status=401),
+    ])
+    def test_llm_errors_left_to_transport(self, mock_client, error):
+        # The transport already retried what it could; don't multiply attempts
+        mock_client.chat.completions.create.side_effect = error
+        result = Agent(mock_client, model="m").run("Hello")
+        assert result.stop_reason == "error"
+        assert mock_client.chat.completions.create.call_count == 1
+
+    def test_context_in_second_system_message(self, mock_client):
         mock_client.chat.completions.create.return_value = _chat_response("Hi")
         agent = Agent(mock_client, model="m", system_prompt="Base prompt")
 
         agent.run("Hello", context="Extra context here")
         call_args = mock_client.chat.completions.create.call_args
         messages = call_args.kwargs["messages"]
-        assert "Extra context here" in messages[0]["content"]
+        assert messages[0] == {"role": "system", "content": "Base prompt"}
+        assert messages[1]["role"] == "system"
+        assert "Extra context here" in messages[1]["content"]
+
+    def test_prompt_cache_key_stable_per_system_prompt(self, mock_client):
+        mock_client.chat.completions.create.return_value = _chat_response("Hi")
+        keys = []
+        for system_prompt in ("A", "A", "B"):
+            Agent(
+                mock_client, model="m", system_prompt=system_prompt, prompt_cache=True,
+            ).run("Hello")
+            keys.append(mock_client.chat.completions.create.call_args.kwargs["prompt_cache_key"])
+        assert keys[0] == keys[1] != keys[2]
+
+    def test_prompt_cache_key_covers_tools_and_stays_across_turns(self, mock_client):
+        tool_calls = [make_tool_call(name="f", arguments="{}")]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls), _chat_response("done"),
+        ]
+        td = ToolDefinition(name="f", description="d", func=lambda: "ok")
+        Agent(mock_client, model="m", tools=[td], prompt_cache=True).run("Hello")
+        turn_keys = {
+            c.kwargs["prompt_cache_key"]
+            for c in mock_client.chat.completions.create.call_args_list
+        }
+        assert len(turn_keys) == 1
+
+        mock_client.chat.completions.create.side_effect = None
+        mock_client.chat.completions.create.return_value = _chat_response("Hi")
+        Agent(mock_client, model="m", prompt_cache=True).run("Hello")
+        no_tools_key = mock_client.chat.completions.create.call_args.kwargs["prompt_cache_key"]
+        assert no_tools_key not in turn_keys
+
+    def test_prompt_cache_off_by_default(self, mock_client):
+        mock_client.chat.completions.create.return_value = _chat_response("Hi")
+        Agent(mock_client, model="m").run("Hello")
+        assert "prompt_cache_key" not in mock_client.chat.completions.create.call_args.kwargs
 
     def test_tool_args_parsed_from_json(self, mock_client):
         tool_calls = [make_tool_call(name="f", arguments='{"x": 42}')]
@@ -264,6 +348,147 @@ class TestAgentRun:
         assert user_msgs[-1] == {"role": "user", "content": "Hello there"}
 
 
+class TestAgentParallelTools:
+    def test_tool_concurrency_default(self, mock_client, monkeypatch):
+        monkeypatch.delenv("TOOL_CONCURRENCY_LIMIT", raising=False)
+        agent = Agent(mock_client, model="m")
+        assert agent.tool_concurrency == 8
+
+    def test_tool_concurrency_from_env(self, mock_client, monkeypatch):
+        monkeypatch.setenv("TOOL_CONCURRENCY_LIMIT", "3")
+        agent = Agent(mock_client, model="m")
+        assert agent.tool_concurrency == 3
+
+    def test_results_keep_call_order(self, mock_client):
+        tool_calls = [
+            make_tool_call(name="slow", arguments="{}", call_id="call_1"),
+            make_tool_call(name="fast", arguments="{}", call_id="call_2"),
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("done"),
+        ]
+
+        def slow():
+            time.sleep(0.05)
+            return "slow result"
+
+        agent = Agent(
+            mock_client, model="m",
+            tools=[
+                ToolDefinition(name="slow", description="d", func=slow),
+                ToolDefinition(name="fast", description="d", func=lambda: "fast result"),
+            ],
+        )
+
+        result = agent.run("test")
+        tool_msgs = [m for m in result.messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["call_1", "call_2"]
+        assert [m["content"] for m in tool_msgs] == ["slow result", "fast result"]
+
+    def test_independent_calls_run_concurrently(self, mock_client):
+        tool_calls = [
+            make_tool_call(name="wait", arguments="{}", call_id=f"call_{i}")
+            for i in range(2)
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("done"),
+        ]
+
+        barrier = threading.Barrier(2, timeout=2)
+
+        def wait():
+            barrier.wait()
+            return "ok"
+
+        td = ToolDefinition(name="wait", description="d", func=wait)
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        result = agent.run("test")
+        tool_msgs = [m for m in result.messages if m["role"] == "tool"]
+        assert [m["content"] for m in tool_msgs] == ["ok", "ok"]
+
+    def test_unsafe_tools_run_sequentially(self, mock_client):
+        tool_calls = [
+            make_tool_call(name="f", arguments="{}", call_id=f"call_{i}")
+            for i in range(3)
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("done"),
+        ]
+
+        active = []
+        overlaps = []
+
+        def f():
+            active.append(1)
+            overlaps.append(len(active))
+            time.sleep(0.01)
+            active.pop()
+            return "ok"
+
+        td = ToolDefinition(name="f", description="d", func=f, parallel_safe=False)
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        agent.run("test")
+        assert overlaps == [1, 1, 1]
+
+    def test_one_failure_does_not_drop_others(self, mock_client):
+        tool_calls = [
+            make_tool_call(name="bad", arguments="{}", call_id="call_1"),
+            make_tool_call(name="good", arguments="{}", call_id="call_2"),
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("done"),
+        ]
+
+        def bad():
+            raise ValueError("tool broke")
+
+        agent = Agent(
+            mock_client, model="m",
+            tools=[
+                ToolDefinition(name="bad", description="d", func=bad),
+                ToolDefinition(name="good", description="d", func=lambda: "fine"),
+            ],
+        )
+
+        result = agent.run("test")
+        tool_msgs = [m for m in result.messages if m["role"] == "tool"]
+        assert "tool broke" in tool_msgs[0]["content"]
+        assert tool_msgs[1]["content"] == "fine"
+
+
+    def test_edits_to_same_file_in_one_turn_both_apply(self, mock_client, tmp_path):
+        from meganova.agents.tools.file_ops import edit_file_tool
+
+        path = tmp_path / "f.txt"
+        path.write_text("A B\n")
+        tool_calls = [
+            make_tool_call(
+                name="edit_file", call_id=f"call_{i}",
+                arguments=json.dumps({"path": str(path), "old_text": old, "new_text": new}),
+            )
+            for i, (old, new) in enumerate([("A", "X"), ("B", "Y")])
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("done"),
+        ]
+
+        agent = Agent(mock_client, model="m", tools=[edit_file_tool])
+        with patch("meganova.agents.agent.concurrent.futures.ThreadPoolExecutor") as pool:
+            result = agent.run("edit")
+        pool.assert_not_called()
+
+        assert path.read_text() == "X Y\n"
+        tool_msgs = [m for m in result.messages if m["role"] == "tool"]
+        assert all("Edited" in m["content"] for m in tool_msgs)
+
+
 class TestAgentHookIntegration:
     def test_pre_tool_hook_blocks_execution(self, mock_client):
         tool_calls = [make_tool_call(name="f")]
@@ -305,23 +530,38 @@ class TestAgentHookIntegration:
         agent.run("test")
         assert captured["x"] == 999
 
+    def test_no_hooks_skips_context_construction(self, mock_client):
+        tool_calls = [make_tool_call(name="f", arguments="{}")]
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=tool_calls), _chat_response("done"),
+        ]
+        td = ToolDefinition(name="f", description="d", func=lambda: "ok")
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        with patch("meganova.agents.agent.HookContext") as ctx:
+            result = agent.run("test")
+        assert result.content == "done"
+        # Only the ON_COMPLETE hook site builds a context
+        assert ctx.call_count == 1
+
 
 class TestAgentStreaming:
     def test_streaming_yields_events(self, mock_client):
-        mock_client.chat.completions.create.return_value = _chat_response("Hello stream")
+        mock_client.chat.completions.create.return_value = iter(_stream_chunks("Hello stream"))
         agent = Agent(mock_client, model="m")
 
         events = list(agent.run("test", stream=True))
         types = [e.type for e in events]
-        assert "text" in types
-        assert "done" in types
+        assert types == ["text", "text", "done"]
+        assert events[-1].content == "Hello stream "
+        assert mock_client.chat.completions.create.call_args.kwargs["stream"] is True
 
     def test_streaming_tool_calls(self, mock_client):
         tool_calls = [make_tool_call(name="f")]
-        tc_response = _chat_response(tool_calls=tool_calls)
-        final_response = _chat_response("done")
-
-        mock_client.chat.completions.create.side_effect = [tc_response, final_response]
+        mock_client.chat.completions.create.side_effect = [
+            iter(_stream_chunks(tool_calls=tool_calls)),
+            iter(_stream_chunks("done")),
+        ]
 
         td = ToolDefinition(name="f", description="d", func=lambda **kw: "result")
         agent = Agent(mock_client, model="m", tools=[td])
@@ -332,6 +572,23 @@ class TestAgentStreaming:
         assert "tool_result" in types
         assert "done" in types
 
+    def test_streaming_tool_call_without_index_or_id(self, mock_client):
+        chunks = []
+        for part in ({"name": "f", "arguments": '{"x":'}, {"arguments": " 1}"}):
+            chunk = make_stream_chunk(content=None)
+            chunk["choices"][0]["delta"] = {"tool_calls": [{"function": part}]}
+            chunks.append(ChatStreamChunk(**chunk))
+        chunks.append(ChatStreamChunk(**make_stream_chunk(content=None, finish_reason="tool_calls")))
+        mock_client.chat.completions.create.side_effect = [
+            iter(chunks), iter(_stream_chunks("done")),
+        ]
+        td = ToolDefinition(name="f", description="d", func=lambda x: f"got {x}")
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        events = list(agent.run("test", stream=True))
+        results = [e.content for e in events if e.type == "tool_result"]
+        assert results == ["got 1"]
+
     def test_streaming_error(self, mock_client):
         mock_client.chat.completions.create.side_effect = RuntimeError("API down")
         agent = Agent(mock_client, model="m")
@@ -341,8 +598,9 @@ class TestAgentStreaming:
 
     def test_streaming_max_turns(self, mock_client):
         tool_calls = [make_tool_call(name="f")]
-        tc_response = _chat_response(tool_calls=tool_calls)
-        mock_client.chat.completions.create.return_value = tc_response
+        mock_client.chat.completions.create.return_value = iter(
+            _stream_chunks(tool_calls=tool_calls)
+        )
 
         td = ToolDefinition(name="f", description="d", func=lambda **kw: "result")
         agent = Agent(mock_client, model="m", tools=[td], max_turns=1)
@@ -351,6 +609,240 @@ class TestAgentStreaming:
         assert events[-1].type == "done"
         assert "Max turns" in events[-1].content
 
+    def test_streaming_reassembles_tool_calls(self, mock_client):
+        tool_calls = [
+            make_tool_call(name="f", arguments='{"x": 1}', call_id="c1"),
+            make_tool_call(name="f", arguments='{"x": 2}', call_id="c2"),
+        ]
+        mock_client.chat.completions.create.side_effect = [
+            iter(_stream_chunks(tool_calls=tool_calls)),
+            iter(_stream_chunks("done")),
+        ]
+        td = ToolDefinition(name="f", description="d", func=lambda x: f"got {x}")
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        events = list(agent.run("test", stream=True))
+        assert [e.tool_args for e in events if e.type == "tool_call"] == [{"x": 1}, {"x": 2}]
+        assert [e.content for e in events if e.type == "tool_result"] == ["got 1", "got 2"]
+
+        messages = mock_client.chat.completions.create.call_args.kwargs["messages"]
+        assistant = next(m for m in messages if m.get("tool_calls"))
+        assert [tc["id"] for tc in assistant["tool_calls"]] == ["c1", "c2"]
+        assert assistant["tool_calls"][0]["function"]["arguments"] == '{"x": 1}'
+        assert {"role": "tool", "content": "got 1", "tool_call_id": "c1"} in messages
+
+    def test_streaming_starts_tool_before_stream_ends(self, mock_client):
+        started = threading.Event()
+        seen_before_end = []
+        chunks = _stream_chunks(tool_calls=[
+            make_tool_call(name="slow", arguments="{}", call_id="c1"),
+            make_tool_call(name="slow", arguments="{}", call_id="c2"),
+        ])
+
+        def stream():
+            for chunk in chunks[:-1]:
+                yield chunk
+            # Second call has started, so the first must already be running
+            seen_before_end.append(started.wait(timeout=2))
+            yield chunks[-1]
+
+        mock_client.chat.completions.create.side_effect = [
+            stream(), iter(_stream_chunks("done")),
+        ]
+
+        def slow():
+            started.set()
+            return "ok"
+
+        td = ToolDefinition(name="slow", description="d", func=slow)
+        agent = Agent(mock_client, model="m", tools=[td])
+        list(agent.run("test", stream=True))
+        assert seen_before_end == [True]
+
+    def test_streaming_unsafe_tools_run_after_stream(self, mock_client):
+        order = []
+        chunks = _stream_chunks(tool_calls=[
+            make_tool_call(name="unsafe", arguments="{}", call_id="c1"),
+        ])
+
+        def stream():
+            yield from chunks
+            order.append("stream end")
+
+        mock_client.chat.completions.create.side_effect = [
+            stream(), iter(_stream_chunks("done")),
+        ]
+        td = ToolDefinition(
+            name="unsafe", description="d",
+            func=lambda: order.append("tool") or "ok", parallel_safe=False,
+        )
+        agent = Agent(mock_client, model="m", tools=[td])
+        list(agent.run("test", stream=True))
+        assert order == ["stream end", "tool"]
+
+    def test_streaming_safe_call_after_unsafe_waits_for_it(self, mock_client):
+        files = {}
+        mock_client.chat.completions.create.side_effect = [
+            iter(_stream_chunks(tool_calls=[
+                make_tool_call(name="write", arguments="{}", call_id="c1"),
+                make_tool_call(name="read", arguments="{}", call_id="c2"),
+            ])),
+            iter(_stream_chunks("done")),
+        ]
+        write = ToolDefinition(
+            name="write", description="d", parallel_safe=False,
+            func=lambda: files.setdefault("a", "written") and "ok",
+        )
+        read = ToolDefinition(
+            name="read", description="d", func=lambda: files.get("a", "missing"),
+        )
+        agent = Agent(mock_client, model="m", tools=[write, read])
+
+        events = list(agent.run("test", stream=True))
+        assert [e.content for e in events if e.type == "tool_result"] == ["ok", "written"]
+
+
+class TestAgentAsyncRun:
+    def _async_client(self, *responses):
+        client = MagicMock()
+        client.chat.completions.create = AsyncMock(side_effect=list(responses))
+        return client
+
+    async def test_simple_response(self, mock_client):
+        async_client = self._async_client(_chat_response("Hello async"))
+        agent = Agent(mock_client, model="m")
+
+        result = await agent.arun("Hi", client=async_client)
+        assert result.content == "Hello async"
+        assert result.stop_reason == "complete"
+        assert result.total_tokens == 30
+        mock_client.chat.completions.create.assert_not_called()
+
+    async def test_tool_call_then_response(self, mock_client):
+        tool_calls = [make_tool_call(name="get_weather", arguments='{"city":"NYC"}')]
+        async_client = self._async_client(
+            _chat_response(tool_calls=tool_calls),
+            _chat_response("Sunny"),
+        )
+        td = ToolDefinition(
+            name="get_weather", description="d", func=lambda city: f"Sunny in {city}",
+        )
+        agent = Agent(mock_client, model="m", tools=[td])
+
+        result = await agent.arun("Weather?", client=async_client)
+        assert result.content == "Sunny"
+        assert result.tool_calls_made == 1
+        tool_msgs = [m for m in result.messages if m["role"] == "tool"]
+        assert tool_msgs[0]["content"] == "Sunny in NYC"
+
+    async def test_network_error_not_retried(self, mock_client):
+        async_client = self._async_client(
+            MeganovaError("Network error: reset"), _chat_response("Hi"),
+        )
+        result = await Agent(mock_client, model="m").arun("Hello", client=async_client)
+        assert result.stop_reason == "error"
+        assert async_client.chat.completions.create.await_count == 1
+
+    async def test_llm_error_returns_error_result(self, mock_client):
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(side_effect=RuntimeError("down"))
+        agent = Agent(mock_client, model="m")
+
+        result = await agent.arun("test", client=async_client)
+        assert result.stop_reason == "error"
+        assert "down" in result.content
+
+    async def test_async_tools_gathered_on_loop(self, mock_client):
+        import asyncio
+
+        tool_calls = [
+            make_tool_call(name="fetch", arguments=f'{{"n": {i}}}', call_id=f"c{i}")
+            for i in range(3)
+        ]
+        async_client = self._async_client(
+            _chat_response(tool_calls=tool_calls), _chat_response("done"),
+        )
+        running = 0
+        peak = 0
+
+        async def fetch(n: int) -> str:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return f"page {n}"
+
+        agent = Agent(mock_client, model="m", tools=[ToolDefinition(
+            name="fetch", description="d", func=fetch,
+        )])
+        result = await agent.arun("go", client=async_client)
+
+        tool_msgs = [m["content"] for m in result.messages if m["role"] == "tool"]
+        assert tool_msgs == ["page 0", "page 1", "page 2"]
+        assert peak == 3
+
+    async def test_async_tool_error(self, mock_client):
+        async_client = self._async_client(
+            _chat_response(tool_calls=[make_tool_call(name="bad", arguments="{}")]),
+            _chat_response("done"),
+        )
+
+        async def bad():
+            raise ValueError("nope")
+
+        agent = Agent(mock_client, model="m", tools=[ToolDefinition(
+            name="bad", description="d", func=bad,
+        )])
+        result = await agent.arun("go", client=async_client)
+        tool_msgs = [m["content"] for m in result.messages if m["role"] == "tool"]
+        assert tool_msgs == ["Error executing bad: nope"]
+
+    def test_sync_run_awaits_async_tool(self, mock_client):
+        mock_client.chat.completions.create.side_effect = [
+            _chat_response(tool_calls=[make_tool_call(name="f", arguments="{}")]),
+            _chat_response("done"),
+        ]
+
+        async def f():
+            return "async result"
+
+        agent = Agent(mock_client, model="m", tools=[ToolDefinition(
+            name="f", description="d", func=f,
+        )])
+        result = agent.run("go")
+        tool_msgs = [m["content"] for m in result.messages if m["role"] == "tool"]
+        assert tool_msgs == ["async result"]
+
+
+class TestAgentCache:
+    def _cache(self, client):
+        return SemanticChatCache(client, lambda text: [1.0, float(len(text))])
+
+    def test_repeated_prompt_served_from_cache(self, mock_client):
+        mock_client.chat.completions.create.side_effect = None
+        mock_client.chat.completions.create.return_value = _chat_response("Hi")
+        agent = Agent(mock_client, model="m", cache=self._cache(mock_client))
+
+        first = agent.run("Hello")
+        second = agent.run("Hello")
+
+        assert first.content == second.content == "Hi"
+        assert mock_client.chat.completions.create.call_count == 1
+        assert agent.cache.hits == 1
+
+    async def test_async_run_uses_cache(self, mock_client):
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(return_value=_chat_response("Hi"))
+        agent = Agent(mock_client, model="m", cache=self._cache(mock_client))
+
+        await agent.arun("Hello", client=async_client)
+        result = await agent.arun("Hello", client=async_client)
+
+        assert result.content == "Hi"
+        assert async_client.chat.completions.create.await_count == 1
+        mock_client.chat.completions.create.assert_not_called()
+
 
 class TestAgentResult:
     def test_defaults(self):
@@ -1,5 +1,7 @@
 """Tests for memory implementations."""
 
+from unittest.mock import patch
+
 import pytest
 
 from meganova.agents.memory import (
@@ -76,6 +78,40 @@ class TestMessageMemory:
             mem.add({"role": "user", "content": f"msg {i}"})
         assert mem.size == 100
 
+    def test_add_copies_known_fields(self):
+        mem = MessageMemory()
+        msg = {"role": "user", "content": "Hi", "name": None, "extra": 1}
+        mem.add(msg)
+        msg["content"] = "changed"
+        assert mem.get_messages() == [{"role": "user", "content": "Hi"}]
+
+    def test_extend(self):
+        mem = MessageMemory()
+        mem.add({"role": "user", "content": "Hi"})
+        mem.extend([
+            {"role": "assistant", "content": "Hello"},
+            {"role": "user", "content": "Bye"},
+        ])
+        assert [m["content"] for m in mem.get_messages()] == ["Hi", "Hello", "Bye"]
+
+    def test_extend_default_uses_add(self):
+        class ListMemory(Memory):
+            def __init__(self):
+                self.added = []
+
+            def add(self, message):
+                self.added.append(message)
+
+            def get_messages(self):
+                return list(self.added)
+
+            def clear(self):
+                self.added.clear()
+
+        mem = ListMemory()
+        mem.extend(iter([{"role": "user", "content": "a"}, {"role": "user", "content": "b"}]))
+        assert mem.size == 2
+
 
 class TestSlidingWindowMemory:
     def test_under_limit(self):
@@ -115,6 +151,26 @@ class TestSlidingWindowMemory:
         assert d["type"] == "SlidingWindowMemory"
 
 
+    def test_extend_then_trim(self):
+        mem = SlidingWindowMemory(max_messages=2)
+        mem.extend({"role": "user", "content": f"msg {i}"} for i in range(5))
+        assert [m["content"] for m in mem.get_messages()] == ["msg 3", "msg 4"]
+
+    def test_trim_keeps_system_messages_first(self):
+        mem = SlidingWindowMemory(max_messages=3)
+        mem.add({"role": "user", "content": "msg 0"})
+        mem.add({"role": "system", "content": "sys"})
+        for i in range(1, 4):
+            mem.add({"role": "user", "content": f"msg {i}"})
+        assert [m["content"] for m in mem.get_messages()] == ["sys", "msg 2", "msg 3"]
+
+    def test_system_messages_fill_window(self):
+        mem = SlidingWindowMemory(max_messages=2)
+        mem.extend({"role": "system", "content": f"sys {i}"} for i in range(2))
+        mem.add({"role": "user", "content": "Hi"})
+        assert [m["content"] for m in mem.get_messages()] == ["sys 0", "sys 1"]
+
+
 class TestTokenBudgetMemory:
     def test_under_budget(self):
         mem = TokenBudgetMemory(max_tokens=1000)
@@ -138,6 +194,32 @@ class TestTokenBudgetMemory:
         msgs = mem.get_messages()
         assert msgs[0]["role"] == "system"
 
+    def test_keeps_most_recent_within_budget(self):
+        mem = TokenBudgetMemory(max_tokens=6)
+        mem.add({"role": "system", "content": "x" * 8})  # 2 tokens
+        for content in ("a" * 8, "b" * 8, "c" * 8):  # 2 tokens each
+            mem.add({"role": "user", "content": content})
+        assert [m["content"][0] for m in mem.get_messages()] == ["x", "b", "c"]
+
+    def test_costs_estimated_once(self):
+        mem = TokenBudgetMemory(max_tokens=100)
+        mem.add({"role": "assistant", "tool_calls": [{"id": "c1"}]})
+        mem.add({"role": "user", "content": "Hi"})
+        with patch.object(mem, "_estimate_tokens") as estimate:
+            mem.get_messages()
+            mem.get_messages()
+        estimate.assert_not_called()
+
+    def test_subclass_estimate_override_is_used(self):
+        class WordBudget(TokenBudgetMemory):
+            def _estimate_tokens(self, entry: MemoryEntry) -> int:
+                return len((entry.content or "").split())
+
+        mem = WordBudget(max_tokens=3)
+        for content in ("one two", "three", "four five"):
+            mem.add({"role": "user", "content": content})
+        assert [m["content"] for m in mem.get_messages()] == ["three", "four five"]
+
     def test_clear(self):
         mem = TokenBudgetMemory(max_tokens=100)
         mem.add({"role": "user", "content": "Hi"})
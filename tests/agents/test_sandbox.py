@@ -31,6 +31,7 @@ class TestSandboxConfig:
         assert cfg.read_only_root is True
         assert cfg.working_dir == "/workspace"
         assert cfg.environment == {}
+        assert cfg.cache_read_only_commands is False
 
     def test_custom_config(self):
         cfg = SandboxConfig(
@@ -119,6 +120,70 @@ class TestSandboxProvider:
         assert sb.config.image == "custom:latest"
 
 
+class TestCommandCache:
+    def _sandbox(self, enabled=True):
+        class FakeSandbox(SandboxProvider):
+            provider_id = "fake"
+            def start(self): pass
+            def stop(self): pass
+            def execute(self, command, timeout=None):
+                cached = self._cached_result(command)
+                if cached is not None:
+                    return cached
+                self.calls.append(command)
+                result = SandboxResult(stdout=f"out{len(self.calls)}")
+                self._remember(command, result)
+                return result
+            def write_file(self, path, content): self._command_cache.clear()
+            def read_file(self, path): return ""
+            def is_running(self): return True
+
+        sb = FakeSandbox(SandboxConfig(cache_read_only_commands=enabled))
+        sb.calls = []
+        return sb
+
+    def test_disabled_by_default(self):
+        sb = self._sandbox(enabled=False)
+        sb.execute("ls")
+        sb.execute("ls")
+        assert sb.calls == ["ls", "ls"]
+
+    def test_repeated_read_only_command_is_cached(self):
+        sb = self._sandbox()
+        first = sb.execute("cat /workspace/a.txt")
+        assert sb.execute("cat /workspace/a.txt") is first
+        assert sb.calls == ["cat /workspace/a.txt"]
+
+    @pytest.mark.parametrize("command", [
+        "cat a > b", "ls; rm -rf x", "cat $(whoami)", "python script.py", "echo hi",
+    ])
+    def test_other_commands_are_not_cached(self, command):
+        sb = self._sandbox()
+        sb.execute(command)
+        sb.execute(command)
+        assert sb.calls == [command, command]
+
+    def test_other_command_invalidates(self):
+        sb = self._sandbox()
+        sb.execute("ls")
+        sb.execute("touch new.txt")
+        sb.execute("ls")
+        assert sb.calls == ["ls", "touch new.txt", "ls"]
+
+    def test_failed_read_only_command_is_not_cached(self):
+        sb = self._sandbox()
+        sb._remember("cat missing", SandboxResult(exit_code=1))
+        assert sb._cached_result("cat missing") is None
+
+    def test_lru_eviction(self):
+        from meganova.agents.sandbox import base
+        sb = self._sandbox()
+        for i in range(base._COMMAND_CACHE_SIZE + 1):
+            sb.execute(f"cat f{i}")
+        assert sb._cached_result("cat f0") is None
+        assert sb._cached_result(f"cat f{base._COMMAND_CACHE_SIZE}") is not None
+
+
 class TestDockerSandbox:
     def test_provider_id(self):
         from meganova.agents.sandbox.docker_provider import DockerSandbox
@@ -147,6 +212,188 @@ class TestDockerSandbox:
         sb = DockerSandbox()
         assert not sb.is_running()
 
+    @pytest.mark.parametrize("path", ["/workspace/app.py", "/workspace/" + "d" * 120 + "/f.txt"])
+    def test_write_file_sends_tar_archive(self, path):
+        import io
+        import tarfile
+
+        from meganova.agents.sandbox.docker_provider import DockerSandbox
+        sb = DockerSandbox()
+        sb._container = MagicMock()
+
+        sb.write_file(path, "print('é')\n")
+
+        dest, archive = sb._container.put_archive.call_args.args
+        assert dest == "/"
+        with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+            member = tar.getmembers()[0]
+            assert member.name == path.lstrip("/")
+            assert tar.extractfile(member).read().decode() == "print('é')\n"
+
+    def test_write_file_invalidates_command_cache(self):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox
+        sb = DockerSandbox(SandboxConfig(cache_read_only_commands=True))
+        sb._container = MagicMock()
+        sb._run_exec = MagicMock(return_value=SandboxResult(stdout="a.txt\n"))
+
+        sb.execute("ls")
+        sb.execute("ls")
+        sb.write_file("/workspace/b.txt", "b")
+        sb.execute("ls")
+
+        assert sb._run_exec.call_count == 2
+
+    def test_execute_streams_and_joins_output(self):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox
+        sb = DockerSandbox()
+        sb._container = MagicMock(id="c1")
+        api = sb._container.client.api
+        api.exec_create.return_value = {"Id": "e1"}
+        api.exec_start.return_value = iter([
+            (b"hel", None), (None, b"warn"), (b"lo \xc3", None), (b"\xa9", None),
+        ])
+        api.exec_inspect.return_value = {"ExitCode": 3}
+
+        result = sb.execute("make")
+
+        assert result.stdout == "hello é"
+        assert result.stderr == "warn"
+        assert result.exit_code == 3
+        assert api.exec_create.call_args.kwargs["cmd"] == ["sh", "-c", "make"]
+        api.exec_start.assert_called_once_with("e1", stream=True, demux=True)
+
+    def test_execute_stream_yields_decoded_chunks(self):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox
+        sb = DockerSandbox()
+        sb._container = MagicMock(id="c1")
+        api = sb._container.client.api
+        api.exec_create.return_value = {"Id": "e1"}
+        api.exec_start.return_value = iter([
+            (b"hel", None), (None, b"warn"), (b"lo \xc3", None), (b"\xa9", None),
+        ])
+        api.exec_inspect.return_value = {"ExitCode": 3}
+
+        chunks = []
+
+        def consume():
+            exit_code = yield from sb.execute_stream("make")
+            chunks.append(("exit", exit_code))
+
+        chunks.extend(consume())
+
+        assert chunks == [
+            ("stdout", "hel"), ("stderr", "warn"), ("stdout", "lo "),
+            ("stdout", "é"), ("exit", 3),
+        ]
+
+    def test_execute_stream_without_start(self):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox
+        with pytest.raises(RuntimeError):
+            next(DockerSandbox().execute_stream("ls"))
+
+    def test_docker_client_is_created_once(self):
+        import sys
+        from meganova.agents.sandbox import docker_provider
+
+        fake_docker = MagicMock()
+        with patch.dict(sys.modules, {"docker": fake_docker}), \
+                patch.object(docker_provider, "_client", None):
+            docker_provider._run_container(SandboxConfig(), "a")
+            docker_provider._run_container(SandboxConfig(), "b")
+
+        fake_docker.from_env.assert_called_once_with()
+        assert fake_docker.from_env.return_value.containers.run.call_count == 2
+
+
+class TestDockerSandboxPool:
+    @pytest.fixture
+    def run_container(self):
+        with patch(
+            "meganova.agents.sandbox.docker_provider._run_container",
+            side_effect=lambda config, name: MagicMock(name=name),
+        ) as run:
+            yield run
+
+    def _wait_warm(self, pool, n):
+        import time
+        deadline = time.time() + 2
+        while pool._warm.qsize() < n and time.time() < deadline:
+            time.sleep(0.01)
+
+    def test_start_warms_containers(self, run_container):
+        from meganova.agents.sandbox.docker_provider import DockerSandboxPool
+        pool = DockerSandboxPool(min_warm=2)
+        pool.start()
+        self._wait_warm(pool, 2)
+        assert pool._warm.qsize() == 2
+        assert run_container.call_count == 2
+
+    def test_sandbox_takes_warm_container_and_pool_refills(self, run_container):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox, DockerSandboxPool
+        pool = DockerSandboxPool(min_warm=1)
+        pool.start()
+        self._wait_warm(pool, 1)
+        warm = pool._warm.queue[0]
+
+        sb = DockerSandbox(pool=pool)
+        sb.start()
+        assert sb._container is warm
+        assert sb.status == SandboxStatus.RUNNING
+
+        self._wait_warm(pool, 1)
+        assert pool._warm.qsize() == 1
+
+        sb.stop()
+        warm.remove.assert_called_once_with(force=True)
+
+    def test_acquire_starts_container_when_empty(self, run_container):
+        from meganova.agents.sandbox.docker_provider import DockerSandboxPool
+        pool = DockerSandboxPool(min_warm=0)
+        assert pool.acquire() is not None
+        assert run_container.call_count == 1
+
+    def test_sandbox_uses_pool_config(self, run_container):
+        from meganova.agents.sandbox.docker_provider import DockerSandbox, DockerSandboxPool
+        config = SandboxConfig(image="node:20")
+        sb = DockerSandbox(pool=DockerSandboxPool(config, min_warm=0))
+        assert sb.config is config
+
+    def test_close_removes_warm_containers(self, run_container):
+        from meganova.agents.sandbox.docker_provider import DockerSandboxPool
+        pool = DockerSandboxPool(min_warm=2)
+        pool.start()
+        self._wait_warm(pool, 2)
+        warm = list(pool._warm.queue)
+        pool.close()
+        for container in warm:
+            container.remove.assert_called_once_with(force=True)
+        with pytest.raises(RuntimeError):
+            pool.acquire()
+
+    def test_container_finished_after_close_is_removed(self):
+        import threading
+        from meganova.agents.sandbox.docker_provider import DockerSandboxPool
+
+        release = threading.Event()
+        container = MagicMock()
+
+        def slow_run(config, name):
+            release.wait(2)
+            return container
+
+        with patch("meganova.agents.sandbox.docker_provider._run_container", side_effect=slow_run):
+            pool = DockerSandboxPool(min_warm=1)
+            fill = threading.Thread(target=pool._fill)
+            pool._pending = 1
+            fill.start()
+            pool.close()
+            release.set()
+            fill.join(2)
+
+        container.remove.assert_called_once_with(force=True)
+        assert pool._warm.empty()
+        assert pool._pending == 0
+
 
 class TestE2BSandbox:
     def test_provider_id(self):
@@ -1,6 +1,6 @@
 """Tests for subagent orchestration."""
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -13,6 +13,9 @@ def _make_agent(name="agent", content="result"):
     agent = MagicMock(spec=Agent)
     agent.name = name
     agent.run.return_value = AgentResult(content=content, turns=1, model="m")
+    agent.arun = AsyncMock(
+        return_value=AgentResult(content=content, turns=1, model="m")
+    )
     return agent
 
 
@@ -158,6 +161,70 @@ class TestParallelExecution:
         assert len(result.results) == 1
 
 
+class TestParallelAsyncExecution:
+    async def test_basic_parallel_async(self):
+        a1 = _make_agent("a1", "result 1")
+        a2 = _make_agent("a2", "result 2")
+        client = MagicMock()
+
+        team = AgentTeam()
+        team.add(a1, role="analyst1").add(a2, role="analyst2")
+
+        result = await team.run_parallel_async("analyze this", client=client)
+        assert [r.content for r in result.results] == ["result 1", "result 2"]
+        assert result.agents_used == ["analyst1", "analyst2"]
+        assert "**analyst1**: result 1" in result.final_content
+
+    async def test_shares_client_across_agents(self):
+        a1 = _make_agent("a1")
+        a2 = _make_agent("a2")
+        client = MagicMock()
+
+        team = AgentTeam()
+        team.add(a1).add(a2)
+
+        await team.run_parallel_async("task", context="ctx", client=client)
+        for agent in (a1, a2):
+            agent.arun.assert_awaited_once_with("task", context="ctx", client=client)
+
+    async def test_handles_agent_error(self):
+        a1 = _make_agent("a1", "result 1")
+        a2 = _make_agent("a2")
+        a2.arun.side_effect = RuntimeError("failed")
+
+        team = AgentTeam()
+        team.add(a1, role="ok").add(a2, role="fail")
+
+        result = await team.run_parallel_async("task", client=MagicMock())
+        assert result.agents_used == ["ok"]
+
+    async def test_one_async_client_per_client_config(self):
+        from meganova import MegaNova
+
+        key_a, key_a2, key_b = MegaNova(api_key="a"), MegaNova(api_key="a"), MegaNova(api_key="b")
+        agents = [_make_agent(f"a{i}") for i in range(3)]
+        for agent, sync_client in zip(agents, (key_a, key_b, key_a2)):
+            agent.client = sync_client
+
+        team = AgentTeam()
+        for agent in agents:
+            team.add(agent)
+        await team.run_parallel_async("task")
+
+        used = [a.arun.call_args.kwargs["client"] for a in agents]
+        assert used[0] is used[2]
+        assert used[0] is not used[1]
+        assert [c._transport.api_key for c in used] == ["a", "b", "a"]
+        assert all(c._transport._client.is_closed for c in used)
+
+    async def test_no_eligible_agents(self):
+        team = AgentTeam()
+        team.add(_make_agent(), condition=lambda p: False)
+
+        result = await team.run_parallel_async("task")
+        assert result.results == []
+
+
 class TestHandoffExecution:
     def test_handoff_to_matching_condition(self):
         a1 = _make_agent("coding", "code result")
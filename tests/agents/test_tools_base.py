@@ -1,5 +1,8 @@
 """Tests for tool system: @tool decorator, ToolDefinition, ToolRegistry, type mapping."""
 
+import sys
+from typing import List, Optional
+
 import pytest
 
 from meganova.agents.tools.base import (
@@ -36,6 +39,17 @@ class TestToolDefinition:
         td = ToolDefinition(name="f", description="d", func=lambda: None)
         assert td.parameters == {}
 
+    def test_parallel_safe_by_default(self):
+        td = ToolDefinition(name="f", description="d", func=lambda: None)
+        assert td.parallel_safe is True
+
+    def test_is_async(self):
+        async def f():
+            return 1
+
+        assert ToolDefinition(name="f", description="d", func=f).is_async
+        assert not ToolDefinition(name="g", description="d", func=lambda: 1).is_async
+
 
 class TestToolRegistry:
     def test_register_and_get(self):
@@ -78,6 +92,15 @@ class TestToolRegistry:
         assert len(tools) == 1
         assert tools[0]["type"] == "function"
 
+    def test_to_openai_tools_cached_until_register(self):
+        reg = ToolRegistry()
+        reg.register(ToolDefinition(name="f", description="d", func=lambda: None))
+        first = reg.to_openai_tools()
+        assert reg.to_openai_tools() is first
+
+        reg.register(ToolDefinition(name="g", description="d", func=lambda: None))
+        assert [t["function"]["name"] for t in reg.to_openai_tools()] == ["f", "g"]
+
     def test_register_overwrites(self):
         reg = ToolRegistry()
         reg.register(ToolDefinition(name="f", description="v1", func=lambda: None))
@@ -144,6 +167,13 @@ class TestToolDecorator:
 
         assert multiply.execute(a=3, b=4) == 12
 
+    def test_decorator_parallel_safe_opt_out(self):
+        @tool("run", "run code", parallel_safe=False)
+        def run(code: str) -> str:
+            return code
+
+        assert run.parallel_safe is False
+
 
 class TestTypeToJsonSchema:
     def test_str(self):
@@ -170,6 +200,18 @@ class TestTypeToJsonSchema:
         result = _python_type_to_json_schema(Custom)
         assert result["type"] == "string"
 
+    def test_typed_list(self):
+        assert _python_type_to_json_schema(List[int]) == {
+            "type": "array", "items": {"type": "integer"},
+        }
+
+    def test_optional_unwrapped(self):
+        assert _python_type_to_json_schema(Optional[int]) == {"type": "integer"}
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="X | None needs 3.10")
+    def test_pep604_optional_unwrapped(self):
+        assert _python_type_to_json_schema(eval("float | None")) == {"type": "number"}
+
 
 class TestBuildParametersSchema:
     def test_basic(self):
@@ -38,6 +38,19 @@ class TestReadFile:
         result = _read_file(str(f), max_lines=10)
         assert "more lines" in result
 
+    def test_max_lines_keeps_head_and_counts_rest(self, tmp_path):
+        f = tmp_path / "big.txt"
+        f.write_text("".join(f"line {i}\n" for i in range(25)))
+        result = _read_file(str(f), max_lines=10)
+        assert result.startswith("line 0\n")
+        assert "line 9\n" in result and "line 10" not in result
+        assert result.endswith("... (15 more lines)")
+
+    def test_exactly_max_lines_not_truncated(self, tmp_path):
+        f = tmp_path / "ten.txt"
+        f.write_text("".join(f"line {i}\n" for i in range(10)))
+        assert _read_file(str(f), max_lines=10) == f.read_text()
+
     def test_tilde_expansion(self, tmp_path):
         # Just verify the function calls expanduser
         result = _read_file("~/nonexistent_test_file_xyz")
@@ -49,6 +62,9 @@ class TestWriteFile:
         assert isinstance(write_file_tool, ToolDefinition)
         assert write_file_tool.name == "write_file"
 
+    def test_not_parallel_safe(self):
+        assert write_file_tool.parallel_safe is False
+
     def test_write_new_file(self, tmp_path):
         path = str(tmp_path / "output.txt")
         result = _write_file(path, "test content")
@@ -63,6 +79,12 @@ class TestWriteFile:
         assert "Written" in result
         assert os.path.exists(path)
 
+    def test_reports_encoded_byte_count(self, tmp_path):
+        path = tmp_path / "utf8.txt"
+        result = _write_file(str(path), "héllo\n")
+        assert result == f"Written 7 bytes to {path}"
+        assert path.read_bytes() == "héllo\n".encode("utf-8")
+
     def test_overwrites_existing(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("old")
@@ -75,6 +97,9 @@ class TestEditFile:
         assert isinstance(edit_file_tool, ToolDefinition)
         assert edit_file_tool.name == "edit_file"
 
+    def test_not_parallel_safe(self):
+        assert edit_file_tool.parallel_safe is False
+
     def test_replace_text(self, tmp_path):
         f = tmp_path / "test.txt"
         f.write_text("hello world")
@@ -117,6 +142,17 @@ class TestListDirectory:
         result = _list_directory(str(tmp_path), max_entries=3)
         assert "more" in result
 
+    def test_max_entries_reports_remaining_count(self, tmp_path):
+        for i in range(10):
+            (tmp_path / f"file{i}.txt").write_text("")
+        lines = _list_directory(str(tmp_path), max_entries=3).split("\n")
+        assert lines == ["f file0.txt", "f file1.txt", "f file2.txt", "... (7 more)"]
+
+    def test_symlink_to_directory_listed_as_directory(self, tmp_path):
+        (tmp_path / "real").mkdir()
+        (tmp_path / "link").symlink_to(tmp_path / "real")
+        assert "d link" in _list_directory(str(tmp_path))
+
     def test_nonexistent_directory(self):
         result = _list_directory("/nonexistent/path")
         assert "Error listing" in result
@@ -61,6 +61,16 @@ class TestKnowledgeBase:
         result = kb.search("common", max_results=3)
         assert result.count("## Entry") == 3
 
+    def test_ties_keep_entry_order(self):
+        entries = [
+            KnowledgeEntry(title=f"title {i}", content=str(i), keys=[f"key{i:03d}"])
+            for i in range(100)
+        ]
+        kb = KnowledgeBase(entries)
+        # Equal scores; the automaton reports entry 90 before entry 3
+        result = kb.search("key090 and key003", max_results=1)
+        assert result.startswith("## title 3\n")
+
     def test_add_entry(self):
         kb = KnowledgeBase()
         kb.add(KnowledgeEntry(title="New", content="new content", keys=["test"]))
@@ -74,6 +84,79 @@ class TestKnowledgeBase:
         result = kb.search("PYTHON")
         assert "Python" in result
 
+    def test_overlapping_keys_all_match(self):
+        kb = KnowledgeBase([
+            KnowledgeEntry(title="A", content="a", keys=["he", "she", "hers"]),
+            KnowledgeEntry(title="B", content="b", keys=["his"]),
+        ])
+        scores = kb._keyword_scores("ushers")
+        assert scores == {0: 3}
+
+    def test_add_after_search(self):
+        kb = KnowledgeBase([KnowledgeEntry(title="Old", content="old", keys=["x"])])
+        assert "No relevant" in kb.search("newkey")
+        kb.add(KnowledgeEntry(title="New", content="new", keys=["newkey"]))
+        assert "New" in kb.search("newkey")
+
+
+VECTORS = {
+    "Refunds\nMoney back within 30 days": [1.0, 0.0, 0.0],
+    "Shipping\nParcels ship in 2 days": [0.0, 1.0, 0.0],
+    "Warranty\nOne year coverage": [0.0, 0.0, 1.0],
+    "can I get my money back?": [0.9, 0.1, 0.0],
+    "refunds for broken item": [0.2, 0.0, 0.98],
+}
+
+
+def _embed(text):
+    return VECTORS[text]
+
+
+def _semantic_kb():
+    return KnowledgeBase([
+        KnowledgeEntry(title="Refunds", content="Money back within 30 days", keys=["refund"]),
+        KnowledgeEntry(title="Shipping", content="Parcels ship in 2 days"),
+        KnowledgeEntry(title="Warranty", content="One year coverage"),
+    ], embed_fn=_embed)
+
+
+class TestKnowledgeBaseSemantic:
+    def test_matches_without_keywords(self):
+        kb = _semantic_kb()
+        result = kb.search("can I get my money back?")
+        assert "Refunds" in result
+        assert "Shipping" not in result
+
+    def test_hybrid_ranking(self):
+        kb = _semantic_kb()
+        result = kb.search("refunds for broken item")
+        # Warranty is semantically closer, but the keyword hit on Refunds counts too
+        assert result.index("Warranty") < result.index("Refunds")
+
+    def test_max_results(self):
+        kb = _semantic_kb()
+        kb.min_similarity = 0.0
+        result = kb.search("can I get my money back?", max_results=1)
+        assert result.count("##") == 1
+
+    def test_add_embeds_entry(self):
+        calls = []
+
+        def embed(text):
+            calls.append(text)
+            return _embed(text)
+
+        kb = KnowledgeBase(embed_fn=embed)
+        kb.add(KnowledgeEntry(title="Refunds", content="Money back within 30 days"))
+        assert calls == ["Refunds\nMoney back within 30 days"]
+        kb.search("can I get my money back?")
+        kb.search("can I get my money back?")
+        assert len(calls) == 3
+
+    def test_empty(self):
+        kb = KnowledgeBase(embed_fn=_embed)
+        assert "No relevant knowledge found" in kb.search("can I get my money back?")
+
 
 class TestKnowledgeBaseToTool:
     def test_returns_tool_definition(self):
@@ -13,6 +13,9 @@ class TestShellTool:
         assert isinstance(shell_tool, ToolDefinition)
         assert shell_tool.name == "execute_shell"
 
+    def test_not_parallel_safe(self):
+        assert shell_tool.parallel_safe is False
+
     def test_has_parameters(self):
         assert "command" in shell_tool.parameters["properties"]
         assert "command" in shell_tool.parameters["required"]
@@ -65,3 +68,29 @@ class TestShellTool:
         mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
         _execute_shell("ls", timeout=60)
         assert mock_run.call_args.kwargs["timeout"] == 60
+
+    @patch("meganova.agents.tools.shell.subprocess.run")
+    def test_simple_command_skips_shell(self, mock_run):
+        mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
+        _execute_shell("grep -n 'a b' file.txt")
+        assert mock_run.call_args.args[0] == ["grep", "-n", "a b", "file.txt"]
+        assert "shell" not in mock_run.call_args.kwargs
+
+    @pytest.mark.parametrize("command", [
+        "ls | wc -l", "echo $HOME", "ls *.py", "cd /tmp && ls", "FOO=1 env", "cat ~/x",
+    ])
+    @patch("meganova.agents.tools.shell.subprocess.run")
+    def test_shell_syntax_uses_shell(self, mock_run, command):
+        mock_run.return_value = MagicMock(stdout="ok", stderr="", returncode=0)
+        _execute_shell(command)
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args[0] == command
+        assert mock_run.call_args.kwargs["shell"] is True
+
+    @patch("meganova.agents.tools.shell.subprocess.run")
+    def test_builtin_falls_back_to_shell(self, mock_run):
+        ok = MagicMock(stdout="", stderr="", returncode=3)
+        mock_run.side_effect = [FileNotFoundError("exit"), ok]
+        result = _execute_shell("exit 3")
+        assert mock_run.call_args.kwargs["shell"] is True
+        assert "Exit code: 3" in result
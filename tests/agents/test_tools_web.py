@@ -8,6 +8,16 @@ from meganova.agents.tools.web import web_fetch_tool, _web_fetch
 from meganova.agents.tools.base import ToolDefinition
 
 
+def _response(text, status_code=200, headers=None, chunk_size=1000):
+    resp = MagicMock()
+    resp.status_code = status_code
+    resp.headers = headers or {}
+    resp.iter_content.return_value = iter(
+        [text[i:i + chunk_size] for i in range(0, len(text), chunk_size)]
+    )
+    return resp
+
+
 class TestWebFetchTool:
     def test_is_tool_definition(self):
         assert isinstance(web_fetch_tool, ToolDefinition)
@@ -17,50 +27,57 @@ class TestWebFetchTool:
         assert "url" in web_fetch_tool.parameters["properties"]
         assert "url" in web_fetch_tool.parameters["required"]
 
-    @patch("meganova.agents.tools.web.requests.request")
+    @patch("meganova.agents.tools.web._SESSION.request")
     def test_successful_fetch(self, mock_request):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.text = "Hello World"
+        mock_resp = _response("Hello World")
         mock_request.return_value = mock_resp
 
         result = _web_fetch("https://example.com")
         assert "Status: 200" in result
         assert "Hello World" in result
 
-    @patch("meganova.agents.tools.web.requests.request")
+    @patch("meganova.agents.tools.web._SESSION.request")
     def test_truncates_long_response(self, mock_request):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.text = "x" * 10000
+        mock_resp = _response("x" * 10000)
         mock_request.return_value = mock_resp
 
         result = _web_fetch("https://example.com", max_length=100)
         assert "truncated" in result
-        assert "10000 total chars" in result
+        assert "x" * 101 not in result
+
+    @patch("meganova.agents.tools.web._SESSION.request")
+    def test_stops_reading_after_max_length(self, mock_request):
+        mock_resp = _response("x" * 10000, headers={"Content-Length": "10000"})
+        mock_request.return_value = mock_resp
 
-    @patch("meganova.agents.tools.web.requests.request")
+        result = _web_fetch("https://example.com", max_length=1500)
+
+        assert result.endswith("x" * 1500 + "\n... (truncated, 10000 total bytes)")
+        assert len(list(mock_resp.iter_content.return_value)) == 8
+        mock_resp.close.assert_called_once_with()
+
+    @patch("meganova.agents.tools.web._SESSION.request")
     def test_error_handling(self, mock_request):
         mock_request.side_effect = Exception("Connection refused")
         result = _web_fetch("https://bad.example.com")
         assert "Error fetching" in result
 
-    @patch("meganova.agents.tools.web.requests.request")
+    @patch("meganova.agents.tools.web._SESSION.request")
     def test_custom_method(self, mock_request):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.text = "{}"
+        mock_resp = _response("{}")
         mock_request.return_value = mock_resp
 
         _web_fetch("https://api.example.com", method="POST")
-        mock_request.assert_called_once_with("POST", "https://api.example.com", timeout=15)
+        mock_request.assert_called_once_with("POST", "https://api.example.com", timeout=15, stream=True)
 
-    @patch("meganova.agents.tools.web.requests.request")
+    @patch("meganova.agents.tools.web._SESSION.request")
     def test_default_get_method(self, mock_request):
-        mock_resp = MagicMock()
-        mock_resp.status_code = 200
-        mock_resp.text = "ok"
+        mock_resp = _response("ok")
         mock_request.return_value = mock_resp
 
         _web_fetch("https://example.com")
-        mock_request.assert_called_once_with("GET", "https://example.com", timeout=15)
+        mock_request.assert_called_once_with("GET", "https://example.com", timeout=15, stream=True)
+
+    def test_shared_session_refuses_cookies(self):
+        from meganova.agents.tools.web import _SESSION
+        assert _SESSION.cookies.get_policy().allowed_domains() == ()
@@ -1,5 +1,6 @@
 """Tests for CloudAgent."""
 
+import json
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -175,7 +176,7 @@ class TestCloudAgentCompletions:
             "created": 0, "model": "m",
             "choices": [{"index": 0, "delta": {"content": "Hi"}}],
         }
-        agent._transport.stream_sse.return_value = iter([chunk_data])
+        agent._transport.stream_sse_data.return_value = iter([json.dumps(chunk_data).encode()])
 
         result = agent.completions(
             [{"role": "user", "content": "Hi"}], stream=True,
@@ -184,6 +185,27 @@ class TestCloudAgentCompletions:
         assert len(chunks) == 1
         assert isinstance(chunks[0], ChatCompletionChunk)
 
+    def test_streaming_skips_malformed_events(self):
+        agent = CloudAgent(api_key="agent_test")
+        agent._transport = MagicMock()
+        agent._transport.stream_sse_data.return_value = iter([
+            b"{invalid}",
+            b'{"id": "c1", "created": 0, "model": "m", "choices": []}',
+        ])
+
+        chunks = list(agent.completions([{"role": "user", "content": "Hi"}], stream=True))
+        assert [c.id for c in chunks] == ["c1"]
+
+    def test_streaming_raises_on_schema_mismatch(self):
+        from pydantic import ValidationError
+
+        agent = CloudAgent(api_key="agent_test")
+        agent._transport = MagicMock()
+        agent._transport.stream_sse_data.return_value = iter([b'{"id": "c1"}'])
+
+        with pytest.raises(ValidationError):
+            list(agent.completions([{"role": "user", "content": "Hi"}], stream=True))
+
     def test_completions_payload(self):
         agent = CloudAgent(api_key="agent_test")
         agent._transport = MagicMock()
@@ -25,6 +25,26 @@ class TestCloudTransportInit:
         t = _make_transport(base_url="https://studio-api.meganova.ai/")
         assert t.base_url == "https://studio-api.meganova.ai"
 
+    def test_session_shared_per_base_url(self):
+        a = _make_transport()
+        b = _make_transport(base_url="https://studio-api.meganova.ai/")
+        c = _make_transport(base_url="https://other.example.com")
+        assert a._session is b._session
+        assert a._session is not c._session
+
+    def test_shared_session_refuses_cookies(self):
+        t = _make_transport()
+        assert t._session.cookies.get_policy().allowed_domains() == ()
+
+    def test_sessions_closed_at_exit(self):
+        from meganova.cloud import transport
+
+        t = _make_transport()
+        with patch.object(t._session, "close") as close:
+            transport._close_sessions()
+        close.assert_called_once()
+        assert transport._SESSIONS == {}
+
 
 class TestCloudTransportRequest:
     def test_successful_response(self):
@@ -154,6 +174,42 @@ class TestCloudTransportRetry:
         with pytest.raises(MeganovaError, match="Network error"):
             t.request("GET", "/info")
 
+    @patch("meganova._retry.random.uniform", return_value=0.0)
+    @patch("meganova.cloud.transport.time.sleep")
+    def test_backoff_is_capped(self, mock_sleep, _uniform):
+        t = _make_transport(max_retries=7)
+        t._session.request = MagicMock(side_effect=requests.ConnectionError("down"))
+
+        with pytest.raises(MeganovaError):
+            t.request("GET", "/info")
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+    @pytest.mark.parametrize("status", [429, 503])
+    @patch("meganova._retry.random.uniform", return_value=0.0)
+    @patch("meganova.cloud.transport.time.sleep")
+    def test_retries_honor_retry_after(self, mock_sleep, _uniform, status):
+        t = _make_transport(max_retries=1)
+        limited = MagicMock(status_code=status, headers={"Retry-After": "7"})
+        ok_resp = MagicMock(status_code=200)
+        ok_resp.json.return_value = {"ok": True}
+        t._session.request = MagicMock(side_effect=[limited, ok_resp])
+
+        assert t.request("GET", "/info") == {"ok": True}
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch("meganova.cloud.transport.time.sleep")
+    def test_429_raises_after_retries(self, mock_sleep):
+        t = _make_transport(max_retries=2)
+        limited = MagicMock(status_code=429, headers={}, reason="Too Many Requests")
+        limited.json.return_value = {"error": {"message": "rate limited"}}
+        t._session.request = MagicMock(return_value=limited)
+
+        with pytest.raises(RateLimitError):
+            t.request("GET", "/info")
+        assert t._session.request.call_count == 3
+
 
 class TestCloudTransportSSE:
     def test_stream_sse_yields_chunks(self):
@@ -169,7 +225,7 @@ class TestCloudTransportSSE:
 
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.iter_lines.return_value = iter(lines)
+        mock_resp.iter_lines.return_value = iter(l.encode() for l in lines)
         mock_resp.close = MagicMock()
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -189,9 +245,22 @@ class TestCloudTransportSSE:
         ]
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.iter_lines.return_value = iter(lines)
+        mock_resp.iter_lines.return_value = iter(l.encode() for l in lines)
         mock_resp.close = MagicMock()
         t._session.request = MagicMock(return_value=mock_resp)
 
         chunks = list(t.stream_sse("/completions"))
         assert len(chunks) == 1
+
+    def test_stream_sse_decodes_utf8_payloads(self):
+        t = _make_transport()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.iter_lines.return_value = iter([
+            'data: {"content": "héllo ✓"}'.encode(),
+            b"data: [DONE]",
+        ])
+        t._session.request = MagicMock(return_value=mock_resp)
+
+        assert list(t.stream_sse("/completions")) == [{"content": "héllo ✓"}]
+        mock_resp.iter_lines.assert_called_once_with()
@@ -213,6 +213,16 @@ def mock_async_transport():
     return transport
 
 
+@pytest.fixture(autouse=True)
+def _fresh_cloud_sessions():
+    """CloudTransport shares sessions per base URL; keep tests' mocks apart."""
+    from meganova.cloud import transport
+
+    transport._SESSIONS.clear()
+    yield
+    transport._SESSIONS.clear()
+
+
 @pytest.fixture
 def mock_cloud_transport():
     transport = MagicMock()
@@ -144,6 +144,19 @@ class TestCompletionsStreaming:
         chunks = list(comp.create(messages=[], model="m", stream=True))
         assert len(chunks) == 1
 
+    def test_stream_parses_utf8_bytes(self, mock_sync_transport):
+        sse_lines = [
+            b"  data: " + json.dumps(make_stream_chunk("héllo ✓"), ensure_ascii=False).encode() + b"\r",
+            b"data: [DONE]",
+        ]
+        mock_resp = MagicMock()
+        mock_resp.iter_lines.return_value = iter(sse_lines)
+        mock_sync_transport.request.return_value = mock_resp
+
+        comp = Completions(mock_sync_transport)
+        chunks = list(comp.create(messages=[], model="m", stream=True))
+        assert chunks[0].choices[0].delta["content"] == "héllo ✓"
+
 
 class TestChatInit:
     def test_has_completions(self, mock_sync_transport):
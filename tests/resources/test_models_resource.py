@@ -2,6 +2,7 @@
 
 import pytest
 
+from meganova.errors import APIError, MeganovaError
 from meganova.models.models_ import ModelInfo
 from meganova.resources.models_ import ModelsResource
 from tests.conftest import make_model_info, make_models_list
@@ -70,6 +71,88 @@ class TestModelsList:
         assert result == []
 
 
+class TestModelsListCache:
+    def test_no_max_age_always_fetches(self, mock_sync_transport):
+        mock_sync_transport.request.return_value = make_models_list("gpt-4")
+        resource = ModelsResource(mock_sync_transport)
+
+        resource.list()
+        resource.list()
+        assert mock_sync_transport.request.call_count == 2
+
+    def test_max_age_reuses_recent_catalog(self, mock_sync_transport):
+        mock_sync_transport.request.return_value = make_models_list("gpt-4")
+        resource = ModelsResource(mock_sync_transport)
+
+        resource.list()
+        result = resource.list(max_age=60)
+        assert [m.id for m in result] == ["gpt-4"]
+        assert mock_sync_transport.request.call_count == 1
+
+    def test_expired_catalog_is_refetched(self, mock_sync_transport):
+        mock_sync_transport.request.return_value = make_models_list("gpt-4")
+        resource = ModelsResource(mock_sync_transport)
+
+        resource.list()
+        resource.list(max_age=0)
+        assert mock_sync_transport.request.call_count == 2
+
+    def test_stale_catalog_served_on_network_error(self, mock_sync_transport):
+        mock_sync_transport.request.side_effect = [
+            make_models_list("gpt-4"),
+            MeganovaError("Network error: refused"),
+        ]
+        resource = ModelsResource(mock_sync_transport)
+
+        resource.list()
+        assert [m.id for m in resource.list(max_age=0)] == ["gpt-4"]
+
+    def test_client_errors_are_raised(self, mock_sync_transport):
+        mock_sync_transport.request.side_effect = [
+            make_models_list("gpt-4"),
+            APIError("forbidden", status=403),
+        ]
+        resource = ModelsResource(mock_sync_transport)
+
+        resource.list()
+        with pytest.raises(APIError):
+            resource.list(max_age=0)
+
+    def test_concurrent_lists_share_one_request(self, mock_sync_transport):
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+
+        release = threading.Event()
+
+        def slow_request(*args, **kwargs):
+            release.wait(5)
+            return make_models_list("gpt-4")
+
+        mock_sync_transport.request.side_effect = slow_request
+        resource = ModelsResource(mock_sync_transport)
+
+        with ThreadPoolExecutor(4) as pool:
+            futures = [pool.submit(resource.list) for _ in range(4)]
+            while not resource._cache._inflight:
+                pass
+            # Give the other callers time to join the in-flight fetch
+            threading.Event().wait(0.05)
+            release.set()
+            results = [f.result() for f in futures]
+
+        assert all([m.id for m in r] == ["gpt-4"] for r in results)
+        assert mock_sync_transport.request.call_count == 1
+        assert resource._cache._inflight == {}
+
+    def test_failed_fetch_is_not_left_in_flight(self, mock_sync_transport):
+        mock_sync_transport.request.side_effect = APIError("forbidden", status=403)
+        resource = ModelsResource(mock_sync_transport)
+
+        with pytest.raises(APIError):
+            resource.list()
+        assert resource._cache._inflight == {}
+
+
 class TestModelsGet:
     def test_get_by_id(self, mock_sync_transport):
         mock_sync_transport.request.return_value = make_model_info("gpt-4", name="GPT-4")
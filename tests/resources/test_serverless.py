@@ -54,3 +54,12 @@ class TestServerlessListModels:
 
         result = resource.list_models()
         assert result.models[0].model_name == "llama-3"
+
+    def test_max_age_caches_per_modality(self, mock_sync_transport):
+        mock_sync_transport.request.return_value = make_serverless_response()
+        resource = ServerlessResource(mock_sync_transport)
+
+        resource.list_models(max_age=60)
+        resource.list_models(max_age=60)
+        resource.list_models("text_to_image", max_age=60)
+        assert mock_sync_transport.request.call_count == 2
@@ -1,5 +1,7 @@
 """Tests for the async MegaNova client."""
 
+from unittest.mock import patch
+
 import pytest
 
 from meganova.async_client import AsyncMegaNova
@@ -35,6 +37,19 @@ class TestAsyncMegaNovaInit:
         client = AsyncMegaNova(api_key="k", user_agent_extra="myapp/2.0")
         assert "myapp/2.0" in client._transport.user_agent
 
+    def test_custom_max_connections(self):
+        client = AsyncMegaNova(api_key="k", max_connections=64)
+        assert client._transport.max_connections == 64
+        pool = client._transport._client._transport._pool
+        assert pool._max_connections == 64
+
+    def test_http2_passed_to_httpx(self):
+        with patch("httpx.AsyncClient") as client_cls:
+            AsyncMegaNova(api_key="k")
+            assert client_cls.call_args.kwargs["http2"] is False
+            AsyncMegaNova(api_key="k", http2=True)
+            assert client_cls.call_args.kwargs["http2"] is True
+
 
 class TestAsyncMegaNovaResources:
     def test_chat_resource(self):
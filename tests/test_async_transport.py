@@ -148,6 +148,19 @@ class TestAsyncTransportRetry:
             with pytest.raises(MeganovaError, match="Network error"):
                 await t.request("GET", "/models")
 
+    @pytest.mark.parametrize("status", [429, 503])
+    async def test_retries_with_retry_after(self, status):
+        t = _make_async_transport(max_retries=1)
+        limited = MagicMock(status_code=status, headers={"Retry-After": "4"})
+        ok_resp = MagicMock(status_code=200)
+        ok_resp.json.return_value = {"ok": True}
+        t._client.request = AsyncMock(side_effect=[limited, ok_resp])
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as sleep, \
+                patch("meganova._retry.random.uniform", return_value=0.0):
+            assert await t.request("GET", "/models") == {"ok": True}
+        sleep.assert_awaited_once_with(4.0)
+
     async def test_does_not_retry_meganova_errors(self):
         t = _make_async_transport(max_retries=2)
         mock_resp = MagicMock()
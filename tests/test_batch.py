@@ -0,0 +1,189 @@
+"""Tests for client-side micro-batching."""
+
+import threading
+from concurrent.futures import Future
+from unittest.mock import MagicMock
+
+import pytest
+
+from meganova.batch import AutoBatcher, run_with_checkpoint
+from meganova.errors import MeganovaError
+from meganova.models.chat import ChatResponse
+from tests.conftest import make_chat_response
+
+
+def _ask(batcher, text):
+    return batcher.create(messages=[{"role": "user", "content": text}], model="m")
+
+
+def _in_threads(fn, args):
+    results = [None] * len(args)
+
+    def run(i):
+        results[i] = fn(args[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(args))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return results
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = lambda **kw: ChatResponse(
+        **make_chat_response(content=kw["messages"][0]["content"].upper())
+    )
+    return client
+
+
+class TestAutoBatcher:
+    def test_single_request(self, client):
+        with AutoBatcher(client, max_wait_ms=1) as batcher:
+            result = _ask(batcher, "hi")
+        assert result.choices[0].message.content == "HI"
+
+    def test_concurrent_requests_get_own_results(self, client):
+        with AutoBatcher(client, max_wait_ms=20) as batcher:
+            results = _in_threads(lambda t: _ask(batcher, t), ["a", "b", "c", "d"])
+        assert [r.choices[0].message.content for r in results] == ["A", "B", "C", "D"]
+
+    def test_errors_propagate(self, client):
+        client.chat.completions.create.side_effect = RuntimeError("boom")
+        with AutoBatcher(client, max_wait_ms=1) as batcher:
+            with pytest.raises(RuntimeError, match="boom"):
+                _ask(batcher, "hi")
+
+    def test_stream_bypasses(self, client):
+        client.chat.completions.create.side_effect = None
+        with AutoBatcher(client) as batcher:
+            batcher.create(messages=[], model="m", stream=True)
+        client.chat.completions.create.assert_called_once_with(
+            messages=[], model="m", stream=True
+        )
+
+    def test_batch_endpoint(self, client):
+        def batch(method, path, json):
+            return {"responses": [
+                make_chat_response(content=r["messages"][0]["content"] * 2)
+                for r in json["requests"]
+            ]}
+
+        client._transport.request.side_effect = batch
+        with AutoBatcher(client, max_wait_ms=50, batch_path="/chat/completions/batch") as batcher:
+            results = _in_threads(lambda t: _ask(batcher, t), ["a", "b", "c"])
+
+        assert [r.choices[0].message.content for r in results] == ["aa", "bb", "cc"]
+        sizes = [len(c.kwargs["json"]["requests"]) for c in client._transport.request.call_args_list]
+        assert sum(sizes) == 3
+        assert max(sizes) > 1
+
+    def test_short_batch_response_fails_every_request(self, client):
+        client._transport.request.return_value = {"responses": [make_chat_response()]}
+        batcher = AutoBatcher(client, batch_path="/chat/completions/batch")
+        futures = [Future(), Future()]
+        batcher._flush([({"messages": []}, f) for f in futures])
+        batcher.close()
+        for future in futures:
+            with pytest.raises(MeganovaError, match="1 responses for 2 requests"):
+                future.result(timeout=1)
+
+    def test_bins_by_prompt_length(self, client):
+        batcher = AutoBatcher(client, bins=(10, 100))
+        short = ({"messages": [{"content": "x" * 8}]}, None)
+        medium = ({"messages": [{"content": "x" * 200}]}, None)
+        long = ({"messages": [{"content": "x" * 4000}]}, None)
+        groups = batcher._bin([long, short, medium, short])
+        batcher.close()
+        assert groups == [[short, short], [medium], [long]]
+
+    def test_without_batch_path_sends_immediately(self, client):
+        import time
+
+        with AutoBatcher(client, max_wait_ms=10_000) as batcher:
+            started = time.monotonic()
+            assert _ask(batcher, "hi").choices[0].message.content == "HI"
+            assert time.monotonic() - started < 1
+            assert batcher._worker is None
+
+    def test_close_resolves_requests_submitted_concurrently(self, client):
+        client._transport.request.side_effect = lambda method, path, json: {
+            "responses": [make_chat_response(content="ok") for _ in json["requests"]]
+        }
+        batcher = AutoBatcher(client, max_wait_ms=5, batch_path="/batch")
+        futures = []
+
+        def submit():
+            for _ in range(50):
+                try:
+                    futures.append(batcher.submit(messages=[], model="m"))
+                except RuntimeError:
+                    return
+
+        threads = [threading.Thread(target=submit) for _ in range(4)]
+        for t in threads:
+            t.start()
+        batcher.close()
+        for t in threads:
+            t.join()
+        assert all(f.done() for f in futures)
+
+    def test_submit_after_close_raises(self, client):
+        batcher = AutoBatcher(client)
+        batcher.close()
+        with pytest.raises(RuntimeError):
+            _ask(batcher, "hi")
+
+
+class TestRunWithCheckpoint:
+    def test_runs_all_and_records(self, tmp_path):
+        path = str(tmp_path / "out.jsonl")
+        results = run_with_checkpoint([(str(i), i) for i in range(5)], path, lambda x: x * x)
+        assert results == {"0": 0, "1": 1, "2": 4, "3": 9, "4": 16}
+        assert results.errors == {}
+        with open(path) as f:
+            assert len(f.readlines()) == 5
+
+    def test_resume_skips_completed(self, tmp_path):
+        path = str(tmp_path / "out.jsonl")
+        run_with_checkpoint([("a", 1), ("b", 2)], path, lambda x: x * 10)
+
+        fn = MagicMock(side_effect=lambda x: x * 10)
+        results = run_with_checkpoint([("a", 1), ("b", 2), ("c", 3)], path, fn)
+        assert results == {"a": 10, "b": 20, "c": 30}
+        fn.assert_called_once_with(3)
+
+    def test_failures_not_recorded_and_retried(self, tmp_path):
+        path = str(tmp_path / "out.jsonl")
+
+        def flaky(x):
+            if x == 2:
+                raise RuntimeError("503")
+            return x
+
+        results = run_with_checkpoint([("1", 1), ("2", 2)], path, flaky)
+        assert results == {"1": 1}
+        assert list(results.errors) == ["2"]
+        assert str(results.errors["2"]) == "503"
+
+        results = run_with_checkpoint([("1", 1), ("2", 2)], path, lambda x: x)
+        assert results == {"1": 1, "2": 2}
+        assert results.errors == {}
+
+    def test_non_string_ids_rejected(self, tmp_path):
+        fn = MagicMock()
+        with pytest.raises(TypeError):
+            run_with_checkpoint([(1, 1)], str(tmp_path / "out.jsonl"), fn)
+        fn.assert_not_called()
+
+    def test_ignores_truncated_line(self, tmp_path):
+        path = tmp_path / "out.jsonl"
+        path.write_text('{"id": "a", "result": 1}\n{"id": "b", "res')
+        results = run_with_checkpoint([("a", 0), ("b", 0)], str(path), lambda x: 2)
+        assert results == {"a": 1, "b": 2}
+
+        fn = MagicMock()
+        assert run_with_checkpoint([("b", 0)], str(path), fn) == {"b": 2}
+        fn.assert_not_called()
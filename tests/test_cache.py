@@ -0,0 +1,237 @@
+"""Tests for client-side response caching."""
+
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from meganova.cache import EmbeddingCache, SemanticChatCache
+from meganova.models.chat import ChatResponse
+from tests.conftest import make_chat_response
+
+VECTORS = {
+    "user: What is the capital of France?": [1.0, 0.0, 0.0],
+    "user: what's the capital of france": [0.99, 0.05, 0.0],
+    "user: Write a poem": [0.0, 1.0, 0.0],
+}
+
+
+def _embed(text):
+    return VECTORS[text]
+
+
+@pytest.fixture
+def client():
+    client = MagicMock()
+    client.chat.completions.create.side_effect = (
+        lambda **kw: ChatResponse(**make_chat_response(content="Paris"))
+    )
+    return client
+
+
+def _ask(cache, text, **kwargs):
+    return cache.create(
+        messages=[
+            {"role": "system", "content": "Be brief"},
+            {"role": "user", "content": text},
+        ],
+        model="m",
+        **kwargs,
+    )
+
+
+class TestSemanticChatCache:
+    def test_miss_calls_api(self, client):
+        cache = SemanticChatCache(client, _embed)
+        result = _ask(cache, "What is the capital of France?")
+
+        assert result.choices[0].message.content == "Paris"
+        assert client.chat.completions.create.call_count == 1
+        assert cache.misses == 1
+
+    def test_exact_repeat_is_served_from_cache(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?")
+        result = _ask(cache, "What is the capital of France?")
+
+        assert isinstance(result, ChatResponse)
+        assert result.choices[0].message.content == "Paris"
+        assert client.chat.completions.create.call_count == 1
+        assert cache.hits == 1
+
+    def test_near_duplicate_hits(self, client):
+        cache = SemanticChatCache(client, _embed, threshold=0.95)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "what's the capital of france")
+        assert client.chat.completions.create.call_count == 1
+
+    def test_dissimilar_prompt_misses(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "Write a poem")
+        assert client.chat.completions.create.call_count == 2
+
+    def test_namespaced_by_model(self, client):
+        cache = SemanticChatCache(client, _embed)
+        messages = [{"role": "user", "content": "What is the capital of France?"}]
+        cache.create(messages=messages, model="a")
+        cache.create(messages=messages, model="b")
+        assert client.chat.completions.create.call_count == 2
+
+    def test_namespaced_by_system_prompt(self, client):
+        cache = SemanticChatCache(client, _embed)
+        for system in ("Be brief", "Be verbose"):
+            cache.create(
+                messages=[
+                    {"role": "system", "content": system},
+                    {"role": "user", "content": "What is the capital of France?"},
+                ],
+                model="m",
+            )
+        assert client.chat.completions.create.call_count == 2
+
+    @pytest.mark.parametrize("params", [
+        {"max_tokens": 5},
+        {"temperature": 0.2},
+        {"tool_choice": "none"},
+    ])
+    def test_namespaced_by_generation_params(self, client, params):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "What is the capital of France?", **params)
+        _ask(cache, "What is the capital of France?", **params)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_no_cache_bypasses(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "What is the capital of France?", no_cache=True)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_high_temperature_bypasses(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?", temperature=0.9)
+        _ask(cache, "What is the capital of France?", temperature=0.9)
+        assert client.chat.completions.create.call_count == 2
+
+    def test_stream_bypasses(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?", stream=True)
+        assert cache.hits == 0 and cache.misses == 0
+
+    def test_expired_entries_ignored(self, client):
+        cache = SemanticChatCache(client, _embed, ttl=-1)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "What is the capital of France?")
+        assert client.chat.completions.create.call_count == 2
+
+    def test_expired_entries_deleted(self, client):
+        cache = SemanticChatCache(client, _embed, ttl=-1)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "Write a poem")
+        assert cache._db.execute("SELECT COUNT(*) FROM chat_cache").fetchone()[0] == 0
+
+    def test_max_entries_drops_oldest(self, client):
+        cache = SemanticChatCache(client, _embed, max_entries=1)
+        _ask(cache, "What is the capital of France?")
+        _ask(cache, "Write a poem")
+        assert cache._db.execute("SELECT COUNT(*) FROM chat_cache").fetchone()[0] == 1
+        _ask(cache, "Write a poem")
+        _ask(cache, "What is the capital of France?")
+        assert client.chat.completions.create.call_count == 3
+
+    def test_entries_of_other_dimensions_ignored(self, client):
+        cache = SemanticChatCache(client, _embed)
+        cache.store("ns", [1.0, 0.0], ChatResponse(**make_chat_response()))
+        assert cache.lookup("ns", [1.0, 0.0, 0.0]) is None
+        assert cache.lookup("ns", [1.0, 0.0]) is not None
+
+    def test_clear(self, client):
+        cache = SemanticChatCache(client, _embed)
+        _ask(cache, "What is the capital of France?")
+        cache.clear()
+        _ask(cache, "What is the capital of France?")
+        assert client.chat.completions.create.call_count == 2
+
+    def test_persists_to_file(self, client, tmp_path):
+        path = str(tmp_path / "cache.db")
+        first = SemanticChatCache(client, _embed, path=path)
+        _ask(first, "What is the capital of France?")
+        first.close()
+
+        second = SemanticChatCache(client, _embed, path=path)
+        _ask(second, "What is the capital of France?")
+        assert client.chat.completions.create.call_count == 1
+
+    def test_tool_calls_are_part_of_key(self, client):
+        embed = MagicMock(return_value=[1.0, 0.0])
+        cache = SemanticChatCache(client, embed)
+        cache.create(
+            messages=[
+                {"role": "user", "content": "Weather?"},
+                {"role": "assistant", "content": None, "tool_calls": [
+                    {"id": "c1", "type": "function",
+                     "function": {"name": "weather", "arguments": '{"city": "Paris"}'}},
+                ]},
+            ],
+            model="m",
+        )
+        text = embed.call_args.args[0]
+        assert 'weather({"city": "Paris"})' in text
+
+    async def test_acreate_uses_async_client(self, client):
+        async_client = MagicMock()
+        async_client.chat.completions.create = AsyncMock(
+            return_value=ChatResponse(**make_chat_response(content="Paris"))
+        )
+        cache = SemanticChatCache(client, _embed)
+        messages = [{"role": "user", "content": "What is the capital of France?"}]
+
+        first = await cache.acreate(async_client, messages=messages, model="m")
+        second = await cache.acreate(async_client, messages=messages, model="m")
+
+        assert first.choices[0].message.content == "Paris"
+        assert second.choices[0].message.content == "Paris"
+        assert async_client.chat.completions.create.await_count == 1
+        client.chat.completions.create.assert_not_called()
+        assert cache.hits == 1
+
+
+class TestEmbeddingCache:
+    def test_embeds_each_text_once(self):
+        embed = MagicMock(side_effect=lambda text: [float(len(text))])
+        cache = EmbeddingCache(embed)
+
+        assert cache("hello") == [5.0]
+        assert cache("hello") == [5.0]
+        assert cache("hi") == [2.0]
+        assert embed.call_count == 2
+        assert cache.hits == 1
+        assert cache.misses == 2
+
+    def test_bounded_size(self):
+        cache = EmbeddingCache(lambda text: [0.0], max_items=10)
+        for i in range(25):
+            cache(str(i))
+        assert len(cache) <= 10
+
+    def test_eviction_keeps_frequently_used(self):
+        embed = MagicMock(side_effect=lambda text: [0.0])
+        cache = EmbeddingCache(embed, max_items=10)
+        cache("popular")
+        for _ in range(20):
+            cache("popular")
+        for i in range(9):
+            cache(f"once-{i}")
+
+        cache("overflow")
+        calls = embed.call_count
+        cache("popular")
+        assert embed.call_count == calls
+
+    def test_clear(self):
+        embed = MagicMock(side_effect=lambda text: [0.0])
+        cache = EmbeddingCache(embed)
+        cache("a")
+        cache.clear()
+        cache("a")
+        assert embed.call_count == 2
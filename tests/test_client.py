@@ -1,5 +1,7 @@
 """Tests for the sync MegaNova client."""
 
+from unittest.mock import MagicMock
+
 import pytest
 
 from meganova.client import MegaNova
@@ -52,10 +54,32 @@ class TestMegaNovaInit:
         client = MegaNova(api_key="k", max_retries=5)
         assert client._transport.max_retries == 5
 
+    def test_custom_max_connections(self):
+        client = MegaNova(api_key="k", max_connections=64)
+        adapter = client._transport._session.get_adapter("https://api.meganova.ai/v1")
+        assert adapter._pool_maxsize == 64
+
     def test_user_agent_contains_version(self):
         client = MegaNova(api_key="k")
         assert "meganova-python/" in client._transport.user_agent
 
+    def test_shared_session(self):
+        import requests
+
+        shared = requests.Session()
+        a = MegaNova(api_key="k", session=shared)
+        b = MegaNova(api_key="k2", session=shared)
+        assert a._transport._session is b._transport._session is shared
+
+    def test_warmup_is_opt_in(self):
+        from unittest.mock import patch
+
+        with patch("meganova.client.SyncTransport.warmup") as warmup:
+            MegaNova(api_key="k")
+            warmup.assert_not_called()
+            MegaNova(api_key="k", warmup=True)
+            warmup.assert_called_once()
+
     def test_user_agent_extra(self):
         client = MegaNova(api_key="k", user_agent_extra="myapp/1.0")
         assert "myapp/1.0" in client._transport.user_agent
@@ -97,3 +121,63 @@ class TestMegaNovaResources:
     def test_usage_resource(self):
         client = MegaNova(api_key="k")
         assert isinstance(client.usage, UsageResource)
+
+    def test_resource_created_once_and_shares_transport(self):
+        client = MegaNova(api_key="k")
+        assert client.chat is client.chat
+        assert client.chat.completions._transport is client._transport
+
+    def test_concurrent_first_access_builds_one_resource(self, monkeypatch):
+        import threading
+        import time
+        from concurrent.futures import ThreadPoolExecutor
+
+        class SlowModels(ModelsResource):
+            def __init__(self, transport):
+                time.sleep(0.05)  # widen the window between lookup and setattr
+                super().__init__(transport)
+
+        monkeypatch.setattr("meganova.resources.models_.ModelsResource", SlowModels)
+        client = MegaNova(api_key="k")
+        start = threading.Barrier(4)
+
+        def first_access(_):
+            start.wait()
+            return client.models
+
+        with ThreadPoolExecutor(4) as pool:
+            resources = list(pool.map(first_access, range(4)))
+
+        assert all(r is resources[0] for r in resources)
+
+    def test_unknown_attribute_raises(self):
+        client = MegaNova(api_key="k")
+        with pytest.raises(AttributeError):
+            client.not_a_resource
+
+    def test_import_does_not_load_resources(self):
+        import subprocess
+        import sys
+
+        code = (
+            "import sys; from meganova import MegaNova; MegaNova(api_key='k').models; "
+            "print('meganova.resources.chat' in sys.modules, "
+            "'meganova.resources.models_' in sys.modules)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False True"
+
+
+class TestMegaNovaClose:
+    def test_close_closes_transport(self):
+        client = MegaNova(api_key="k")
+        client._transport.close = MagicMock()
+        client.close()
+        client._transport.close.assert_called_once()
+
+    def test_context_manager(self):
+        with MegaNova(api_key="k") as client:
+            client._transport.close = MagicMock()
+        client._transport.close.assert_called_once()
@@ -0,0 +1,29 @@
+"""Tests for the JSON decoding helper."""
+
+import pytest
+
+from meganova import _json
+
+
+@pytest.fixture(params=["default", "stdlib"])
+def decoder(request, monkeypatch):
+    if request.param == "stdlib":
+        monkeypatch.setattr(_json, "orjson", None)
+    return _json
+
+
+class TestLoads:
+    def test_parses_str_and_bytes(self, decoder):
+        assert decoder.loads('{"city": "Paris"}') == {"city": "Paris"}
+        assert decoder.loads(b'{"n": [1, 2]}') == {"n": [1, 2]}
+
+    def test_invalid_raises_json_decode_error(self, decoder):
+        with pytest.raises(decoder.JSONDecodeError):
+            decoder.loads('{"city": ')
+
+
+class TestDumps:
+    def test_compact_utf8(self, decoder):
+        assert decoder.dumps({"city": "Zürich", "n": [1, 2]}) == (
+            '{"city":"Zürich","n":[1,2]}'.encode()
+        )
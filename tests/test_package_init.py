@@ -1,5 +1,10 @@
 """Tests for meganova package __init__ exports."""
 
+import subprocess
+import sys
+
+import pytest
+
 import meganova
 
 
@@ -49,3 +54,36 @@ class TestPackageExports:
             "VideoGeneration",
         }
         assert set(meganova.__all__) == expected
+
+
+class TestLazyExports:
+    def test_from_import(self):
+        from meganova import AsyncMegaNova, CloudAgent
+        from meganova.async_client import AsyncMegaNova as Direct
+        assert AsyncMegaNova is Direct
+        assert CloudAgent.__name__ == "CloudAgent"
+
+    def test_unknown_attribute_raises(self):
+        with pytest.raises(AttributeError):
+            meganova.NotAThing
+
+    def test_import_does_not_load_optional_modules(self):
+        code = (
+            "import sys, meganova; "
+            "print(any(m in sys.modules for m in "
+            "('meganova.cloud', 'meganova.async_client', 'meganova.agents')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.strip() == "False"
+
+    def test_cloud_import_does_not_load_models(self):
+        code = (
+            "import sys, meganova.cloud as c; "
+            "print('meganova.cloud.models' in sys.modules, c.CloudAgent.__name__)"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert out.stdout.split() == ["False", "CloudAgent"]
@@ -0,0 +1,40 @@
+"""Tests for the shared retry timing helpers."""
+
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock, patch
+
+from meganova import _retry
+
+
+class TestRetryAfter:
+    def test_delta_seconds(self):
+        assert _retry.retry_after(MagicMock(headers={"Retry-After": "7"})) == 7.0
+
+    def test_http_date(self):
+        resp = MagicMock(headers={"Retry-After": formatdate(time.time() + 60, usegmt=True)})
+        assert 55 <= _retry.retry_after(resp) <= 60
+
+    def test_past_date_is_zero(self):
+        resp = MagicMock(headers={"Retry-After": formatdate(time.time() - 60, usegmt=True)})
+        assert _retry.retry_after(resp) == 0.0
+
+    def test_missing_or_invalid(self):
+        assert _retry.retry_after(MagicMock(headers={})) is None
+        assert _retry.retry_after(MagicMock(headers={"Retry-After": "soon"})) is None
+
+
+class TestBackoff:
+    @patch("meganova._retry.random.uniform", return_value=0.0)
+    def test_exponential_and_capped(self, _uniform):
+        delays = [_retry.backoff(attempt) for attempt in range(7)]
+        assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0]
+
+    @patch("meganova._retry.random.uniform", return_value=0.0)
+    def test_retry_after_overrides_and_is_capped(self, _uniform):
+        assert _retry.backoff(0, retry_after=5.0) == 5.0
+        assert _retry.backoff(0, retry_after=600.0) == _retry.RETRY_MAX_DELAY
+
+    def test_jitter_bounded(self):
+        for _ in range(100):
+            assert 1.0 <= _retry.backoff(0) <= 1.0 + _retry.RETRY_BASE_DELAY
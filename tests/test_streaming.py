@@ -0,0 +1,51 @@
+"""Tests for streamed output helpers."""
+
+import io
+from unittest.mock import MagicMock
+
+from meganova.streaming import StreamPrinter
+
+
+class TestStreamPrinter:
+    def test_writes_all_text_in_order(self):
+        out = io.StringIO()
+        with StreamPrinter(out) as printer:
+            for piece in ["Hel", "lo", ", ", "world"]:
+                printer.write(piece)
+        assert out.getvalue() == "Hello, world"
+
+    def test_skips_empty_pieces(self):
+        out = io.StringIO()
+        with StreamPrinter(out) as printer:
+            printer.write("")
+            printer.write(None)
+            printer.write("a")
+        assert out.getvalue() == "a"
+
+    def test_coalesces_writes(self):
+        out = MagicMock()
+        with StreamPrinter(out, window_ms=200) as printer:
+            for piece in "abcdefgh":
+                printer.write(piece)
+        written = "".join(c.args[0] for c in out.write.call_args_list)
+        assert written == "abcdefgh"
+        assert out.write.call_count < 8
+
+    def test_default_stdout_writes_to_fd(self, monkeypatch):
+        import os
+        import sys
+
+        read_fd, write_fd = os.pipe()
+        fake_stdout = MagicMock()
+        fake_stdout.fileno.return_value = write_fd
+        fake_stdout.encoding = "utf-8"
+        monkeypatch.setattr(sys, "stdout", fake_stdout)
+
+        with StreamPrinter() as printer:
+            printer.write("héllo")
+        os.close(write_fd)
+
+        assert os.read(read_fd, 100).decode("utf-8") == "héllo"
+        os.close(read_fd)
+        fake_stdout.write.assert_not_called()
+        fake_stdout.flush.assert_called()
@@ -41,12 +41,22 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {"result": "ok"}
+        mock_resp.content = json.dumps({"result": "ok"}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         result = t.request("GET", "/models")
         assert result == {"result": "ok"}
 
+    def test_parses_utf8_body_bytes(self):
+        t = _make_transport()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = '{"text": "héllo ✓"}'.encode("utf-8")
+        t._session.request = MagicMock(return_value=mock_resp)
+
+        assert t.request("GET", "/models") == {"text": "héllo ✓"}
+        mock_resp.json.assert_not_called()
+
     def test_stream_returns_response_object(self):
         t = _make_transport()
         mock_resp = MagicMock()
@@ -60,7 +70,7 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("POST", "/chat/completions", json={"model": "gpt-4"})
@@ -71,7 +81,7 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("GET", "/models")
@@ -83,7 +93,7 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("GET", "/models")
@@ -94,18 +104,33 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("GET", "/models")
         headers = t._session.request.call_args.kwargs["headers"]
         assert headers["X-MN-SDK"] == "python"
 
+    def test_upload_does_not_leak_content_type(self):
+        import io
+
+        t = _make_transport()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = json.dumps({}).encode()
+        t._session.request = MagicMock(return_value=mock_resp)
+
+        t.request("POST", "/audio/transcriptions",
+                  files={"file": ("a.mp3", io.BytesIO(b"a"), "audio/mpeg")})
+        assert "multipart" in t._session.request.call_args.kwargs["headers"]["Content-Type"]
+        t.request("GET", "/models")
+        assert "Content-Type" not in t._session.request.call_args.kwargs["headers"]
+
     def test_base_url_override(self):
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("GET", "/api/v1/foo", base_url_override="https://other.api")
@@ -116,7 +141,7 @@ class TestSyncTransportRequest:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {}
+        mock_resp.content = json.dumps({}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("GET", "/models", params={"type": "chat"})
@@ -128,7 +153,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 401
-        mock_resp.json.return_value = {"error": {"message": "bad key", "code": "auth"}}
+        mock_resp.content = json.dumps({"error": {"message": "bad key", "code": "auth"}}).encode()
         mock_resp.reason = "Unauthorized"
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -139,7 +164,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 429
-        mock_resp.json.return_value = {"error": {"message": "rate limited"}}
+        mock_resp.content = json.dumps({"error": {"message": "rate limited"}}).encode()
         mock_resp.reason = "Too Many Requests"
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -150,7 +175,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 400
-        mock_resp.json.return_value = {"error": {"message": "bad request"}}
+        mock_resp.content = json.dumps({"error": {"message": "bad request"}}).encode()
         mock_resp.reason = "Bad Request"
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -161,7 +186,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 500
-        mock_resp.json.return_value = {"error": {"message": "internal error"}}
+        mock_resp.content = json.dumps({"error": {"message": "internal error"}}).encode()
         mock_resp.reason = "Internal Server Error"
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -172,7 +197,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 400
-        mock_resp.json.return_value = {"error": "plain string error"}
+        mock_resp.content = json.dumps({"error": "plain string error"}).encode()
         mock_resp.reason = "Bad Request"
         t._session.request = MagicMock(return_value=mock_resp)
 
@@ -183,7 +208,7 @@ class TestSyncTransportErrors:
         t = _make_transport(max_retries=0)
         mock_resp = MagicMock()
         mock_resp.status_code = 502
-        mock_resp.json.side_effect = ValueError("not json")
+        mock_resp.content = b"<html>Bad Gateway</html>"
         mock_resp.text = "Bad Gateway"
         mock_resp.reason = "Bad Gateway"
         t._session.request = MagicMock(return_value=mock_resp)
@@ -199,7 +224,7 @@ class TestSyncTransportRetry:
 
         ok_resp = MagicMock()
         ok_resp.status_code = 200
-        ok_resp.json.return_value = {"ok": True}
+        ok_resp.content = json.dumps({"ok": True}).encode()
 
         t._session.request = MagicMock(
             side_effect=[
@@ -212,13 +237,14 @@ class TestSyncTransportRetry:
         assert result == {"ok": True}
         assert mock_sleep.call_count == 1
 
+    @patch("meganova._retry.random.uniform", return_value=0.0)
     @patch("meganova.transport.time.sleep")
-    def test_exponential_backoff(self, mock_sleep):
+    def test_exponential_backoff(self, mock_sleep, _uniform):
         t = _make_transport(max_retries=2)
 
         ok_resp = MagicMock()
         ok_resp.status_code = 200
-        ok_resp.json.return_value = {"ok": True}
+        ok_resp.content = json.dumps({"ok": True}).encode()
 
         t._session.request = MagicMock(
             side_effect=[
@@ -234,6 +260,32 @@ class TestSyncTransportRetry:
         mock_sleep.assert_any_call(1)
         mock_sleep.assert_any_call(2)
 
+    @pytest.mark.parametrize("status", [429, 503])
+    @patch("meganova._retry.random.uniform", return_value=0.0)
+    @patch("meganova.transport.time.sleep")
+    def test_retries_honor_retry_after(self, mock_sleep, _uniform, status):
+        t = _make_transport(max_retries=1)
+        limited = MagicMock(status_code=status, headers={"Retry-After": "4"})
+        ok_resp = MagicMock(status_code=200)
+        ok_resp.content = json.dumps({"ok": True}).encode()
+        t._session.request = MagicMock(side_effect=[limited, ok_resp])
+
+        assert t.request("POST", "/chat/completions") == {"ok": True}
+        mock_sleep.assert_called_once_with(4.0)
+        limited.close.assert_called_once_with()
+
+    @patch("meganova.transport.time.sleep")
+    def test_429_raises_after_retries(self, mock_sleep):
+        t = _make_transport(max_retries=2)
+        limited = MagicMock(status_code=429, headers={}, reason="Too Many Requests")
+        limited.content = json.dumps({"error": {"message": "slow down"}}).encode()
+        t._session.request = MagicMock(return_value=limited)
+
+        with pytest.raises(RateLimitError):
+            t.request("GET", "/models")
+        assert t._session.request.call_count == 3
+        assert mock_sleep.call_count == 2
+
     @patch("meganova.transport.time.sleep")
     def test_exhausted_retries_raises(self, mock_sleep):
         t = _make_transport(max_retries=1)
@@ -261,9 +313,104 @@ class TestSyncTransportRetry:
         t = _make_transport()
         mock_resp = MagicMock()
         mock_resp.status_code = 200
-        mock_resp.json.return_value = {"text": "hello"}
+        mock_resp.content = json.dumps({"text": "hello"}).encode()
         t._session.request = MagicMock(return_value=mock_resp)
 
         t.request("POST", "/audio/transcriptions", files={"file": ("a.mp3", b"data", "audio/mpeg")}, data={"model": "whisper"})
         call_kwargs = t._session.request.call_args.kwargs
         assert call_kwargs["json"] is None
+
+
+class TestSyncTransportSession:
+    def test_session_reused_across_requests(self):
+        t = _make_transport()
+        session = t._session
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = json.dumps({}).encode()
+        session.request = MagicMock(return_value=mock_resp)
+
+        t.request("GET", "/models")
+        t.request("GET", "/models")
+        assert t._session is session
+        assert session.request.call_count == 2
+
+    def test_pool_sized_for_concurrency(self):
+        t = _make_transport()
+        adapter = t._session.get_adapter("https://api.meganova.ai/v1")
+        assert adapter._pool_maxsize == 16
+
+    def test_context_manager_closes_session(self):
+        with _make_transport() as t:
+            t._session.close = MagicMock()
+        t._session.close.assert_called_once()
+
+    def test_shared_session_is_used_and_left_open(self):
+        shared = MagicMock(spec=requests.Session)
+        a = _make_transport(session=shared)
+        b = _make_transport(session=shared)
+        assert a._session is shared and b._session is shared
+        a.close()
+        shared.close.assert_not_called()
+
+
+class TestSyncTransportUpload:
+    def _send(self, files, data=None):
+        t = _make_transport()
+        mock_resp = MagicMock()
+        mock_resp.status_code = 200
+        mock_resp.content = json.dumps({"text": "hello"}).encode()
+        t._session.request = MagicMock(return_value=mock_resp)
+        t.request("POST", "/audio/transcriptions", files=files, data=data)
+        return t._session.request.call_args.kwargs
+
+    def test_streams_file_as_multipart(self, tmp_path):
+        from urllib3 import encode_multipart_formdata
+
+        path = tmp_path / "a.mp3"
+        path.write_bytes(b"x" * 200_000)
+        with open(path, "rb") as f:
+            kwargs = self._send({"file": ("a.mp3", f, "audio/mpeg")}, {"model": "whisper"})
+            body = kwargs["data"]
+            chunks = list(body)
+
+        boundary = kwargs["headers"]["Content-Type"].split("boundary=")[1]
+        expected, _ = encode_multipart_formdata(
+            [("model", "whisper"), ("file", ("a.mp3", b"x" * 200_000, "audio/mpeg"))],
+            boundary=boundary,
+        )
+        assert kwargs["files"] is None
+        assert b"".join(chunks) == expected
+        assert len(body) == len(expected)
+        assert max(len(c) for c in chunks) <= 64 * 1024
+
+    def test_body_is_replayable_for_retries(self):
+        import io
+
+        kwargs = self._send({"file": ("a.mp3", io.BytesIO(b"audio"), "audio/mpeg")})
+        body = kwargs["data"]
+        assert b"".join(body) == b"".join(body)
+
+    def test_unseekable_file_falls_back_to_files(self):
+        f = MagicMock()
+        f.tell.side_effect = OSError
+        kwargs = self._send({"file": ("a.mp3", f, "audio/mpeg")}, {"model": "whisper"})
+        assert kwargs["files"] == {"file": ("a.mp3", f, "audio/mpeg")}
+        assert kwargs["data"] == {"model": "whisper"}
+
+
+class TestSyncTransportWarmup:
+    def test_heads_base_url_with_auth(self):
+        t = _make_transport()
+        t._session.head = MagicMock()
+        t.warmup().join(1)
+        assert t._session.head.call_args.args == (t.base_url,)
+        assert t._session.head.call_args.kwargs["headers"]["Authorization"] == "Bearer test-key"
+
+    def test_swallows_network_errors(self):
+        t = _make_transport()
+        t._session.head = MagicMock(side_effect=requests.ConnectionError("dns"))
+        thread = t.warmup()
+        thread.join(1)
+        assert not thread.is_alive()
+        t._session.head.assert_called_once()